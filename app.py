@@ -1,5 +1,7 @@
 # Run this app with `python app.py` and
 # visit http://127.0.0.1:8050/ in your web browser.
+import json
+
 import dash
 from flask_caching import Cache
 
@@ -13,151 +15,106 @@ from layout.app_layout import *
 
 app = dash.Dash(__name__,
                 external_stylesheets=[dbc.themes.BOOTSTRAP],
+                # the graphs of a tab are only part of the layout while the tab is selected
+                suppress_callback_exceptions=True,
                 meta_tags=[{'name': 'author',
                             'content': 'Daniel Haake (Dashboard Application, Data Collection, Data Preparation, '
                                        'Data Analysis & Visualization) '
                                        '& Christian Kirifidis (Dashboard Application & Visualization)'}])
 
 app.title = 'COVID-19 Monitor Germany'
-layout = Layout()
-app.layout = layout.layout
-
-server = app.server  # important for using with gunicorn
-
-cache = Cache(app.server, config={
-    'CACHE_TYPE': 'simple'
-})
-
-timeout = 600  # seconds
-
-
-# Reloading graphs to get graphs with new data
-@app.callback(
-    dash.dependencies.Output('tabs-global-overview', 'children'),
-    [dash.dependencies.Input('graph-update', 'n_intervals')])
-@cache.memoize(timeout=timeout)
-def update_tabs_with_graphs(n):
-    return layout.tabs_with_graphs()
-
-
-@app.callback(
-    dash.dependencies.Output('graph-fig-median_ages', 'style'),
-    [dash.dependencies.Input(component_id='radio-items-for-median-and-mean-ages', component_property='value')])
-def build_graph(value):
-    if value == 'median-ages':
-        return {'display': 'block'}
-    else:
-        return {'display': 'none'}
-
-
-@app.callback(
-    dash.dependencies.Output('graph-fig-mean_ages', 'style'),
-    [dash.dependencies.Input(component_id='radio-items-for-median-and-mean-ages', component_property='value')])
-def build_graph(value):
-    if value == 'mean-ages':
-        return {'display': 'block'}
-    else:
-        return {'display': 'none'}
-
-
-@app.callback(
-    dash.dependencies.Output('graph-fig-hospitalizations-per-age-group-bar-plot', 'style'),
-    [dash.dependencies.Input(component_id='radio-items-for-hospitalizations-per-age-group', component_property='value')])
-def build_graph(value):
-    if value == 'hospitalizations-per-age-group-stacked-bar':
-        return {'display': 'block'}
-    else:
-        return {'display': 'none'}
-
-
-@app.callback(
-    dash.dependencies.Output('graph-fig-hospitalizations-per-age-group-line-plot', 'style'),
-    [dash.dependencies.Input(component_id='radio-items-for-hospitalizations-per-age-group', component_property='value')])
-def build_graph(value):
-    if value == 'hospitalizations-per-age-group-line-plot':
-        return {'display': 'block'}
-    else:
-        return {'display': 'none'}
-
-
-@app.callback(
-    dash.dependencies.Output('graph-fig-cases-per-outbreak-bar-plot', 'style'),
-    [dash.dependencies.Input(component_id='radio-items-for-cases-per-outbreak', component_property='value')])
-def build_graph(value):
-    if value == 'cases-per-outbreak-stacked-bar':
-        return {'display': 'block'}
-    else:
-        return {'display': 'none'}
-
-
-@app.callback(
-    dash.dependencies.Output('graph-fig-cases-per-outbreak-in-percent-bar-plot', 'style'),
-    [dash.dependencies.Input(component_id='radio-items-for-cases-per-outbreak', component_property='value')])
-def build_graph(value):
-    if value == 'cases-in-percent-per-outbreak-stacked-bar':
-        return {'display': 'block'}
-    else:
-        return {'display': 'none'}
-
-
-@app.callback(
-    dash.dependencies.Output('graph-fig-cases-per-outbreak-line-plot', 'style'),
-    [dash.dependencies.Input(component_id='radio-items-for-cases-per-outbreak', component_property='value')])
-def build_graph(value):
-    if value == 'cases-per-outbreak-line-plot':
-        return {'display': 'block'}
-    else:
-        return {'display': 'none'}
-
-
-@app.callback(
-    dash.dependencies.Output('graph-fig-cases-per-outbreak-in-percent-line-plot', 'style'),
-    [dash.dependencies.Input(component_id='radio-items-for-cases-per-outbreak', component_property='value')])
-def build_graph(value):
-    if value == 'cases-in-percent-per-outbreak-line-plot':
-        return {'display': 'block'}
-    else:
-        return {'display': 'none'}
 
+# the rendered tabs are shared by all workers and keyed by the version of the data
+cache = Cache(app.server, config=SharedTabCache.config_from_environment())
 
-@app.callback(
-    dash.dependencies.Output('graph-fig-deaths-by-week-and-age-group-bar-plot', 'style'),
-    [dash.dependencies.Input(component_id='radio-items-for-deaths-by-week-of-death-and-age-group', component_property='value')])
-def build_graph(value):
-    if value == 'deaths-by-week-of-death-and-age-group-stacked-bar':
-        return {'display': 'block'}
-    else:
-        return {'display': 'none'}
-
-
-@app.callback(
-    dash.dependencies.Output('graph-fig-deaths-by-week-and-age-group-line-plot', 'style'),
-    [dash.dependencies.Input(component_id='radio-items-for-deaths-by-week-of-death-and-age-group', component_property='value')])
-def build_graph(value):
-    if value == 'deaths-by-week-of-death-and-age-group-line-plot':
-        return {'display': 'block'}
-    else:
-        return {'display': 'none'}
-
+layout = Layout(SharedTabCache(cache))
+app.layout = layout.layout
 
-@app.callback(
-    dash.dependencies.Output('graph-fig-deaths-in-percent-by-week-and-age-group-bar-plot', 'style'),
-    [dash.dependencies.Input(component_id='radio-items-for-deaths-by-week-of-death-and-age-group', component_property='value')])
-def build_graph(value):
-    if value == 'deaths-in-percent-by-week-of-death-and-age-group-stacked-bar':
-        return {'display': 'block'}
-    else:
-        return {'display': 'none'}
+server = app.server  # important for using with gunicorn
 
 
+# Reloading graphs to get graphs with new data and rendering the content of the selected tab. The tabs are only sent
+# again by the interval if the data changed since they were rendered in the browser.
 @app.callback(
-    dash.dependencies.Output('graph-fig-deaths-in-percent-by-week-and-age-group-line-plot', 'style'),
-    [dash.dependencies.Input(component_id='radio-items-for-deaths-by-week-of-death-and-age-group', component_property='value')])
-def build_graph(value):
-    if value == 'deaths-in-percent-by-week-of-death-and-age-group-line-plot':
-        return {'display': 'block'}
+    [dash.dependencies.Output('tabs-global-overview', 'children'),
+     dash.dependencies.Output('tabs-data-version', 'data')],
+    [dash.dependencies.Input('graph-update', 'n_intervals'),
+     dash.dependencies.Input('tabs-global-overview', 'active_tab')],
+    [dash.dependencies.State('tabs-data-version', 'data')])
+def update_tabs_with_graphs(n, active_tab, data_version):
+    triggered = [trigger['prop_id'] for trigger in dash.callback_context.triggered]
+    rendered_data_version = None if 'tabs-global-overview.active_tab' in triggered else data_version
+    tabs, data_version = layout.tabs_with_graphs_and_data_version(active_tab, rendered_data_version)
+    if tabs is None:
+        return dash.no_update, dash.no_update
+    return tabs, data_version
+
+
+# Restoring the full resolution of a downsampled figure within the range zoomed by the user
+def register_zoom_callback(graph_id):
+    @app.callback(
+        dash.dependencies.Output(graph_id, 'figure'),
+        [dash.dependencies.Input(graph_id, 'relayoutData')],
+        prevent_initial_call=True)
+    def update_figure_resolution(relayout_data):
+        figure = layout.zoomed_figure(graph_id, relayout_data)
+        if figure is None:
+            return dash.no_update
+        return figure
+
+
+# The figure of a graph variant is loaded on its first selection, by the same callback as the zoomed figure because
+# a property can only be the output of one callback
+def register_zoom_and_variant_callback(graph_id):
+    @app.callback(
+        dash.dependencies.Output(graph_id, 'figure'),
+        [dash.dependencies.Input(graph_id, 'relayoutData'),
+         dash.dependencies.Input(Layout.variant_figure_request_id(graph_id), 'data')],
+        prevent_initial_call=True)
+    def update_figure(relayout_data, figure_requested):
+        triggered = [trigger['prop_id'] for trigger in dash.callback_context.triggered]
+        if f"{Layout.variant_figure_request_id(graph_id)}.data" in triggered:
+            return layout.variant_figure(graph_id)
+        figure = layout.zoomed_figure(graph_id, relayout_data)
+        if figure is None:
+            return dash.no_update
+        return figure
+
+
+for graph_id in Layout.graph_sections:
+    if graph_id in Layout.hidden_variant_graph_ids:
+        register_zoom_and_variant_callback(graph_id)
     else:
-        return {'display': 'none'}
+        register_zoom_callback(graph_id)
+
+
+# Showing only the graph of the variant selected in a dropdown, switched in the browser without a request. The figure
+# of a variant is requested from the server only on its first selection.
+def register_variant_callback(dropdown_id, variants):
+    app.clientside_callback(
+        f"""
+        function(value) {{
+            var variants = {json.dumps(list(variants))};
+            var requested = Array.prototype.slice.call(arguments, 1);
+            var styles = variants.map(function(variant) {{
+                return {{'display': variant === value ? 'block' : 'none'}};
+            }});
+            var requests = variants.map(function(variant, i) {{
+                return (variant === value) && !requested[i] ? true : window.dash_clientside.no_update;
+            }});
+            return styles.concat(requests);
+        }}
+        """,
+        [dash.dependencies.Output(graph_id, 'style') for graph_id in variants.values()]
+        + [dash.dependencies.Output(Layout.variant_figure_request_id(graph_id), 'data')
+           for graph_id in variants.values()],
+        [dash.dependencies.Input(dropdown_id, 'value')],
+        [dash.dependencies.State(Layout.variant_figure_request_id(graph_id), 'data')
+         for graph_id in variants.values()])
+
+
+for dropdown_id, variants in Layout.variant_groups.items():
+    register_variant_callback(dropdown_id, variants)
 
 
 # Path for health check
@@ -6,6 +6,7 @@ import os
 
 from dotenv import load_dotenv
 from io import BytesIO, StringIO
+from typing import List
 
 import pandas as pd
 import requests
@@ -41,16 +42,20 @@ class AgeDistributionDataFrame(CoronaBaseDataFrame):
         return AgeDistributionSeries
 
     @staticmethod
-    def from_csv(filename: str=None,
-                 s3_bucket: str=None,
-                 folder_path: str=None,
-                 class_name: str=None) -> 'AgeDistributionDataFrame':
+    def from_file(filename: str=None,
+                  s3_bucket: str=None,
+                  folder_path: str=None,
+                  class_name: str=None,
+                  columns: List[str]=None,
+                  file_format: str=None) -> 'AgeDistributionDataFrame':
 
         if filename is None:
             filename = AgeDistributionDataFrame._filename
         if class_name is None:
             class_name = AgeDistributionDataFrame.__name__
-        df = CoronaBaseDataFrame.from_csv(filename, s3_bucket, folder_path, class_name)
+        if columns is not None:
+            columns = ["age group"] + columns
+        df = CoronaBaseDataFrame.from_file(filename, s3_bucket, folder_path, class_name, columns, file_format)
 
         return AgeDistributionDataFrame(df.set_index("age group"))
 
@@ -104,7 +109,7 @@ class AgeDistributionDataFrame(CoronaBaseDataFrame):
         age_distribution = get_age_distribution_for_new_and_total_cases_and_deaths()
         age_distribution = append_relative_values_per_n_inhabitants(age_distribution)
         if to_csv:
-            age_distribution.save_as_csv(s3_bucket=s3_bucket, folder_path=folder_path)
+            age_distribution.save(s3_bucket=s3_bucket, folder_path=folder_path)
         logging.info("FINISHED DOWNLOADING CASES AND DEATHS PER AGE GROUP")
 
         return age_distribution
@@ -1,14 +1,20 @@
 # subclassing of Pandas
 # see: https://pandas.pydata.org/pandas-docs/stable/development/extending.html#override-constructor-properties
-import boto3
 import logging
 import os
 
 from dotenv import load_dotenv
-from io import StringIO
+from typing import List
 
 import pandas as pd
 
+from data_pandas_subclasses.storage.DatasetManifest import DatasetManifest
+from data_pandas_subclasses.storage.FileFormat import CSVFileFormat, FileFormat
+from data_pandas_subclasses.storage.PatchSegments import PatchSegments
+from data_pandas_subclasses.storage.SQLiteStore import SQLiteStore
+from data_pandas_subclasses.storage.StorageBackend import StorageBackend, LocalStorageBackend
+from data_pandas_subclasses.storage.VintageArchive import VintageArchive
+
 load_dotenv()
 logging.basicConfig(level=logging.INFO)
 
@@ -42,10 +48,12 @@ class CoronaBaseDataFrame(pd.DataFrame):
         self._folder_path = folder_path
 
     @staticmethod
-    def from_csv(filename: str,
-                 s3_bucket: str=None,
-                 folder_path: str=None,
-                 class_name: str=None) -> 'CoronaBaseDataFrame':
+    def from_file(filename: str,
+                  s3_bucket: str=None,
+                  folder_path: str=None,
+                  class_name: str=None,
+                  columns: List[str]=None,
+                  file_format: str=None) -> 'CoronaBaseDataFrame':
 
         if (s3_bucket is not None) & (folder_path is not None):
             logging.info("Both arguments for s3_bucket and for path are set. In this case s3_bucket is used.")
@@ -53,89 +61,171 @@ class CoronaBaseDataFrame(pd.DataFrame):
         if class_name is None:
             class_name = CoronaBaseDataFrame.__name__
 
-        if (os.environ.get('S3_BUCKET') is not None) | (s3_bucket is not None):
-            df = CoronaBaseDataFrame.load_csv_from_s3(filename=filename, s3_bucket=s3_bucket, class_name=class_name)
-        else:
-            df = CoronaBaseDataFrame.load_csv_from_path(filename=filename, folder_path=folder_path, class_name=class_name)
+        file_format = FileFormat.from_name(file_format)
+        storage = StorageBackend.from_environment(s3_bucket=s3_bucket, folder_path=folder_path)
+        manifest = DatasetManifest(storage)
+        key = file_format.filename(filename)
+        csv_key = CSVFileFormat().filename(filename)
+        if (key != csv_key) and (manifest.entry(key) is None) and (not storage.exists(key)) \
+                and ((manifest.entry(csv_key) is not None) or storage.exists(csv_key)):
+            # the dataset is stored in the new file format by its next save
+            logging.info(f"{storage.location(key)} does not exist yet, load {class_name} from its csv file")
+            key, file_format = csv_key, CSVFileFormat()
+        key, patch_keys = manifest.resolve_segments(key)
+
+        logging.info(f"start loading {class_name} from {storage.location(key)}")
+        df = CoronaBaseDataFrame(CoronaBaseDataFrame._read_segments(storage, key, patch_keys, file_format, columns))
+        logging.info(f"{class_name} successfully loaded from {storage.location(key)} "
+                     f"with {len(patch_keys)} patch segments")
 
+        if os.environ.get('FOLDER_PATH') is not None:
+            df._set_folder_path(os.environ.get('FOLDER_PATH'))
         if folder_path is not None:
             df._set_path(folder_path)
 
         return df
 
-    @staticmethod
-    def load_csv_from_s3(filename: str, s3_bucket: str, class_name: str=None) -> 'CoronaBaseDataFrame':
-        if s3_bucket is None:
-            s3_bucket = os.environ.get('S3_BUCKET')
-
-        s3 = boto3.client('s3')
-        logging.info(f"...start loading {class_name} with filename {filename} from S3 Bucket {s3_bucket}")
-        read_file = s3.get_object(Bucket=s3_bucket, Key=filename)
-        df = CoronaBaseDataFrame(pd.read_csv(read_file['Body']))
-        logging.info(f"...{class_name} with filename {filename} successfully loaded from S3 Bucket {s3_bucket}")
-
-        return df
+    @classmethod
+    def from_csv(cls,
+                 filename: str=None,
+                 s3_bucket: str=None,
+                 folder_path: str=None,
+                 class_name: str=None,
+                 columns: List[str]=None) -> 'CoronaBaseDataFrame':
+        return cls.from_file(filename, s3_bucket, folder_path, class_name, columns, file_format=CSVFileFormat.name)
 
     @staticmethod
-    def load_csv_from_path(filename: str, folder_path: str, class_name: str=None) -> 'CoronaBaseDataFrame':
-        if folder_path is None:
-            if os.environ.get('FOLDER_PATH') is not None:
-                folder_path = os.environ.get('FOLDER_PATH')
-            else:
-                folder_path = CoronaBaseDataFrame._folder_path
-        path = folder_path + filename
-
-        logging.info(f"start loading {class_name} from {path}")
-        df = CoronaBaseDataFrame(pd.read_csv(path))
-        logging.info(f"{class_name} successfully loaded from {path}")
-
-        if os.environ.get('FOLDER_PATH') is not None:
-            df._set_folder_path(os.environ.get('FOLDER_PATH'))
-
+    def _read_segments(storage: StorageBackend,
+                       key: str,
+                       patch_keys: List[str],
+                       file_format: FileFormat,
+                       columns: List[str]=None) -> pd.DataFrame:
+        df = file_format.deserialize(storage.read(key), columns)
+        if len(patch_keys) > 0:
+            df = PatchSegments.merge(df, [file_format.deserialize(storage.read(patch_key), columns)
+                                          for patch_key in patch_keys])
         return df
 
-    def save_as_csv(self, filename: str=None, s3_bucket: str=None, folder_path: str=None):
+    def save(self, filename: str=None, s3_bucket: str=None, folder_path: str=None, file_format: str=None):
         if (s3_bucket is not None) & (folder_path is not None):
-            logging.info("Both arguments for s3_bucket and for path in method save_as_csv() are set. "
+            logging.info("Both arguments for s3_bucket and for path in method save() are set. "
                          "In this case s3_bucket is used.")
 
-        if (os.environ.get('S3_BUCKET') is not None) | (s3_bucket is not None):
-            self._save_as_csv_to_s3(filename, s3_bucket)
+        if filename is None:
+            filename = self._filename
+
+        if (folder_path is None) & (os.environ.get('FOLDER_PATH') is None):
+            folder_path = self._folder_path
+
+        file_format = FileFormat.from_name(file_format)
+        storage = StorageBackend.from_environment(s3_bucket=s3_bucket, folder_path=folder_path)
+        key = file_format.filename(filename)
 
+        if isinstance(storage, LocalStorageBackend):
+            self._set_folder_path(storage.folder_path)
+            self._set_path(storage.location(key))
+
+        manifest = DatasetManifest(storage)
+        published_entry = manifest.entry(key)
+        changed_rows = None
+        if PatchSegments.is_enabled() & (published_entry is not None):
+            published_df = self._read_segments(storage, *manifest.resolve_segments(key), file_format)
+            changed_rows = PatchSegments.changed_rows(published_df, self.reset_index(), published_entry)
+
+        if changed_rows is None:
+            logging.info(f"try writing {self.__class__.__name__} to {storage.location(key)}")
+            entry = manifest.stage(key, file_format.serialize(self), len(self), len(self.columns))
+            logging.info(f"{self.__class__.__name__} has been written to {storage.location(entry['key'])}")
         else:
-            self._save_as_csv_to_path(filename, folder_path)
+            logging.info(f"try writing {len(changed_rows)} new or changed rows of {self.__class__.__name__} as patch "
+                         f"segment to {storage.location(key)}")
+            changed_rows = changed_rows.set_index(changed_rows.columns[0])
+            entry = manifest.stage_patch(key, file_format.serialize(changed_rows), len(self), len(changed_rows))
+            logging.info(f"{self.__class__.__name__} has {len(entry.get('patches', []))} patch segments "
+                         f"in {storage.location(entry['key'])}")
+
+        if SQLiteStore.is_enabled():
+            self.save_to_sqlite(filename)
+        if VintageArchive.is_enabled():
+            self.archive_vintage(filename, s3_bucket=s3_bucket, folder_path=folder_path)
+
+    def save_as_csv(self, filename: str=None, s3_bucket: str=None, folder_path: str=None):
+        self.save(filename=filename, s3_bucket=s3_bucket, folder_path=folder_path, file_format="csv")
 
-    def _save_as_csv_to_s3(self, filename: str=None, s3_bucket: str=None):
+    def save_to_sqlite(self, filename: str=None, path: str=None):
         if filename is None:
             filename = self._filename
 
-        if s3_bucket is None:
-            s3_bucket = os.environ.get('S3_BUCKET')
+        store = SQLiteStore(path)
+        table = SQLiteStore.table_name(filename)
+
+        logging.info(f"try upserting {self.__class__.__name__} into table {table} of SQLite store {store.path}")
+        number_of_rows = store.upsert(table, self)
+        logging.info(f"{number_of_rows} new or changed rows of {self.__class__.__name__} have been written to "
+                     f"SQLite store {store.path}")
+
+    @classmethod
+    def from_sqlite(cls,
+                    start=None,
+                    end=None,
+                    columns: List[str]=None,
+                    filename: str=None,
+                    path: str=None) -> 'CoronaBaseDataFrame':
+        """Loads the rows between start and end (both inclusive) from the SQLite store, see save_to_sqlite()."""
+        if filename is None:
+            filename = cls._filename
+
+        store = SQLiteStore(path)
+        table = SQLiteStore.table_name(filename)
 
-        csv_buffer = StringIO()
-        self.to_csv(csv_buffer)  # pandas to_save()-method
-        s3 = boto3.client('s3')
+        logging.info(f"start loading {cls.__name__} from table {table} of SQLite store {store.path}")
+        df = store.read(table, start=start, end=end, columns=columns)
+        logging.info(f"{cls.__name__} successfully loaded from SQLite store {store.path}")
 
-        logging.info(f"try writing {self.__class__.__name__} with filename {self._filename} "
-                     f"to S3 Bucket {s3_bucket}")
-        s3.put_object(Bucket=s3_bucket, Key=filename, Body=csv_buffer.getvalue())
-        logging.info(f"{self.__class__.__name__} with filename {self._filename} has been "
-                     f"written to S3 Bucket {s3_bucket}")
+        return cls(df.set_index(df.columns[0]))
 
-    def _save_as_csv_to_path(self, filename: str=None, folder_path: str=None):
+    def archive_vintage(self, filename: str=None, s3_bucket: str=None, folder_path: str=None):
         if filename is None:
             filename = self._filename
 
-        if folder_path is None:
-            if os.environ.get('FOLDER_PATH') is not None:
-                folder_path = os.environ.get('FOLDER_PATH')
-            else:
-                folder_path = self._folder_path
+        archive = VintageArchive(StorageBackend.from_environment(s3_bucket=s3_bucket, folder_path=folder_path))
+        table = VintageArchive.table_name(filename)
+
+        logging.info(f"try archiving vintage of {self.__class__.__name__} in {archive.storage.location(archive.folder)}")
+        vintage = archive.append(table, self)
+        if vintage is None:
+            logging.info(f"{self.__class__.__name__} has not changed since the last archived vintage")
+        else:
+            logging.info(f"{vintage['type']} with {vintage['changed rows']} rows of {self.__class__.__name__} "
+                         f"has been archived as vintage of {vintage['created']}")
+
+    @classmethod
+    def as_of(cls,
+              date,
+              columns: List[str]=None,
+              filename: str=None,
+              s3_bucket: str=None,
+              folder_path: str=None) -> 'CoronaBaseDataFrame':
+        """Loads the dataset as it was published at the given date from the vintage archive, see archive_vintage()."""
+        if filename is None:
+            filename = cls._filename
+
+        archive = VintageArchive(StorageBackend.from_environment(s3_bucket=s3_bucket, folder_path=folder_path))
+        table = VintageArchive.table_name(filename)
+
+        logging.info(f"start loading {cls.__name__} as of {date} from {archive.storage.location(archive.folder)}")
+        df = archive.read(table, date)
+        if columns is not None:
+            df = df.loc[:, [column for column in df.columns if (column == df.columns[0]) | (column in columns)]]
+        logging.info(f"{cls.__name__} as of {date} successfully loaded")
+
+        return cls._from_flat_frame(df)
 
-        path = folder_path + filename
-        self._set_folder_path(folder_path)
-        self._set_path(path)
+    @classmethod
+    def from_bytes(cls, data: bytes, file_format: str=None, columns: List[str]=None) -> 'CoronaBaseDataFrame':
+        """Creates the dataframe from the content of a file, given columns have to contain the index column."""
+        return cls._from_flat_frame(FileFormat.from_name(file_format).deserialize(data, columns))
 
-        logging.info(f"try writing {self.__class__.__name__} to {path}")
-        self.to_csv(path)  # pandas to_csv()-method
-        logging.info(f"{self.__class__.__name__} has been written to {path}")
+    @classmethod
+    def _from_flat_frame(cls, df: pd.DataFrame) -> 'CoronaBaseDataFrame':
+        return cls(df.set_index(df.columns[0]))
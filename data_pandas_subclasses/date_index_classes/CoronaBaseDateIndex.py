@@ -31,17 +31,26 @@ class CoronaBaseDateIndexDataFrame(CoronaBaseDataFrame):
         return CoronaBaseDateIndexSeries
 
     @staticmethod
-    def from_csv(filename: str,
-                 s3_bucket: str = None,
-                 folder_path: str = None,
-                 class_name: str = None) -> 'CoronaBaseDateIndexDataFrame':
+    def from_file(filename: str,
+                  s3_bucket: str = None,
+                  folder_path: str = None,
+                  class_name: str = None,
+                  columns: List[str] = None,
+                  file_format: str = None) -> 'CoronaBaseDateIndexDataFrame':
         if class_name is None:
             class_name = 'CoronaBaseDateIndexDataFrame'
-        df = CoronaBaseDataFrame.from_csv(filename, s3_bucket, folder_path, class_name)
+        if columns is not None:
+            columns = ["date"] + columns
+        df = CoronaBaseDataFrame.from_file(filename, s3_bucket, folder_path, class_name, columns, file_format)
         df = CoronaBaseDateIndexDataFrame.set_date_columns_to_type_datetime(df)
 
         return CoronaBaseDateIndexDataFrame(df.set_index("date"))
 
+    @classmethod
+    def _from_flat_frame(cls, df: pd.DataFrame) -> 'CoronaBaseDateIndexDataFrame':
+        df = CoronaBaseDateIndexDataFrame.set_date_columns_to_type_datetime(df)
+        return cls(df.set_index("date"))
+
     @staticmethod
     def set_date_columns_to_type_datetime(df):
         for column in ["date", "RKI reporting date"]:
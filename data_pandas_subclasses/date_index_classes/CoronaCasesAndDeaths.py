@@ -42,24 +42,26 @@ class CoronaCasesAndDeathsDataFrame(CoronaBaseDateIndexDataFrame):
         return CoronaCasesAndDeathsSeries
 
     @staticmethod
-    def from_csv(filename: str = None,
-                 s3_bucket: str = None,
-                 folder_path: str = None,
-                 class_name: str = None) -> 'CoronaCasesAndDeathsDataFrame':
+    def from_file(filename: str = None,
+                  s3_bucket: str = None,
+                  folder_path: str = None,
+                  class_name: str = None,
+                  columns: List[str] = None,
+                  file_format: str = None) -> 'CoronaCasesAndDeathsDataFrame':
 
         if filename is None:
             filename = CoronaCasesAndDeathsDataFrame._filename
         if class_name is None:
             class_name = CoronaCasesAndDeathsDataFrame.__name__
-        df = CoronaBaseDateIndexDataFrame.from_csv(filename, s3_bucket, folder_path, class_name)
+        df = CoronaBaseDateIndexDataFrame.from_file(filename, s3_bucket, folder_path, class_name, columns, file_format)
 
         return CoronaCasesAndDeathsDataFrame(df)
 
     @staticmethod
     def update_csv_with_data_from_rki_api(s3_bucket: str = None, folder_path: str = None) -> None:
         logging.info("START UPDATE PROCESS FOR CORONA CASES AND DEATHS")
-        corona_cases_and_deaths = CoronaCasesAndDeathsDataFrame.from_csv(folder_path=folder_path)
-        logging.info("initial loading of CSV finished")
+        corona_cases_and_deaths = CoronaCasesAndDeathsDataFrame.from_file(folder_path=folder_path)
+        logging.info("initial loading of file finished")
         corona_cases_and_deaths.update_with_new_data_from_rki_api(to_csv=True,
                                                                   s3_bucket=s3_bucket,
                                                                   folder_path=folder_path)
@@ -160,7 +162,7 @@ class CoronaCasesAndDeathsDataFrame(CoronaBaseDateIndexDataFrame):
         self._upsert_statistics()
 
         if to_csv:
-            self.save_as_csv(s3_bucket=s3_bucket, folder_path=folder_path)
+            self.save(s3_bucket=s3_bucket, folder_path=folder_path)
 
     def upsert_statistics(self) -> 'CoronaCasesAndDeathsDataFrame':
         self_copy = self.copy(deep=True)
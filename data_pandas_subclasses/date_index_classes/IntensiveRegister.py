@@ -3,7 +3,7 @@
 import logging
 from dotenv import load_dotenv
 
-from typing import TypeVar
+from typing import TypeVar, List
 
 import pandas as pd
 import numpy as np
@@ -41,16 +41,18 @@ class IntensiveRegisterDataFrame(CoronaBaseDateIndexDataFrame):
         return IntensiveRegisterSeries
 
     @staticmethod
-    def from_csv(filename: str = None,
-                 s3_bucket: str = None,
-                 folder_path: str = None,
-                 class_name: str = None) -> 'IntensiveRegisterDataFrame':
+    def from_file(filename: str = None,
+                  s3_bucket: str = None,
+                  folder_path: str = None,
+                  class_name: str = None,
+                  columns: List[str] = None,
+                  file_format: str = None) -> 'IntensiveRegisterDataFrame':
 
         if filename is None:
             filename = IntensiveRegisterDataFrame._filename
         if class_name is None:
             class_name = IntensiveRegisterDataFrame.__name__
-        df = CoronaBaseDateIndexDataFrame.from_csv(filename, s3_bucket, folder_path, class_name)
+        df = CoronaBaseDateIndexDataFrame.from_file(filename, s3_bucket, folder_path, class_name, columns, file_format)
 
         return IntensiveRegisterDataFrame(df)
 
@@ -80,8 +82,8 @@ class IntensiveRegisterDataFrame(CoronaBaseDateIndexDataFrame):
 
         logging.info("START UPDATE PROCESS FOR INTENSIVE REGISTER")
 
-        intensive_register = IntensiveRegisterDataFrame.from_csv(folder_path)
-        logging.info("initial loading of CSV finished")
+        intensive_register = IntensiveRegisterDataFrame.from_file(folder_path=folder_path)
+        logging.info("initial loading of file finished")
 
         intensive_register._update_intensive_register_data(s3_bucket=s3_bucket,
                                                            folder_path=folder_path,
@@ -120,7 +122,7 @@ class IntensiveRegisterDataFrame(CoronaBaseDateIndexDataFrame):
         self = self.dropna(how="all", axis=0)
 
         if to_csv:
-            self.save_as_csv(s3_bucket=s3_bucket, folder_path=folder_path)
+            self.save(s3_bucket=s3_bucket, folder_path=folder_path)
 
     def _delete_outliers(self) -> None:
         """The 'DIVI Intensivregister' reports outliers because of bigger corrections of some hospitals or
@@ -4,7 +4,7 @@ import logging
 
 from dotenv import load_dotenv
 
-from typing import TypeVar
+from typing import TypeVar, List
 
 import pandas as pd
 
@@ -40,16 +40,18 @@ class NowcastRKIDataFrame(CoronaBaseDateIndexDataFrame):
         return NowcastRKISeries
 
     @staticmethod
-    def from_csv(filename: str=None,
-                 s3_bucket: str=None,
-                 folder_path: str=None,
-                 class_name: str=None) -> 'NowcastRKIDataFrame':
+    def from_file(filename: str=None,
+                  s3_bucket: str=None,
+                  folder_path: str=None,
+                  class_name: str=None,
+                  columns: List[str]=None,
+                  file_format: str=None) -> 'NowcastRKIDataFrame':
 
         if filename is None:
             filename = NowcastRKIDataFrame._filename
         if class_name is None:
             class_name = NowcastRKIDataFrame.__name__
-        df = CoronaBaseDateIndexDataFrame.from_csv(filename, s3_bucket, folder_path, class_name)
+        df = CoronaBaseDateIndexDataFrame.from_file(filename, s3_bucket, folder_path, class_name, columns, file_format)
 
         return NowcastRKIDataFrame(df)
 
@@ -75,7 +77,7 @@ class NowcastRKIDataFrame(CoronaBaseDateIndexDataFrame):
         nowcast_rki = nowcast_rki.merge(nowcast_rki_shifted_r_values, how='outer', left_index=True, right_index=True)
 
         if to_csv:
-            nowcast_rki.save_as_csv(s3_bucket=s3_bucket, folder_path=folder_path)
+            nowcast_rki.save(s3_bucket=s3_bucket, folder_path=folder_path)
 
         logging.info("FINISHED UPDATE PROCESS FOR NOWCAST RKI")
         return nowcast_rki
@@ -0,0 +1,46 @@
+import gzip
+import os
+
+from typing import BinaryIO
+
+
+class ContentEncoding:
+    """Compression of the objects stored in S3, stored as ContentEncoding of every object."""
+
+    identity = "identity"
+    gzip = "gzip"
+    zstd = "zstd"
+
+    # these formats are compressed already
+    compressed_extensions = (".parquet", ".feather", ".gz", ".zip")
+
+    @staticmethod
+    def for_key(key: str) -> str:
+        if key.endswith(ContentEncoding.compressed_extensions):
+            return ContentEncoding.identity
+        return os.environ.get('S3_CONTENT_ENCODING', ContentEncoding.gzip).lower()
+
+    @staticmethod
+    def encode(data: bytes, encoding: str) -> bytes:
+        if encoding == ContentEncoding.gzip:
+            return gzip.compress(data, compresslevel=6)
+        if encoding == ContentEncoding.zstd:
+            import zstandard
+
+            return zstandard.ZstdCompressor().compress(data)
+        if encoding == ContentEncoding.identity:
+            return data
+        raise ValueError(f"unknown content encoding {encoding}, choose one of "
+                         f"{[ContentEncoding.gzip, ContentEncoding.zstd, ContentEncoding.identity]}")
+
+    @staticmethod
+    def decode_stream(stream: BinaryIO, encoding: str = None) -> bytes:
+        if encoding == ContentEncoding.gzip:
+            with gzip.GzipFile(fileobj=stream) as file:
+                return file.read()
+        if encoding == ContentEncoding.zstd:
+            import zstandard
+
+            with zstandard.ZstdDecompressor().stream_reader(stream) as reader:
+                return reader.read()
+        return stream.read()
@@ -0,0 +1,52 @@
+import json
+import logging
+import zipfile
+
+from io import BytesIO
+from typing import Dict, List, Tuple
+
+from data_pandas_subclasses.storage.DatasetManifest import DatasetManifest
+from data_pandas_subclasses.storage.FileFormat import FileFormat
+from data_pandas_subclasses.storage.StorageBackend import StorageBackend
+
+logging.basicConfig(level=logging.INFO)
+
+
+class DatasetBundle:
+    """Single compressed object with the datasets of the dashboard, their manifest and precomputed values."""
+
+    filename = "dashboard_bundle.zip"
+    values_filename = "values.json"
+
+    def __init__(self, storage: StorageBackend):
+        self.storage = storage
+
+    def exists(self) -> bool:
+        return self.storage.exists(self.filename)
+
+    def write(self, filenames: List[str], values: dict, file_format: str = None) -> None:
+        """Bundles the stored content of the published datasets unchanged."""
+        file_format = FileFormat.from_name(file_format)
+        manifest = DatasetManifest(self.storage)
+        buffer = BytesIO()
+        with zipfile.ZipFile(buffer, 'w', compression=zipfile.ZIP_DEFLATED) as bundle:
+            for filename in filenames:
+                key = file_format.filename(filename)
+                bundle.writestr(key, manifest.published_content(key))
+            bundle.writestr(DatasetManifest.filename, json.dumps(manifest.load(), indent=2))
+            bundle.writestr(self.values_filename, json.dumps(values, indent=2, default=float))
+
+        logging.info(f"try writing bundle with {len(filenames)} datasets to {self.storage.location(self.filename)}")
+        self.storage.write(self.filename, buffer.getvalue())
+        logging.info(f"bundle has been written to {self.storage.location(self.filename)}")
+
+    def read(self) -> Tuple[Dict[str, bytes], dict, dict]:
+        """Returns the content of the datasets by filename, the manifest and the additional values."""
+        logging.info(f"start loading bundle from {self.storage.location(self.filename)}")
+        with zipfile.ZipFile(BytesIO(self.storage.read(self.filename))) as bundle:
+            files = {name: bundle.read(name) for name in bundle.namelist()}
+        logging.info(f"bundle successfully loaded from {self.storage.location(self.filename)}")
+
+        manifest = json.loads(files.pop(DatasetManifest.filename))
+        values = json.loads(files.pop(self.values_filename))
+        return files, manifest, values
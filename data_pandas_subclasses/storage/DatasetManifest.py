@@ -0,0 +1,213 @@
+import hashlib
+import json
+import logging
+import os
+
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+from data_pandas_subclasses.storage.FileFormat import FileFormat
+from data_pandas_subclasses.storage.PatchSegments import PatchSegments
+from data_pandas_subclasses.storage.StorageBackend import StorageBackend
+
+logging.basicConfig(level=logging.INFO)
+
+
+class DatasetManifest:
+    """Versions of the datasets at content addressed keys, published together by replacing the manifest."""
+
+    filename = "manifest.json"
+    previous_filename = "manifest.previous.json"
+    object_folder = "datasets/"
+
+    _staged_entries = None
+    _pending_writes = None
+    _executor = None
+
+    def __init__(self, storage: StorageBackend):
+        self.storage = storage
+
+    def load(self) -> dict:
+        if not self.storage.exists(self.filename):
+            return {"version": None, "published": None, "datasets": {}}
+        return json.loads(self.storage.read(self.filename))
+
+    def version(self) -> str:
+        return self.load()["version"]
+
+    def dataset_versions(self) -> Dict[str, str]:
+        """Returns the content hash of every published dataset by its key."""
+        return {key: self._content_id(entry) for key, entry in self.load()["datasets"].items()}
+
+    def entry(self, key: str) -> dict:
+        """Returns the entry of the dataset which is staged or published, or None if it was never published."""
+        staged_entries = self._staged_entries_of_storage()
+        if key in staged_entries:
+            return staged_entries[key]
+        return self.load()["datasets"].get(key)
+
+    def resolve(self, key: str) -> str:
+        """Returns the key of the published version of the dataset, or the key itself if it was never published."""
+        return self.resolve_segments(key)[0]
+
+    def resolve_segments(self, key: str) -> Tuple[str, List[str]]:
+        """Returns the key of the base file and the keys of the patch segments of the published dataset."""
+        entry = self.entry(key)
+        if entry is None:
+            return key, []
+        segment_keys = [entry["key"]] + [patch["key"] for patch in entry.get("patches", [])]
+        self._wait_for_pending_writes(segment_keys)
+        return segment_keys[0], segment_keys[1:]
+
+    def published_content(self, key: str) -> bytes:
+        """Returns the content of the published dataset with its patch segments merged."""
+        return self._merged_content(key, *self.resolve_segments(key))
+
+    def _merged_content(self, key: str, base_key: str, patch_keys: List[str]) -> bytes:
+        if len(patch_keys) == 0:
+            return self.storage.read(base_key)
+
+        file_format = FileFormat.from_filename(key)
+        df = PatchSegments.merge(file_format.deserialize(self.storage.read(base_key)),
+                                 [file_format.deserialize(self.storage.read(patch_key)) for patch_key in patch_keys])
+        return file_format.serialize(df.set_index(df.columns[0]))
+
+    def stage(self, key: str, data: bytes, rows: int, columns: int) -> dict:
+        """Writes the dataset and publishes it, or stages it until the end of an active publication()."""
+        entry = self._write_object(key, data)
+        entry.update({"rows": rows,
+                      "columns": columns,
+                      "updated": datetime.now().isoformat(timespec="seconds")})
+        self._stage_entry(key, entry)
+        return entry
+
+    def stage_patch(self, key: str, data: bytes, rows: int, changed_rows: int) -> dict:
+        """Adds a patch segment with the new and changed rows to the published version of the dataset."""
+        entry = dict(self.entry(key))
+        if changed_rows == 0:
+            return entry
+
+        patch = self._write_object(key, data)
+        patch["rows"] = changed_rows
+        entry.update({"rows": rows,
+                      "patches": entry.get("patches", []) + [patch],
+                      "updated": datetime.now().isoformat(timespec="seconds")})
+        self._stage_entry(key, entry)
+        return entry
+
+    def _write_object(self, key: str, data: bytes) -> dict:
+        content_hash = hashlib.sha256(data).hexdigest()
+        stem, extension = os.path.splitext(key)
+        written_object = {"key": f"{self.object_folder}{stem}/{content_hash}{extension}",
+                          "sha256": content_hash,
+                          "bytes": len(data)}
+        if DatasetManifest._executor is None:
+            self._write_if_missing(written_object["key"], data)
+        else:
+            DatasetManifest._pending_writes[(self.storage.location(""), written_object["key"])] = \
+                DatasetManifest._executor.submit(self._write_if_missing, written_object["key"], data)
+        return written_object
+
+    def _write_if_missing(self, key: str, data: bytes) -> None:
+        if not self.storage.exists(key):
+            self.storage.write(key, data)
+
+    def _wait_for_pending_writes(self, keys: List[str]) -> None:
+        if DatasetManifest._pending_writes is None:
+            return
+        for key in keys:
+            pending_write = DatasetManifest._pending_writes.get((self.storage.location(""), key))
+            if pending_write is not None:
+                pending_write.result()
+
+    def _stage_entry(self, key: str, entry: dict) -> None:
+        if DatasetManifest._staged_entries is None:
+            self.publish({key: entry})
+        else:
+            self._staged_entries_of_storage()[key] = entry
+
+    def publish(self, entries: Dict[str, dict]) -> dict:
+        manifest = self.load()
+        if all(self._content_id(manifest["datasets"].get(key, {})) == self._content_id(entry)
+               for key, entry in entries.items()):
+            logging.info(f"no dataset has changed, version {manifest['version']} stays published")
+            return manifest
+
+        changed_entries = {key: entry for key, entry in entries.items()
+                           if self._content_id(manifest["datasets"].get(key, {})) != self._content_id(entry)}
+        if manifest["version"] is not None:
+            self.storage.write(self.previous_filename, json.dumps(manifest, indent=2).encode('utf-8'))
+
+        manifest["datasets"].update(entries)
+        manifest["published"] = datetime.now().isoformat(timespec="seconds")
+        manifest["version"] = hashlib.sha256(
+            json.dumps({key: self._content_id(entry) for key, entry in manifest["datasets"].items()},
+                       sort_keys=True).encode('utf-8')
+        ).hexdigest()[:16]
+
+        self.storage.write(self.filename, json.dumps(manifest, indent=2).encode('utf-8'))
+        logging.info(f"published version {manifest['version']} with {len(entries)} updated datasets to "
+                     f"{self.storage.location(self.filename)}")
+
+        for key, entry in changed_entries.items():
+            self.storage.write(key, self._merged_content(key,
+                                                         entry["key"],
+                                                         [patch["key"] for patch in entry.get("patches", [])]))
+        logging.info(f"{len(changed_entries)} changed datasets have been written to their plain filenames in "
+                     f"{self.storage.location('')}")
+        return manifest
+
+    def collect_garbage(self) -> int:
+        """Deletes all dataset versions which are neither referenced by the current nor by the previous manifest."""
+        manifests = [self.load()]
+        if self.storage.exists(self.previous_filename):
+            manifests.append(json.loads(self.storage.read(self.previous_filename)))
+        referenced_keys = {key
+                           for manifest in manifests
+                           for entry in manifest["datasets"].values()
+                           for key in [entry["key"]] + [patch["key"] for patch in entry.get("patches", [])]}
+
+        unreferenced_keys = [key for key in self.storage.list_keys(self.object_folder) if key not in referenced_keys]
+        for key in unreferenced_keys:
+            self.storage.delete(key)
+        logging.info(f"deleted {len(unreferenced_keys)} unreferenced dataset versions from "
+                     f"{self.storage.location(self.object_folder)}")
+        return len(unreferenced_keys)
+
+    @staticmethod
+    @contextmanager
+    def publication(collect_garbage: bool = True):
+        """Publishes all datasets saved within the context together at its end, or none if it fails."""
+        DatasetManifest._staged_entries = {}
+        DatasetManifest._pending_writes = {}
+        DatasetManifest._executor = ThreadPoolExecutor(max_workers=int(os.environ.get('TRANSFER_WORKERS', 8)))
+        try:
+            yield
+            for pending_write in DatasetManifest._pending_writes.values():
+                pending_write.result()
+            staged_entries = DatasetManifest._staged_entries
+        finally:
+            DatasetManifest._executor.shutdown(wait=True)
+            DatasetManifest._staged_entries = None
+            DatasetManifest._pending_writes = None
+            DatasetManifest._executor = None
+
+        for storage, entries in staged_entries.values():
+            manifest = DatasetManifest(storage)
+            manifest.publish(entries)
+            if collect_garbage:
+                manifest.collect_garbage()
+
+    @staticmethod
+    def _content_id(entry: dict) -> str:
+        return "".join([entry.get("sha256", "")] + [patch["sha256"] for patch in entry.get("patches", [])])
+
+    def _staged_entries_of_storage(self) -> Dict[str, dict]:
+        if DatasetManifest._staged_entries is None:
+            return {}
+        location = self.storage.location("")
+        if location not in DatasetManifest._staged_entries:
+            DatasetManifest._staged_entries[location] = (self.storage, {})
+        return DatasetManifest._staged_entries[location][1]
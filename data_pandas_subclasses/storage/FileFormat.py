@@ -0,0 +1,98 @@
+import os
+
+from abc import ABC, abstractmethod
+from io import BytesIO
+from typing import List
+
+import pandas as pd
+
+
+class FileFormat(ABC):
+    """Serialization of a dataset with the index as ordinary column."""
+
+    name = None
+    extension = None
+
+    def filename(self, filename: str) -> str:
+        return os.path.splitext(filename)[0] + self.extension
+
+    @abstractmethod
+    def serialize(self, df: pd.DataFrame) -> bytes:
+        pass
+
+    @abstractmethod
+    def deserialize(self, data: bytes, columns: List[str] = None) -> pd.DataFrame:
+        pass
+
+    @staticmethod
+    def from_name(name: str = None) -> 'FileFormat':
+        if name is None:
+            name = os.environ.get('FILE_FORMAT', CSVFileFormat.name)
+
+        file_formats = {file_format.name: file_format for file_format in [CSVFileFormat,
+                                                                          ParquetFileFormat,
+                                                                          FeatherFileFormat]}
+        if name not in file_formats:
+            raise ValueError(f"unknown file format {name}, choose one of {list(file_formats)}")
+        return file_formats[name]()
+
+    @staticmethod
+    def from_filename(filename: str) -> 'FileFormat':
+        extension = os.path.splitext(filename)[1]
+        file_formats = {file_format.extension: file_format for file_format in [CSVFileFormat,
+                                                                               ParquetFileFormat,
+                                                                               FeatherFileFormat]}
+        if extension not in file_formats:
+            raise ValueError(f"unknown file format of {filename}, choose one of {list(file_formats)}")
+        return file_formats[extension]()
+
+
+class CSVFileFormat(FileFormat):
+
+    name = "csv"
+    extension = ".csv"
+
+    def serialize(self, df: pd.DataFrame) -> bytes:
+        return df.to_csv().encode('utf-8')
+
+    def deserialize(self, data: bytes, columns: List[str] = None) -> pd.DataFrame:
+        if columns is None:
+            return pd.read_csv(BytesIO(data))
+        return pd.read_csv(BytesIO(data), usecols=lambda column: column in columns)
+
+
+class ParquetFileFormat(FileFormat):
+
+    name = "parquet"
+    extension = ".parquet"
+
+    def serialize(self, df: pd.DataFrame) -> bytes:
+        return df.reset_index().to_parquet(index=False)
+
+    def deserialize(self, data: bytes, columns: List[str] = None) -> pd.DataFrame:
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(BytesIO(data))
+        if columns is not None:
+            columns = [column for column in parquet_file.schema_arrow.names if column in columns]
+        return parquet_file.read(columns=columns).to_pandas()
+
+
+class FeatherFileFormat(FileFormat):
+
+    name = "feather"
+    extension = ".feather"
+
+    def serialize(self, df: pd.DataFrame) -> bytes:
+        buffer = BytesIO()
+        df.reset_index().to_feather(buffer)
+        return buffer.getvalue()
+
+    def deserialize(self, data: bytes, columns: List[str] = None) -> pd.DataFrame:
+        import pyarrow.ipc as ipc
+
+        reader = ipc.open_file(BytesIO(data))
+        table = reader.read_all()
+        if columns is not None:
+            table = table.select([column for column in table.column_names if column in columns])
+        return table.to_pandas()
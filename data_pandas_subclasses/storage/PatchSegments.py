@@ -0,0 +1,44 @@
+import os
+
+from typing import List
+
+import pandas as pd
+
+from data_pandas_subclasses.storage.RowDelta import RowDelta
+
+
+class PatchSegments:
+    """Persistence mode which writes only the new and changed rows of an update as patch segment."""
+
+    default_compaction_interval = 20
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return os.environ.get('PERSISTENCE_MODE', 'full').lower() == 'patch'
+
+    @staticmethod
+    def compaction_interval() -> int:
+        return int(os.environ.get('PATCH_COMPACTION_INTERVAL', PatchSegments.default_compaction_interval))
+
+    @staticmethod
+    def changed_rows(previous: pd.DataFrame, current: pd.DataFrame, entry: dict) -> pd.DataFrame:
+        """Returns the rows to write as patch segment, or None if the dataset has to be compacted."""
+        patches = entry.get("patches", [])
+        if (len(patches) >= PatchSegments.compaction_interval()) | \
+                (sum(patch["bytes"] for patch in patches) > entry["bytes"]):
+            return None
+        if (list(previous.columns) != list(current.columns)) | (len(current) < len(previous)):
+            return None
+
+        previous = RowDelta.string_frame(previous)
+        current_strings = RowDelta.string_frame(current)
+        if list(current_strings.iloc[:len(previous), 0]) != list(previous.iloc[:, 0]):
+            return None
+
+        return current.loc[RowDelta.is_changed(previous, current_strings), :]
+
+    @staticmethod
+    def merge(base: pd.DataFrame, patches: List[pd.DataFrame]) -> pd.DataFrame:
+        for patch in patches:
+            base = RowDelta.apply(base, patch)
+        return base
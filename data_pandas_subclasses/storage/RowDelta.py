@@ -0,0 +1,51 @@
+from io import BytesIO
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+
+class RowDelta:
+    """Row level difference of two flat versions of a dataset, matched by their first column."""
+
+    @staticmethod
+    def string_frame(flat_df: pd.DataFrame) -> pd.DataFrame:
+        """Returns the values as they are written to a CSV file."""
+        return pd.read_csv(BytesIO(flat_df.to_csv(index=False).encode('utf-8')), dtype=str, keep_default_na=False)
+
+    @staticmethod
+    def row_hashes(flat_df: pd.DataFrame) -> List[int]:
+        return list(pd.util.hash_pandas_object(flat_df, index=False))
+
+    @staticmethod
+    def is_changed(previous: pd.DataFrame, current: pd.DataFrame) -> List[bool]:
+        """Flags the rows of current which are new or differ from the row with the same key in previous."""
+        if list(previous.columns) != list(current.columns):
+            return [True] * len(current)
+
+        previous_rows = set(zip(previous.iloc[:, 0], RowDelta.row_hashes(previous)))
+        return [row not in previous_rows for row in zip(current.iloc[:, 0], RowDelta.row_hashes(current))]
+
+    @staticmethod
+    def changed_rows(previous: pd.DataFrame, current: pd.DataFrame) -> pd.DataFrame:
+        return current.loc[RowDelta.is_changed(previous, current), :]
+
+    @staticmethod
+    def removed_keys(previous: pd.DataFrame, current: pd.DataFrame) -> List:
+        return list(previous.iloc[:, 0][~previous.iloc[:, 0].isin(current.iloc[:, 0])])
+
+    @staticmethod
+    def apply(previous: pd.DataFrame, changed_rows: pd.DataFrame, removed_keys: List = None) -> pd.DataFrame:
+        """Replaces changed rows in place, drops removed rows and appends new rows at the end."""
+        key_column = previous.columns[0]
+        if removed_keys:
+            previous = previous.loc[~previous.loc[:, key_column].isin(removed_keys), :]
+
+        positions = dict(zip(previous.loc[:, key_column], range(len(previous))))
+        is_replaced = previous.loc[:, key_column].isin(changed_rows.loc[:, key_column])
+        changed_positions = [positions.get(key, len(previous) + number)
+                             for number, key in enumerate(changed_rows.loc[:, key_column])]
+
+        merged = pd.concat([previous.loc[~is_replaced.values, :], changed_rows], ignore_index=True)
+        merged_positions = list(np.flatnonzero(~is_replaced.values)) + changed_positions
+        return merged.iloc[np.argsort(merged_positions, kind="stable"), :].reset_index(drop=True)
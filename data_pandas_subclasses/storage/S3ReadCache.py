@@ -0,0 +1,43 @@
+import os
+import tempfile
+import uuid
+
+from typing import Optional, Tuple
+
+
+class S3ReadCache:
+    """Local copies of S3 objects with their ETag, which can be shared by several processes."""
+
+    default_folder_name = "covid19_monitor_germany_s3_cache"
+
+    def __init__(self, cache_dir: str = None):
+        if cache_dir is None:
+            cache_dir = os.environ.get('S3_CACHE_DIR',
+                                       os.path.join(tempfile.gettempdir(), self.default_folder_name))
+        self.cache_dir = cache_dir
+
+    def read(self, s3_bucket: str, key: str) -> Optional[Tuple[str, bytes]]:
+        """Returns the ETag and the content of the cached object, or None if the object is not cached."""
+        try:
+            with open(self._path(s3_bucket, key), 'rb') as file:
+                etag = file.readline().decode('utf-8').rstrip("\n")
+                return etag, file.read()
+        except FileNotFoundError:
+            return None
+
+    def write(self, s3_bucket: str, key: str, etag: str, data: bytes) -> None:
+        path = self._path(s3_bucket, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temporary_path = f"{path}.tmp-{os.getpid()}-{uuid.uuid4().hex}"
+        try:
+            with open(temporary_path, 'wb') as file:
+                file.write(etag.encode('utf-8') + b"\n")
+                file.write(data)
+            os.replace(temporary_path, path)
+        except BaseException:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            raise
+
+    def _path(self, s3_bucket: str, key: str) -> str:
+        return os.path.join(self.cache_dir, s3_bucket, *key.split("/"))
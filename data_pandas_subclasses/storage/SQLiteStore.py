@@ -0,0 +1,153 @@
+import logging
+import os
+import re
+import sqlite3
+
+from contextlib import closing
+from typing import Dict, List
+
+import pandas as pd
+
+logging.basicConfig(level=logging.INFO)
+
+
+class SQLiteStore:
+    """Embedded store with one table per dataset and its index as primary key."""
+
+    _row_hash_column = "_row_hash"
+    _sort_key_column = "_sort_key"
+    _columns_table = "_dataset_columns"
+
+    def __init__(self, path: str = None):
+        if path is None:
+            path = os.environ.get('SQLITE_PATH')
+        self.path = path
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return os.environ.get('SQLITE_PATH') is not None
+
+    @staticmethod
+    def table_name(filename: str) -> str:
+        return os.path.splitext(filename)[0]
+
+    def upsert(self, table: str, df: pd.DataFrame) -> int:
+        """Writes all rows of the dataframe which are new or differ from the stored rows and returns their number."""
+        index_column = df.index.name
+        flat_df = df.reset_index()
+        row_hashes = pd.util.hash_pandas_object(flat_df, index=False).astype(str)
+
+        with closing(sqlite3.connect(self.path)) as connection, connection:
+            self._create_table(connection, table, index_column)
+            self._add_missing_columns(connection, table, flat_df)
+
+            stored_row_hashes = dict(connection.execute(
+                f'SELECT {self._quote(index_column)}, {self._row_hash_column} FROM {self._quote(table)}'
+            ).fetchall())
+            keys = flat_df.loc[:, index_column].map(self._to_sql_value)
+            changed = [stored_row_hashes.get(key) != row_hash for key, row_hash in zip(keys, row_hashes)]
+
+            changed_rows = flat_df.loc[changed, :]
+            columns = list(flat_df.columns) + [self._row_hash_column, self._sort_key_column]
+            values = [[self._to_sql_value(value) for value in row] + [row_hash, self._sort_key(key)]
+                      for row, row_hash, key in zip(changed_rows.itertuples(index=False),
+                                                    row_hashes[changed],
+                                                    keys[changed])]
+
+            quoted_columns = ", ".join(self._quote(column) for column in columns)
+            placeholders = ", ".join("?" for _ in columns)
+            updates = ", ".join(f"{self._quote(column)} = excluded.{self._quote(column)}"
+                                for column in columns if column != index_column)
+            connection.executemany(f'INSERT INTO {self._quote(table)} ({quoted_columns}) VALUES ({placeholders}) '
+                                   f'ON CONFLICT ({self._quote(index_column)}) DO UPDATE SET {updates}',
+                                   values)
+
+        return len(values)
+
+    def read(self,
+             table: str,
+             start=None,
+             end=None,
+             columns: List[str] = None) -> pd.DataFrame:
+        """Reads the rows with an index between start and end (both inclusive) with the index as ordinary column."""
+        with closing(sqlite3.connect(self.path)) as connection, connection:
+            column_dtypes = self._column_dtypes(connection, table)
+            if len(column_dtypes) == 0:
+                raise ValueError(f"table {table} not found in SQLite store {self.path}")
+            index_column = next(iter(column_dtypes))
+            if column_dtypes[index_column].startswith("datetime64"):
+                start = None if start is None else pd.Timestamp(start)
+                end = None if end is None else pd.Timestamp(end)
+
+            selected_columns = [column for column in column_dtypes
+                                if (columns is None) | (column == index_column) | (column in (columns or []))]
+            conditions = []
+            parameters = []
+            if start is not None:
+                conditions.append(f"{self._sort_key_column} >= ?")
+                parameters.append(self._sort_key(self._to_sql_value(start)))
+            if end is not None:
+                conditions.append(f"{self._sort_key_column} <= ?")
+                parameters.append(self._sort_key(self._to_sql_value(end)))
+            where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+
+            df = pd.read_sql_query(f'SELECT {", ".join(self._quote(column) for column in selected_columns)} '
+                                   f'FROM {self._quote(table)}{where} ORDER BY {self._sort_key_column}',
+                                   connection,
+                                   params=parameters)
+
+        for column in df.columns:
+            if column_dtypes[column].startswith("datetime64"):
+                df.loc[:, column] = pd.to_datetime(df.loc[:, column])
+        return df
+
+    def _column_dtypes(self, connection: sqlite3.Connection, table: str) -> Dict[str, str]:
+        has_columns_table = connection.execute('SELECT 1 FROM sqlite_master WHERE type = ? AND name = ?',
+                                               ('table', self._columns_table)).fetchone() is not None
+        if not has_columns_table:
+            return {}
+        return dict(connection.execute(
+            f'SELECT column_name, dtype FROM {self._columns_table} WHERE table_name = ? ORDER BY position',
+            (table,)).fetchall())
+
+    def _create_table(self, connection: sqlite3.Connection, table: str, index_column: str) -> None:
+        connection.execute(f'CREATE TABLE IF NOT EXISTS {self._columns_table} '
+                           f'(table_name TEXT, column_name TEXT, dtype TEXT, position INTEGER, '
+                           f'PRIMARY KEY (table_name, column_name))')
+        connection.execute(f'CREATE TABLE IF NOT EXISTS {self._quote(table)} '
+                           f'({self._quote(index_column)} PRIMARY KEY, {self._row_hash_column} TEXT, '
+                           f'{self._sort_key_column} TEXT)')
+        connection.execute(f'CREATE INDEX IF NOT EXISTS {self._quote(table + self._sort_key_column)} '
+                           f'ON {self._quote(table)} ({self._sort_key_column})')
+
+    def _add_missing_columns(self, connection: sqlite3.Connection, table: str, flat_df: pd.DataFrame) -> None:
+        existing_columns = [row[1] for row in connection.execute(f'PRAGMA table_info({self._quote(table)})')]
+        for column in flat_df.columns:
+            if column not in existing_columns:
+                connection.execute(f'ALTER TABLE {self._quote(table)} ADD COLUMN {self._quote(column)}')
+
+        connection.executemany(f'INSERT OR REPLACE INTO {self._columns_table} VALUES (?, ?, ?, ?)',
+                               [(table, column, str(dtype), position)
+                                for position, (column, dtype) in enumerate(flat_df.dtypes.items())])
+
+    @staticmethod
+    def _sort_key(key) -> str:
+        """Calendar weeks like '2021 - 1' are stored as '2021-01' for range queries."""
+        calendar_week = re.search(r"(\d{4}) - (\d{1,2})$", str(key))
+        if calendar_week is not None:
+            return f"{calendar_week.group(1)}-{int(calendar_week.group(2)):02d}"
+        return str(key)
+
+    @staticmethod
+    def _quote(name: str) -> str:
+        return '"' + name.replace('"', '""') + '"'
+
+    @staticmethod
+    def _to_sql_value(value):
+        if pd.isna(value):
+            return None
+        if isinstance(value, pd.Timestamp):
+            return value.isoformat()
+        if hasattr(value, 'item'):  # numpy scalar
+            return value.item()
+        return value
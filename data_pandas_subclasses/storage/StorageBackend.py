@@ -0,0 +1,207 @@
+import boto3
+import logging
+import os
+import threading
+import uuid
+
+from abc import ABC, abstractmethod
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from dotenv import load_dotenv
+from io import BytesIO
+from typing import Dict, List, Optional, Tuple
+
+from data_pandas_subclasses.storage.ContentEncoding import ContentEncoding
+from data_pandas_subclasses.storage.S3ReadCache import S3ReadCache
+
+load_dotenv()
+logging.basicConfig(level=logging.INFO)
+
+
+class StorageBackend(ABC):
+    """Location where the datasets are stored, either a local folder or a S3 bucket."""
+
+    @abstractmethod
+    def read(self, key: str) -> bytes:
+        pass
+
+    @abstractmethod
+    def write(self, key: str, data: bytes) -> None:
+        pass
+
+    @abstractmethod
+    def exists(self, key: str) -> bool:
+        pass
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        pass
+
+    @abstractmethod
+    def list_keys(self, prefix: str) -> List[str]:
+        pass
+
+    @abstractmethod
+    def version(self, key: str) -> Optional[str]:
+        """Returns an identifier which changes whenever the object is written, or None if it does not exist."""
+
+    @abstractmethod
+    def location(self, key: str) -> str:
+        pass
+
+    @staticmethod
+    def from_environment(s3_bucket: str = None, folder_path: str = None) -> 'StorageBackend':
+        if (os.environ.get('S3_BUCKET') is not None) | (s3_bucket is not None):
+            if s3_bucket is None:
+                s3_bucket = os.environ.get('S3_BUCKET')
+            return S3StorageBackend(s3_bucket)
+
+        if folder_path is None:
+            if os.environ.get('FOLDER_PATH') is not None:
+                folder_path = os.environ.get('FOLDER_PATH')
+            else:
+                folder_path = LocalStorageBackend.default_folder_path
+        return LocalStorageBackend(folder_path)
+
+
+class LocalStorageBackend(StorageBackend):
+
+    default_folder_path = "data/"
+
+    def __init__(self, folder_path: str):
+        self.folder_path = folder_path
+
+    def read(self, key: str) -> bytes:
+        with open(self.location(key), 'rb') as file:
+            return file.read()
+
+    def write(self, key: str, data: bytes) -> None:
+        """Writes to a temporary file first and renames it afterwards, so readers never see a half-written file."""
+        os.makedirs(os.path.dirname(self.location(key)) or ".", exist_ok=True)
+        temporary_path = f"{self.location(key)}.tmp-{os.getpid()}-{uuid.uuid4().hex}"
+        try:
+            with open(temporary_path, 'wb') as file:
+                file.write(data)
+            os.replace(temporary_path, self.location(key))
+        except BaseException:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            raise
+
+    def exists(self, key: str) -> bool:
+        return os.path.exists(self.location(key))
+
+    def delete(self, key: str) -> None:
+        os.remove(self.location(key))
+
+    def list_keys(self, prefix: str) -> List[str]:
+        keys = []
+        for folder, _, filenames in os.walk(self.folder_path):
+            for filename in filenames:
+                key = os.path.relpath(os.path.join(folder, filename), self.folder_path).replace(os.sep, "/")
+                if key.startswith(prefix):
+                    keys.append(key)
+        return keys
+
+    def version(self, key: str) -> Optional[str]:
+        try:
+            stat = os.stat(self.location(key))
+        except FileNotFoundError:
+            return None
+        return f"{stat.st_mtime_ns}-{stat.st_size}"
+
+    def location(self, key: str) -> str:
+        return self.folder_path + key
+
+
+class S3StorageBackend(StorageBackend):
+
+    # keys named by the hash of their content (see DatasetManifest and VintageArchive) and the records of archived
+    # vintages never change
+    immutable_prefixes = ("datasets/", "archive/objects/", "archive/vintages/")
+
+    _client = None
+    _client_lock = threading.Lock()
+
+    def __init__(self, s3_bucket: str, cache: S3ReadCache = None):
+        if cache is None:
+            cache = S3ReadCache()
+        self.s3_bucket = s3_bucket
+        self.cache = cache
+
+    @staticmethod
+    def client():
+        """Returns the S3 client shared by all threads of the process."""
+        with S3StorageBackend._client_lock:
+            if S3StorageBackend._client is None:
+                config = Config(max_pool_connections=int(os.environ.get('S3_MAX_POOL_CONNECTIONS', 20)),
+                                retries={'max_attempts': 5, 'mode': 'standard'})
+                S3StorageBackend._client = boto3.client('s3', config=config)
+            return S3StorageBackend._client
+
+    def read(self, key: str) -> bytes:
+        """Reads through the local cache, which is revalidated with the ETag of the object."""
+        cached = self.cache.read(self.s3_bucket, key)
+        if (cached is not None) & key.startswith(self.immutable_prefixes):
+            return cached[1]
+
+        s3 = self.client()
+        try:
+            if cached is None:
+                response = s3.get_object(Bucket=self.s3_bucket, Key=key)
+            else:
+                response = s3.get_object(Bucket=self.s3_bucket, Key=key, IfNoneMatch=cached[0])
+        except ClientError as error:
+            if (cached is not None) & (error.response['Error']['Code'] in ('304', 'NotModified')):
+                logging.info(f"{self.location(key)} not modified, use local copy of {self.cache.cache_dir}")
+                return cached[1]
+            raise
+
+        data = ContentEncoding.decode_stream(response['Body'], response.get('ContentEncoding'))
+        self.cache.write(self.s3_bucket, key, response['ETag'], data)
+        return data
+
+    def read_stored_object(self, key: str) -> Tuple[bytes, str, str]:
+        """Returns the stored object without cache and decoding, with its ETag and ContentEncoding."""
+        response = self.client().get_object(Bucket=self.s3_bucket, Key=key)
+        return response['Body'].read(), response['ETag'], response.get('ContentEncoding')
+
+    def write(self, key: str, data: bytes) -> None:
+        """Uploads the object compressed with S3_CONTENT_ENCODING."""
+        content_encoding = ContentEncoding.for_key(key)
+        extra_args = {}
+        if content_encoding != ContentEncoding.identity:
+            data = ContentEncoding.encode(data, content_encoding)
+            extra_args['ContentEncoding'] = content_encoding
+
+        self.client().upload_fileobj(BytesIO(data), self.s3_bucket, key, ExtraArgs=extra_args)
+
+    def exists(self, key: str) -> bool:
+        s3 = self.client()
+        response = s3.list_objects_v2(Bucket=self.s3_bucket, Prefix=key, MaxKeys=1)
+        return any(content['Key'] == key for content in response.get('Contents', []))
+
+    def delete(self, key: str) -> None:
+        s3 = self.client()
+        s3.delete_object(Bucket=self.s3_bucket, Key=key)
+
+    def list_keys(self, prefix: str) -> List[str]:
+        return list(self.list_etags(prefix))
+
+    def list_etags(self, prefix: str) -> Dict[str, str]:
+        s3 = self.client()
+        paginator = s3.get_paginator('list_objects_v2')
+        return {content['Key']: content['ETag']
+                for page in paginator.paginate(Bucket=self.s3_bucket, Prefix=prefix)
+                for content in page.get('Contents', [])}
+
+    def version(self, key: str) -> Optional[str]:
+        try:
+            return self.client().head_object(Bucket=self.s3_bucket, Key=key)['ETag']
+        except ClientError as error:
+            if error.response['Error']['Code'] in ('404', 'NoSuchKey', 'NotFound'):
+                return None
+            raise
+
+    def location(self, key: str) -> str:
+        return f"S3 Bucket {self.s3_bucket} with filename {key}"
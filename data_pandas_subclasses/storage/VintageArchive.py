@@ -0,0 +1,148 @@
+import gzip
+import hashlib
+import json
+import logging
+import os
+
+from datetime import datetime
+from io import BytesIO
+from typing import List, Optional
+
+import pandas as pd
+
+from data_pandas_subclasses.storage.RowDelta import RowDelta
+from data_pandas_subclasses.storage.StorageBackend import StorageBackend
+
+logging.basicConfig(level=logging.INFO)
+
+
+class VintageArchive:
+    """Append-only archive of all published versions (vintages) of the datasets as snapshots and deltas."""
+
+    folder = "archive/"
+    default_snapshot_interval = 30
+    key_time_format = "%Y%m%dT%H%M%S%f"
+
+    def __init__(self, storage: StorageBackend, snapshot_interval: int = None):
+        if snapshot_interval is None:
+            snapshot_interval = int(os.environ.get('ARCHIVE_SNAPSHOT_INTERVAL', self.default_snapshot_interval))
+        self.storage = storage
+        self.snapshot_interval = snapshot_interval
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return os.environ.get('VINTAGE_ARCHIVE', 'false').lower() == 'true'
+
+    @staticmethod
+    def table_name(filename: str) -> str:
+        return os.path.splitext(filename)[0]
+
+    def vintages(self, table: str) -> List[dict]:
+        """Returns all archived vintages of the table in the order they were created."""
+        return [json.loads(self.storage.read(key)) for key in self._vintage_keys(table)]
+
+    def append(self, table: str, df: pd.DataFrame) -> dict:
+        """Stores the dataframe as new vintage, or returns None if nothing changed since the last vintage."""
+        data = df.to_csv().encode('utf-8')
+        content_hash = hashlib.sha256(data).hexdigest()
+        head = self._read_head(table)
+        if (head is not None) and (head["content"] == content_hash):
+            return None
+
+        current = self._to_string_frame(data)
+        position = 0 if head is None else head["position"] + 1
+        is_snapshot = (position % self.snapshot_interval == 0)
+        if head is not None:
+            previous = self._reconstruct(self._chain(head["vintage"]))
+            changed_rows = RowDelta.changed_rows(previous, current)
+            removed_keys = RowDelta.removed_keys(previous, current)
+            if (len(changed_rows) == 0) & (len(removed_keys) == 0):
+                return None
+            if not is_snapshot:
+                reconstructed = RowDelta.apply(previous, changed_rows, removed_keys)
+                is_snapshot = (list(reconstructed.columns) != list(current.columns)) | \
+                              (list(reconstructed.iloc[:, 0]) != list(current.iloc[:, 0]))
+
+        created = datetime.now()
+        vintage = {"created": created.isoformat(timespec="seconds"),
+                   "type": "snapshot" if is_snapshot else "delta",
+                   "object": self._write_object(current if is_snapshot else changed_rows),
+                   "rows": len(current),
+                   "changed rows": len(current) if is_snapshot else len(changed_rows),
+                   "removed keys": [] if is_snapshot else removed_keys,
+                   "position": position,
+                   "previous": None if head is None else head["vintage"]}
+        record = json.dumps(vintage, indent=2).encode('utf-8')
+        key = self._vintage_key(table, created, hashlib.sha256(record).hexdigest())
+        self.storage.write(key, record)
+        self.storage.write(self._head_key(table),
+                           json.dumps({"position": position, "vintage": key, "content": content_hash}).encode('utf-8'))
+        return vintage
+
+    def read(self, table: str, as_of) -> pd.DataFrame:
+        """Returns the last vintage created until as_of (end of the day without time) as flat dataframe."""
+        as_of = pd.Timestamp(as_of)
+        if as_of == as_of.normalize():
+            as_of = as_of + pd.Timedelta(days=1) - pd.Timedelta(microseconds=1)
+
+        keys = [key for key in self._vintage_keys(table) if self._created_of_key(key) <= as_of]
+        if len(keys) == 0:
+            raise ValueError(f"no vintage of {table} archived until {as_of}")
+
+        flat_df = self._reconstruct(self._chain(keys[-1]))
+        return pd.read_csv(BytesIO(flat_df.to_csv(index=False).encode('utf-8')))
+
+    def _chain(self, key: str) -> List[dict]:
+        """Returns the vintages from the last snapshot up to the vintage with the given key."""
+        chain = []
+        while True:
+            vintage = json.loads(self.storage.read(key))
+            chain.insert(0, vintage)
+            if vintage["type"] == "snapshot":
+                return chain
+            key = vintage["previous"]
+
+    def _reconstruct(self, chain: List[dict]) -> pd.DataFrame:
+        df = self._read_object(chain[0]["object"])
+        for vintage in chain[1:]:
+            df = RowDelta.apply(df, self._read_object(vintage["object"]), vintage["removed keys"])
+        return df
+
+    def _read_head(self, table: str) -> Optional[dict]:
+        if not self.storage.exists(self._head_key(table)):
+            return None
+        return json.loads(self.storage.read(self._head_key(table)))
+
+    def _write_object(self, df: pd.DataFrame) -> str:
+        data = gzip.compress(df.to_csv(index=False).encode('utf-8'), mtime=0)
+        content_hash = hashlib.sha256(data).hexdigest()
+        key = self._object_key(content_hash)
+        if not self.storage.exists(key):
+            self.storage.write(key, data)
+        return content_hash
+
+    def _read_object(self, content_hash: str) -> pd.DataFrame:
+        return self._to_string_frame(gzip.decompress(self.storage.read(self._object_key(content_hash))))
+
+    @staticmethod
+    def _to_string_frame(data: bytes) -> pd.DataFrame:
+        return pd.read_csv(BytesIO(data), dtype=str, keep_default_na=False)
+
+    def _vintages_prefix(self, table: str) -> str:
+        return f"{self.folder}vintages/{table}/"
+
+    def _vintage_keys(self, table: str) -> List[str]:
+        return sorted(self.storage.list_keys(self._vintages_prefix(table)))
+
+    def _vintage_key(self, table: str, created: datetime, record_hash: str) -> str:
+        # keys sort by their creation time and never collide, even if several updaters archive the same table
+        return f"{self._vintages_prefix(table)}{created.strftime(self.key_time_format)}-{record_hash[:16]}.json"
+
+    def _created_of_key(self, key: str) -> datetime:
+        return datetime.strptime(key.rsplit("/", 1)[1].split("-")[0], self.key_time_format)
+
+    def _head_key(self, table: str) -> str:
+        return f"{self.folder}heads/{table}.json"
+
+    def _object_key(self, content_hash: str) -> str:
+        return f"{self.folder}objects/{content_hash}.csv.gz"
@@ -1,6 +1,7 @@
 # subclassing of Pandas
 # see: https://pandas.pydata.org/pandas-docs/stable/development/extending.html#override-constructor-properties
 import logging
+from typing import List
 
 from dotenv import load_dotenv
 
@@ -35,16 +36,18 @@ class CasesPerOutbreakDataFrame(CoronaBaseWeekIndexDataFrame):
         return CasesPerOutbreakSeries
 
     @staticmethod
-    def from_csv(filename: str=None,
-                 s3_bucket: str=None,
-                 folder_path: str=None,
-                 class_name: str=None) -> 'CasesPerOutbreakDataFrame':
+    def from_file(filename: str=None,
+                  s3_bucket: str=None,
+                  folder_path: str=None,
+                  class_name: str=None,
+                  columns: List[str]=None,
+                  file_format: str=None) -> 'CasesPerOutbreakDataFrame':
 
         if filename is None:
             filename = CasesPerOutbreakDataFrame._filename
         if class_name is None:
             class_name = CasesPerOutbreakDataFrame.__name__
-        df = CoronaBaseWeekIndexDataFrame.from_csv(filename, s3_bucket, folder_path, class_name)
+        df = CoronaBaseWeekIndexDataFrame.from_file(filename, s3_bucket, folder_path, class_name, columns, file_format)
 
         return CasesPerOutbreakDataFrame(df)
 
@@ -59,7 +62,7 @@ class CasesPerOutbreakDataFrame(CoronaBaseWeekIndexDataFrame):
         cases_attributed_to_an_outbreak = CasesPerOutbreakDataFrame(CasesPerOutbreakDataFrame.api.
                                                      cases_attributed_to_an_outbreak_per_week())
         if to_csv:
-            cases_attributed_to_an_outbreak.save_as_csv(s3_bucket=s3_bucket, folder_path=folder_path)
+            cases_attributed_to_an_outbreak.save(s3_bucket=s3_bucket, folder_path=folder_path)
 
         logging.info("FINISHED UPDATE PROCESS FOR CASES PER OUTBREAK")
         return cases_attributed_to_an_outbreak
@@ -37,16 +37,18 @@ class ClinicalAspectsDataFrame(CoronaBaseWeekIndexDataFrame):
         return ClinicalAspectsSeries
 
     @staticmethod
-    def from_csv(filename: str=None,
-                 s3_bucket: str=None,
-                 folder_path: str=None,
-                 class_name: str=None) -> 'ClinicalAspectsDataFrame':
+    def from_file(filename: str=None,
+                  s3_bucket: str=None,
+                  folder_path: str=None,
+                  class_name: str=None,
+                  columns: List[str]=None,
+                  file_format: str=None) -> 'ClinicalAspectsDataFrame':
 
         if filename is None:
             filename = ClinicalAspectsDataFrame._filename
         if class_name is None:
             class_name = ClinicalAspectsDataFrame.__name__
-        df = CoronaBaseWeekIndexDataFrame.from_csv(filename, s3_bucket, folder_path, class_name)
+        df = CoronaBaseWeekIndexDataFrame.from_file(filename, s3_bucket, folder_path, class_name, columns, file_format)
 
         return ClinicalAspectsDataFrame(df)
 
@@ -66,7 +68,7 @@ class ClinicalAspectsDataFrame(CoronaBaseWeekIndexDataFrame):
                                                   right_index=True)
         clinical_aspects._add_statistical_columns()
         if to_csv:
-            clinical_aspects.save_as_csv(s3_bucket=s3_bucket, folder_path=folder_path)
+            clinical_aspects.save(s3_bucket=s3_bucket, folder_path=folder_path)
 
         logging.info("FINISHED UPDATE PROCESS FOR CLINICAL ASPECTS")
         return clinical_aspects
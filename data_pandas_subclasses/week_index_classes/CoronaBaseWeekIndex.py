@@ -1,3 +1,5 @@
+from typing import List
+
 from data_pandas_subclasses.CoronaBase import CoronaBaseSeries, CoronaBaseDataFrame
 
 
@@ -22,12 +24,16 @@ class CoronaBaseWeekIndexDataFrame(CoronaBaseDataFrame):
         return CoronaBaseWeekIndexSeries
 
     @staticmethod
-    def from_csv(filename: str,
-                 s3_bucket: str=None,
-                 folder_path: str=None,
-                 class_name: str=None) -> 'CoronaBaseWeekIndexDataFrame':
+    def from_file(filename: str,
+                  s3_bucket: str=None,
+                  folder_path: str=None,
+                  class_name: str=None,
+                  columns: List[str]=None,
+                  file_format: str=None) -> 'CoronaBaseWeekIndexDataFrame':
         if class_name is None:
             class_name = 'CoronaBaseWeekIndexDataFrame'
-        df = CoronaBaseDataFrame.from_csv(filename, s3_bucket, folder_path, class_name)
+        if columns is not None:
+            columns = ["calendar week"] + columns
+        df = CoronaBaseDataFrame.from_file(filename, s3_bucket, folder_path, class_name, columns, file_format)
 
         return CoronaBaseWeekIndexDataFrame(df.set_index("calendar week"))
@@ -1,6 +1,7 @@
 # subclassing of Pandas
 # see: https://pandas.pydata.org/pandas-docs/stable/development/extending.html#override-constructor-properties
 import logging
+from typing import List
 
 from dotenv import load_dotenv
 
@@ -35,16 +36,18 @@ class DeathsByWeekOfDeathAndAgeGroupDataFrame(CoronaBaseWeekIndexDataFrame):
         return DeathsByWeekOfDeathAndAgeGroupSeries
 
     @staticmethod
-    def from_csv(filename: str=None,
-                 s3_bucket: str=None,
-                 folder_path: str=None,
-                 class_name: str=None) -> 'DeathsByWeekOfDeathAndAgeGroupDataFrame':
+    def from_file(filename: str=None,
+                  s3_bucket: str=None,
+                  folder_path: str=None,
+                  class_name: str=None,
+                  columns: List[str]=None,
+                  file_format: str=None) -> 'DeathsByWeekOfDeathAndAgeGroupDataFrame':
 
         if filename is None:
             filename = DeathsByWeekOfDeathAndAgeGroupDataFrame._filename
         if class_name is None:
             class_name = DeathsByWeekOfDeathAndAgeGroupDataFrame.__name__
-        df = CoronaBaseWeekIndexDataFrame.from_csv(filename, s3_bucket, folder_path, class_name)
+        df = CoronaBaseWeekIndexDataFrame.from_file(filename, s3_bucket, folder_path, class_name, columns, file_format)
 
         return DeathsByWeekOfDeathAndAgeGroupDataFrame(df)
 
@@ -59,7 +62,7 @@ class DeathsByWeekOfDeathAndAgeGroupDataFrame(CoronaBaseWeekIndexDataFrame):
         cases_attributed_to_an_outbreak = DeathsByWeekOfDeathAndAgeGroupDataFrame(
             DeathsByWeekOfDeathAndAgeGroupDataFrame.api.deaths_by_week_of_death_and_age_group())
         if to_csv:
-            cases_attributed_to_an_outbreak.save_as_csv(s3_bucket=s3_bucket, folder_path=folder_path)
+            cases_attributed_to_an_outbreak.save(s3_bucket=s3_bucket, folder_path=folder_path)
 
         logging.info("FINISHED UPDATE PROCESS FOR DEATHS BY WEEK OF DEATH AND AGE GROUP")
         return cases_attributed_to_an_outbreak
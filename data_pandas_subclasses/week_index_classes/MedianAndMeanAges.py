@@ -37,16 +37,18 @@ class MedianAndMeanAgesDataFrame(CoronaBaseWeekIndexDataFrame):
         return MedianAndMeanAgesSeries
 
     @staticmethod
-    def from_csv(filename: str=None,
-                 s3_bucket: str=None,
-                 folder_path: str=None,
-                 class_name: str=None) -> 'MedianAndMeanAgesDataFrame':
+    def from_file(filename: str=None,
+                  s3_bucket: str=None,
+                  folder_path: str=None,
+                  class_name: str=None,
+                  columns: List[str]=None,
+                  file_format: str=None) -> 'MedianAndMeanAgesDataFrame':
 
         if filename is None:
             filename = MedianAndMeanAgesDataFrame._filename
         if class_name is None:
             class_name = MedianAndMeanAgesDataFrame.__name__
-        df = CoronaBaseWeekIndexDataFrame.from_csv(filename, s3_bucket, folder_path, class_name)
+        df = CoronaBaseWeekIndexDataFrame.from_file(filename, s3_bucket, folder_path, class_name, columns, file_format)
 
         return MedianAndMeanAgesDataFrame(df)
 
@@ -61,7 +63,7 @@ class MedianAndMeanAgesDataFrame(CoronaBaseWeekIndexDataFrame):
         median_and_mean_ages = MedianAndMeanAgesDataFrame(MedianAndMeanAgesDataFrame.api.
                                                           median_and_mean_age_for_cases_hospitalization_its_and_death())
         if to_csv:
-            median_and_mean_ages.save_as_csv(s3_bucket=s3_bucket, folder_path=folder_path)
+            median_and_mean_ages.save(s3_bucket=s3_bucket, folder_path=folder_path)
 
         logging.info("FINISHED UPDATE PROCESS FOR MEDIAN AND MEAN AGES")
         return median_and_mean_ages
@@ -38,16 +38,18 @@ class NumberPCRTestsDataFrame(CoronaBaseWeekIndexDataFrame):
         return NumberPCRTestsSeries
 
     @staticmethod
-    def from_csv(filename: str=None,
-                 s3_bucket: str=None,
-                 folder_path: str=None,
-                 class_name: str=None) -> 'NumberPCRTestsDataFrame':
+    def from_file(filename: str=None,
+                  s3_bucket: str=None,
+                  folder_path: str=None,
+                  class_name: str=None,
+                  columns: List[str]=None,
+                  file_format: str=None) -> 'NumberPCRTestsDataFrame':
 
         if filename is None:
             filename = NumberPCRTestsDataFrame._filename
         if class_name is None:
             class_name = NumberPCRTestsDataFrame.__name__
-        df = CoronaBaseWeekIndexDataFrame.from_csv(filename, s3_bucket, folder_path, class_name)
+        df = CoronaBaseWeekIndexDataFrame.from_file(filename, s3_bucket, folder_path, class_name, columns, file_format)
 
         return NumberPCRTestsDataFrame(df)
 
@@ -65,7 +67,7 @@ class NumberPCRTestsDataFrame(CoronaBaseWeekIndexDataFrame):
             calculate_change_in_number_of_tests_compared_to_previous_week_in_percent()
 
         if to_csv:
-            number_pcr_tests.save_as_csv(s3_bucket=s3_bucket, folder_path=folder_path)
+            number_pcr_tests.save(s3_bucket=s3_bucket, folder_path=folder_path)
 
         logging.info("FINISHED UPDATE PROCESS FOR NUMBER OF PCR TESTS")
         return number_pcr_tests
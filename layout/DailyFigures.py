@@ -0,0 +1,138 @@
+import json
+import logging
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from data_pandas_subclasses.date_index_classes.CoronaCasesAndDeaths import CoronaCasesAndDeathsDataFrame
+from data_pandas_subclasses.date_index_classes.IntensiveRegister import IntensiveRegisterDataFrame
+from data_pandas_subclasses.date_index_classes.NowcastRKI import NowcastRKIDataFrame
+from data_pandas_subclasses.storage.StorageBackend import StorageBackend
+from layout.DailyFiguresDict import DailyFiguresDict
+
+logging.basicConfig(level=logging.INFO)
+
+
+class DailyFigures:
+    """Figures of the daily overview."""
+
+    # columns read by the calculation, so they are kept when the datasets are loaded with a column projection
+    required_columns = {
+        CoronaCasesAndDeathsDataFrame: ["date",
+                                        "cases",
+                                        "cases cumulative",
+                                        "cases (mean of ±3 days)",
+                                        "cases last 365 days",
+                                        "7 day incidence per 100,000 inhabitants",
+                                        "7 day incidence per 100,000 inhabitants by reporting date (RKI version)",
+                                        "deaths",
+                                        "deaths cumulative",
+                                        "deaths (mean of ±3 days)",
+                                        "deaths last 365 days",
+                                        "7 day deaths (by cases (mean of ±3 days)) per 1,000,000 inhabitants",
+                                        "R value by cases (mean of ±3 days)"],
+        NowcastRKIDataFrame: ["date",
+                              "7 day R value (Nowcast RKI)"],
+        IntensiveRegisterDataFrame: ["date",
+                                     "R value calculated by newly admitted intensive care patients with a "
+                                     "positive COVID-19 test (mean ±3 days)"]
+    }
+
+    filename = "daily_figures.json"
+
+    @staticmethod
+    def calculate(corona_cases_and_deaths: CoronaCasesAndDeathsDataFrame,
+                  nowcast_rki: NowcastRKIDataFrame,
+                  intensive_register: IntensiveRegisterDataFrame) -> DailyFiguresDict:
+        cases = DailyFigures._last_rows(corona_cases_and_deaths, CoronaCasesAndDeathsDataFrame, [0, 1, 3, 4])
+        nowcast = DailyFigures._last_rows(nowcast_rki, NowcastRKIDataFrame, [1, 2])
+        intensive = DailyFigures._last_rows(intensive_register, IntensiveRegisterDataFrame, [3, 4])
+        intensive_r_value = \
+            "R value calculated by newly admitted intensive care patients with a positive COVID-19 test (mean ±3 days)"
+
+        daily_figures: DailyFiguresDict = \
+            {"cases_cumulative": int(cases[0]["cases cumulative"]),
+             "cases_last_365_days": int(cases[0]["cases last 365 days"]),
+             "last_cases_reported_by_rki": int(cases[0]["cases"]),
+             "last_mean_cases": int(np.round(cases[3]["cases (mean of ±3 days)"])),
+             "last_mean_cases_change_since_day_before":
+                 DailyFigures._rounded_change(cases, "cases (mean of ±3 days)", 3),
+             "cases_last_7_days": np.round(cases[0]["7 day incidence per 100,000 inhabitants"], 2),
+             "cases_last_7_days_change_since_day_before":
+                 DailyFigures._rounded_change(cases, "7 day incidence per 100,000 inhabitants", 0, 2),
+             "cases_last_7_days_by_reporting_date":
+                 np.round(cases[0]["7 day incidence per 100,000 inhabitants by reporting date (RKI version)"], 2),
+             "cases_last_7_days_by_reporting_date_change_since_day_before":
+                 DailyFigures._rounded_change(cases,
+                                              "7 day incidence per 100,000 inhabitants by reporting date (RKI version)",
+                                              0, 2),
+             "deaths_cumulative": int(cases[0]["deaths cumulative"]),
+             "deaths_last_365_days": int(cases[0]["deaths last 365 days"]),
+             "last_deaths_reported_by_rki": int(cases[0]["deaths"]),
+             "last_mean_deaths": int(np.round(cases[3]["deaths (mean of ±3 days)"])),
+             "last_mean_deaths_change_since_day_before":
+                 DailyFigures._rounded_change(cases, "deaths (mean of ±3 days)", 3),
+             "deaths_last_7_days":
+                 np.round(cases[3]["7 day deaths (by cases (mean of ±3 days)) per 1,000,000 inhabitants"], 2),
+             "deaths_last_7_days_change_since_day_before":
+                 DailyFigures._rounded_change(cases,
+                                              "7 day deaths (by cases (mean of ±3 days)) per 1,000,000 inhabitants",
+                                              3, 2),
+             "last_r_value": np.round(cases[3]["R value by cases (mean of ±3 days)"], 2),
+             "last_r_value_change_since_day_before":
+                 DailyFigures._rounded_change(cases, "R value by cases (mean of ±3 days)", 3, 2),
+             "last_r_value_by_nowcast_rki": np.round(nowcast[1]["7 day R value (Nowcast RKI)"], 2),
+             "last_r_value_by_nowcast_rki_change_since_day_before":
+                 DailyFigures._rounded_change(nowcast, "7 day R value (Nowcast RKI)", 1, 2),
+             "last_r_value_by_new_admissions_to_intensive_care": np.round(intensive[3][intensive_r_value], 2),
+             "last_r_value_by_new_admissions_to_intensive_care_change_since_day_before":
+                 DailyFigures._rounded_change(intensive, intensive_r_value, 3, 2)
+             }
+
+        return daily_figures
+
+    @staticmethod
+    def _last_rows(df: pd.DataFrame, dataframe_class: type, days_before_last_date: List[int]) -> Dict[int, dict]:
+        """Returns the values of the columns by column name for the given numbers of days before the last date."""
+        last_date = df.index.max()
+        positions = [df.index.get_loc(last_date - pd.Timedelta(days=days)) for days in days_before_last_date]
+        values = {column: df[column].to_numpy()[positions]
+                  for column in DailyFigures.required_columns[dataframe_class] if column in df.columns}
+        return {days: {column: column_values[i] for column, column_values in values.items()}
+                for i, days in enumerate(days_before_last_date)}
+
+    @staticmethod
+    def _rounded_change(rows: Dict[int, dict], column: str, days_before_last_date: int, decimals: int = None):
+        """Returns the change of the column from the day before to the day, as int if no decimals are given."""
+        change = rows[days_before_last_date][column] - rows[days_before_last_date + 1][column]
+        if decimals is None:
+            return int(np.round(change))
+        return np.round(change, decimals)
+
+    @staticmethod
+    def source_versions(versions: Dict[type, Optional[str]]) -> Dict[str, Optional[str]]:
+        """Returns the versions of the datasets the figures are calculated from by the name of their dataframe class."""
+        return {dataframe_class.__name__: versions.get(dataframe_class)
+                for dataframe_class in DailyFigures.required_columns}
+
+    @staticmethod
+    def write(storage: StorageBackend, daily_figures: DailyFiguresDict, versions: Dict[str, Optional[str]]) -> None:
+        """Stores the figures together with the versions of the datasets they were calculated from."""
+        record = {"versions": versions, "daily_figures": daily_figures}
+        storage.write(DailyFigures.filename, json.dumps(record, indent=2, default=float).encode('utf-8'))
+        logging.info(f"daily figures have been written to {storage.location(DailyFigures.filename)}")
+
+    @staticmethod
+    def read(storage: StorageBackend, versions: Dict[str, Optional[str]]) -> Optional[DailyFiguresDict]:
+        """Returns the stored figures if they were calculated from the given versions of the datasets, else None."""
+        if (None in versions.values()) or not storage.exists(DailyFigures.filename):
+            return None
+        try:
+            record = json.loads(storage.read(DailyFigures.filename))
+        except Exception:
+            logging.exception(f"loading of {DailyFigures.filename} failed, calculate the daily figures")
+            return None
+        if record.get("versions") != versions:
+            return None
+        return record["daily_figures"]
@@ -0,0 +1,78 @@
+import logging
+from typing import Dict, List
+
+from data_pandas_subclasses.CoronaBase import CoronaBaseDataFrame
+from data_pandas_subclasses.date_index_classes.CoronaCasesAndDeaths import CoronaCasesAndDeathsDataFrame
+from data_pandas_subclasses.date_index_classes.NowcastRKI import NowcastRKIDataFrame
+from data_pandas_subclasses.AgeDistribution import AgeDistributionDataFrame
+from data_pandas_subclasses.week_index_classes.ClinicalAspects import ClinicalAspectsDataFrame
+from data_pandas_subclasses.week_index_classes.CasesPerOutbreak import CasesPerOutbreakDataFrame
+from data_pandas_subclasses.week_index_classes.DeathsByWeekOfDeathAndAgeGroup import \
+    DeathsByWeekOfDeathAndAgeGroupDataFrame
+from data_pandas_subclasses.date_index_classes.IntensiveRegister import IntensiveRegisterDataFrame
+from data_pandas_subclasses.week_index_classes.NumberPCRTests import NumberPCRTestsDataFrame
+from data_pandas_subclasses.week_index_classes.MedianAndMeanAges import MedianAndMeanAgesDataFrame
+from data_pandas_subclasses.storage.DatasetBundle import DatasetBundle
+from data_pandas_subclasses.storage.DatasetManifest import DatasetManifest
+from data_pandas_subclasses.storage.StorageBackend import StorageBackend
+from layout.DailyFigures import DailyFigures
+from layout.DailyFiguresDict import DailyFiguresDict
+
+logging.basicConfig(level=logging.INFO)
+
+
+class DashboardData:
+    """All datasets shown by the dashboard together with the figures of the daily overview."""
+
+    dataframe_classes = [CoronaCasesAndDeathsDataFrame,
+                         NowcastRKIDataFrame,
+                         NumberPCRTestsDataFrame,
+                         IntensiveRegisterDataFrame,
+                         ClinicalAspectsDataFrame,
+                         MedianAndMeanAgesDataFrame,
+                         AgeDistributionDataFrame,
+                         CasesPerOutbreakDataFrame,
+                         DeathsByWeekOfDeathAndAgeGroupDataFrame]
+
+    def __init__(self, dataframes: Dict[type, CoronaBaseDataFrame], daily_figures: DailyFiguresDict,
+                 version: str = None):
+        self.dataframes = dataframes
+        self.daily_figures = daily_figures
+        self.version = version
+
+    def __getitem__(self, dataframe_class: type) -> CoronaBaseDataFrame:
+        """Returns the dataframe, or None if the dataset could not be loaded."""
+        return self.dataframes.get(dataframe_class)
+
+    @staticmethod
+    def from_files(columns: Dict[type, List[str]] = None) -> 'DashboardData':
+        """Loads the published datasets, versioned by the manifest, leaving out the datasets which failed to load."""
+        version = DatasetManifest(StorageBackend.from_environment()).version()
+        dataframes = DashboardData.load_dataframes(DashboardData.dataframe_classes, columns)
+        try:
+            daily_figures = DailyFigures.calculate(dataframes.get(CoronaCasesAndDeathsDataFrame),
+                                                   dataframes.get(NowcastRKIDataFrame),
+                                                   dataframes.get(IntensiveRegisterDataFrame))
+        except Exception:
+            logging.exception("calculation of daily figures failed")
+            daily_figures = None
+        return DashboardData(dataframes, daily_figures, version)
+
+    @staticmethod
+    def load_dataframes(dataframe_classes: List[type],
+                        columns: Dict[type, List[str]] = None) -> Dict[type, CoronaBaseDataFrame]:
+        """Loads the datasets with the given columns by dataframe class, or with all columns."""
+        if columns is None:
+            columns = {}
+        dataframes = {}
+        for dataframe_class in dataframe_classes:
+            try:
+                dataframes[dataframe_class] = dataframe_class.from_file(columns=columns.get(dataframe_class))
+            except Exception:
+                logging.exception(f"loading of {dataframe_class.__name__} failed")
+        return dataframes
+
+    def publish_bundle(self) -> None:
+        bundle = DatasetBundle(StorageBackend.from_environment())
+        bundle.write([dataframe_class._filename for dataframe_class in self.dataframe_classes],
+                     {"daily_figures": self.daily_figures})
@@ -0,0 +1,224 @@
+import hashlib
+import json
+import os
+import threading
+import time
+
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Dict, List, Set, Tuple
+
+from data_pandas_subclasses.CoronaBase import CoronaBaseDataFrame
+from data_pandas_subclasses.date_index_classes.CoronaCasesAndDeaths import CoronaCasesAndDeathsDataFrame
+from data_pandas_subclasses.date_index_classes.IntensiveRegister import IntensiveRegisterDataFrame
+from data_pandas_subclasses.date_index_classes.NowcastRKI import NowcastRKIDataFrame
+from data_pandas_subclasses.storage.DatasetBundle import DatasetBundle
+from data_pandas_subclasses.storage.DatasetManifest import DatasetManifest
+from data_pandas_subclasses.storage.FileFormat import CSVFileFormat, FileFormat
+from data_pandas_subclasses.storage.StorageBackend import StorageBackend
+from layout.DailyFigures import DailyFigures
+from layout.DailyFiguresDict import DailyFiguresDict
+from layout.DashboardData import DashboardData
+
+logging.basicConfig(level=logging.INFO)
+
+
+class DatasetRegistry:
+    """Datasets of the dashboard kept in memory with the version of their source."""
+
+    def __init__(self, columns: Dict[type, List[str]] = None):
+        if columns is None:
+            columns = {}
+        self.columns = columns
+        self.dataframes: Dict[type, CoronaBaseDataFrame] = {}
+        self.versions: Dict[type, str] = {}
+        self.daily_figures: DailyFiguresDict = None
+        self.daily_figures_versions: Dict[str, str] = None
+        self.bundle_version = None
+        self.load_timeout = float(os.environ.get('DATASET_LOAD_TIMEOUT', 30))
+        self.retry_interval = float(os.environ.get('DATASET_RETRY_INTERVAL', 3600))
+        self._pending_loads: Dict[type, Tuple[str, Future]] = {}
+        # version and time of the last failed load by dataframe class
+        self._failed_loads: Dict[type, Tuple[str, float]] = {}
+        self._executor = ThreadPoolExecutor(max_workers=len(DashboardData.dataframe_classes))
+        self._lock = threading.Lock()
+
+    def refresh(self) -> Set[type]:
+        """Reloads the changed datasets and returns their dataframe classes."""
+        with self._lock:
+            logging.info("START REFRESHING OF DATAFRAMES")
+            start_time = time.time()
+
+            storage = StorageBackend.from_environment()
+            bundle = DatasetBundle(storage)
+            bundle_version = None
+            if os.environ.get('USE_DASHBOARD_BUNDLE', 'true').lower() == 'true':
+                bundle_version = storage.version(bundle.filename)
+
+            if bundle_version is not None:
+                changed_classes = self._refresh_from_bundle(bundle, bundle_version)
+            else:
+                changed_classes = self._refresh_from_files(storage)
+
+            end_time = time.time()
+            logging.info(f"FINISHED REFRESHING OF DATAFRAMES IN {end_time - start_time} SECONDS, "
+                         f"{len(changed_classes)} OF {len(DashboardData.dataframe_classes)} DATAFRAMES CHANGED")
+            return changed_classes
+
+    def dashboard_data(self) -> DashboardData:
+        """Returns the loaded datasets together with a version which changes whenever one of them changes."""
+        with self._lock:
+            versions = sorted((dataframe_class.__name__, version) for dataframe_class, version in self.versions.items())
+            version = hashlib.sha256(json.dumps(versions).encode('utf-8')).hexdigest()[:16]
+            return DashboardData(dict(self.dataframes), self.daily_figures, version)
+
+    @staticmethod
+    def file_versions(storage: StorageBackend) -> Dict[type, str]:
+        """Returns the version of every dataset of the dashboard in the manifest or of its file, falling back to its csv
+        file as long as the dataset was not saved in the configured file format."""
+        file_format = FileFormat.from_name()
+        published_versions = DatasetManifest(storage).dataset_versions()
+
+        versions = {}
+        for dataframe_class in DashboardData.dataframe_classes:
+            versions[dataframe_class] = None
+            for key in dict.fromkeys([file_format.filename(dataframe_class._filename),
+                                      CSVFileFormat().filename(dataframe_class._filename)]):
+                if key in published_versions:
+                    versions[dataframe_class] = published_versions[key]
+                else:
+                    versions[dataframe_class] = storage.version(key)
+                if versions[dataframe_class] is not None:
+                    break
+        return versions
+
+    def _refresh_from_files(self, storage: StorageBackend) -> Set[type]:
+        versions = self.file_versions(storage)
+        changed_classes = self._load_dataframes(self._changed_classes(versions), versions)
+        self.bundle_version = None
+        self._refresh_daily_figures(storage)
+        return set(changed_classes)
+
+    def _refresh_daily_figures(self, storage: StorageBackend) -> None:
+        """Uses the daily figures stored for the loaded datasets, or calculates them."""
+        versions = DailyFigures.source_versions(self.versions)
+        if (self.daily_figures is not None) and (versions == self.daily_figures_versions) \
+                and (None not in versions.values()):
+            return
+
+        daily_figures = DailyFigures.read(storage, versions)
+        if daily_figures is not None:
+            logging.info(f"use daily figures of {storage.location(DailyFigures.filename)}")
+        else:
+            try:
+                daily_figures = DailyFigures.calculate(self.dataframes[CoronaCasesAndDeathsDataFrame],
+                                                       self.dataframes[NowcastRKIDataFrame],
+                                                       self.dataframes[IntensiveRegisterDataFrame])
+            except Exception:
+                logging.exception("calculation of daily figures failed, keep previous daily figures")
+                return
+        self.daily_figures = daily_figures
+        self.daily_figures_versions = versions
+
+    def _load_dataframes(self, dataframe_classes: List[type], versions: Dict[type, str]) -> List[type]:
+        """Returns the loaded dataframe classes, waiting only for the loads started by this refresh. A failed version of
+        a dataset is loaded again after the retry interval."""
+        started_loads = []
+        for dataframe_class in dataframe_classes:
+            failed_load = self._failed_loads.get(dataframe_class)
+            if (failed_load is not None) and (failed_load[0] == versions[dataframe_class]) \
+                    and (time.time() - failed_load[1] < self.retry_interval):
+                continue
+
+            pending_load = self._pending_loads.get(dataframe_class)
+            if (pending_load is None) or (pending_load[0] != versions[dataframe_class]):
+                future = self._executor.submit(self._load_dataframe, dataframe_class)
+                self._pending_loads[dataframe_class] = (versions[dataframe_class], future)
+                started_loads.append(future)
+
+        wait(started_loads, timeout=self.load_timeout)
+
+        loaded_classes = []
+        for dataframe_class in dataframe_classes:
+            if dataframe_class not in self._pending_loads:
+                continue
+            version, future = self._pending_loads[dataframe_class]
+            if not future.done():
+                logging.info(f"{dataframe_class.__name__} not loaded within {self.load_timeout} seconds, "
+                             f"keep previous version")
+                continue
+
+            del self._pending_loads[dataframe_class]
+            try:
+                self.dataframes[dataframe_class] = future.result()
+            except Exception as error:
+                failed_load = self._failed_loads.get(dataframe_class)
+                if (failed_load is not None) and (failed_load[0] == version):
+                    logging.info(f"loading of {dataframe_class.__name__} failed again with {error!r}, "
+                                 f"retry in {self.retry_interval} seconds")
+                else:
+                    logging.exception(f"loading of {dataframe_class.__name__} failed, keep previous version, "
+                                      f"retry in {self.retry_interval} seconds")
+                self._failed_loads[dataframe_class] = (version, time.time())
+                continue
+            self._failed_loads.pop(dataframe_class, None)
+            self.versions[dataframe_class] = version
+            loaded_classes.append(dataframe_class)
+        return loaded_classes
+
+    def _load_dataframe(self, dataframe_class: type) -> CoronaBaseDataFrame:
+        start_time = time.time()
+        df = dataframe_class.from_file(columns=self.columns.get(dataframe_class))
+        end_time = time.time()
+        logging.info(f"{dataframe_class.__name__} loaded in {end_time - start_time} seconds")
+        return df
+
+    def _refresh_from_bundle(self, bundle: DatasetBundle, bundle_version: str) -> Set[type]:
+        if bundle_version == self.bundle_version:
+            return set()
+
+        try:
+            files, manifest, values = bundle.read()
+        except Exception:
+            logging.exception("loading of bundle failed, load the datasets from their files")
+            return self._refresh_from_files(bundle.storage)
+        file_format = FileFormat.from_name()
+
+        if any(file_format.filename(dataframe_class._filename) not in files
+               for dataframe_class in DashboardData.dataframe_classes):
+            logging.info("bundle does not contain all datasets, load them from their files")
+            return self._refresh_from_files(bundle.storage)
+
+        logging.info(f"use bundle of version {manifest['version']} published at {manifest['published']}")
+        versions = {dataframe_class: hashlib.sha256(files[file_format.filename(dataframe_class._filename)]).hexdigest()
+                    for dataframe_class in DashboardData.dataframe_classes}
+
+        changed_classes = []
+        for dataframe_class in self._changed_classes(versions):
+            start_time = time.time()
+            try:
+                self.dataframes[dataframe_class] = dataframe_class.from_bytes(
+                    files[file_format.filename(dataframe_class._filename)],
+                    file_format.name,
+                    self.columns.get(dataframe_class))
+            except Exception:
+                logging.exception(f"loading of {dataframe_class.__name__} from bundle failed, keep previous version")
+                continue
+            end_time = time.time()
+            logging.info(f"{dataframe_class.__name__} loaded from bundle in {end_time - start_time} seconds")
+            self.versions[dataframe_class] = versions[dataframe_class]
+            changed_classes.append(dataframe_class)
+        self.bundle_version = bundle_version
+        if values["daily_figures"] is None:
+            # the updater could not calculate the daily figures when it published the bundle
+            self._refresh_daily_figures(bundle.storage)
+        else:
+            self.daily_figures = values["daily_figures"]
+            self.daily_figures_versions = None
+        return set(changed_classes)
+
+    def _changed_classes(self, versions: Dict[type, str]) -> List[type]:
+        return [dataframe_class for dataframe_class in DashboardData.dataframe_classes
+                if (dataframe_class not in self.dataframes)
+                or (versions[dataframe_class] is None)
+                or (versions[dataframe_class] != self.versions.get(dataframe_class))]
@@ -0,0 +1,114 @@
+import datetime as dt
+import gzip
+import hashlib
+import json
+import os
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Set, Tuple
+
+from plotly.graph_objects import Figure
+
+from data_pandas_subclasses.storage.DatasetManifest import DatasetManifest
+from data_pandas_subclasses.storage.StorageBackend import StorageBackend
+from layout.DailyFiguresDict import DailyFiguresDict
+
+logging.basicConfig(level=logging.INFO)
+
+
+class FigureArtifacts:
+    """Figures of the dashboard rendered by update_data.py and stored as compressed plotly JSON."""
+
+    folder = "figures/"
+    index_filename = "figures/index.json"
+
+    def __init__(self, storage: StorageBackend):
+        self.storage = storage
+        self.keys: Dict[str, str] = {}
+        self.index_version = None
+        self.manifest_version = None
+        # figures, daily figures and their version, replaced as a whole so that threads never see a mix of two indices
+        self.snapshot: Tuple[Dict[str, dict], DailyFiguresDict, str] = ({}, None, None)
+        self._lock = threading.Lock()
+
+    def exists(self) -> bool:
+        return self.storage.exists(self.index_filename)
+
+    def write(self, figures: Dict[str, Figure], daily_figures: DailyFiguresDict, manifest_version: str) -> None:
+        """Writes the changed figures and afterwards the index with the manifest version they were built from."""
+        previous_index = self._load_index()
+        previous_keys = set(previous_index["figures"].values())
+
+        objects = {}
+        for graph_id, fig in figures.items():
+            data = gzip.compress(fig.to_json().encode('utf-8'), mtime=0)
+            objects[graph_id] = (f"{self.folder}{graph_id}/{hashlib.sha256(data).hexdigest()}.json.gz", data)
+        changed_objects = [(key, data) for key, data in objects.values() if key not in previous_keys]
+
+        logging.info(f"try writing {len(changed_objects)} of {len(objects)} figures to "
+                     f"{self.storage.location(self.folder)}")
+        with ThreadPoolExecutor(max_workers=int(os.environ.get('TRANSFER_WORKERS', 16))) as executor:
+            list(executor.map(lambda key_and_data: self.storage.write(*key_and_data), changed_objects))
+
+        index = {"published": dt.datetime.now().isoformat(),
+                 "manifest_version": manifest_version,
+                 "figures": {graph_id: key for graph_id, (key, _) in objects.items()},
+                 "daily_figures": daily_figures}
+        self.storage.write(self.index_filename, json.dumps(index, indent=2, default=float).encode('utf-8'))
+        logging.info(f"figures have been written to {self.storage.location(self.folder)}")
+
+        self._collect_garbage(previous_keys | set(index["figures"].values()))
+
+    def refresh(self) -> Optional[Tuple[Dict[str, dict], DailyFiguresDict, str]]:
+        """Loads the figures which changed since the last refresh and returns the figures, daily figures and version,
+        or None if they were not built from the published manifest."""
+        with self._lock:
+            index_version = self.storage.version(self.index_filename)
+            if (index_version is None) or (index_version != self.index_version):
+                self._load(index_version)
+
+            manifest_version = DatasetManifest(self.storage).version()
+            if self.manifest_version != manifest_version:
+                logging.info(f"figures were built from manifest version {self.manifest_version}, "
+                             f"but version {manifest_version} is published")
+                return None
+            return self.snapshot
+
+    def _load(self, index_version: str) -> None:
+        index = self._load_index()
+        figures, _, _ = self.snapshot
+        changed_graph_ids = [graph_id for graph_id, key in index["figures"].items() if self.keys.get(graph_id) != key]
+        logging.info(f"load {len(changed_graph_ids)} changed figures published at {index['published']}")
+
+        changed_figures = {}
+        if len(changed_graph_ids) > 0:
+            with ThreadPoolExecutor(max_workers=len(changed_graph_ids)) as executor:
+                changed_figures = dict(zip(changed_graph_ids,
+                                           executor.map(lambda graph_id: self._read_figure(index["figures"][graph_id]),
+                                                        changed_graph_ids)))
+
+        version = hashlib.sha256(json.dumps([sorted(index["figures"].values()), index["daily_figures"]], default=float)
+                                 .encode('utf-8')).hexdigest()[:16]
+        self.snapshot = ({graph_id: changed_figures[graph_id] if graph_id in changed_figures else figures[graph_id]
+                          for graph_id in index["figures"]},
+                         index["daily_figures"],
+                         version)
+        self.keys = dict(index["figures"])
+        self.manifest_version = index.get("manifest_version")
+        self.index_version = index_version
+
+    def _read_figure(self, key: str) -> dict:
+        return json.loads(gzip.decompress(self.storage.read(key)))
+
+    def _load_index(self) -> dict:
+        if not self.storage.exists(self.index_filename):
+            return {"published": None, "manifest_version": None, "figures": {}, "daily_figures": None}
+        return json.loads(self.storage.read(self.index_filename))
+
+    def _collect_garbage(self, referenced_keys: Set[str]) -> None:
+        """Deletes the figures referenced neither by the current nor by the previous index."""
+        for key in self.storage.list_keys(self.folder):
+            if (key != self.index_filename) and (key not in referenced_keys):
+                self.storage.delete(key)
@@ -0,0 +1,168 @@
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+from plotly.graph_objects import Figure
+
+
+class FigureDownsampling:
+    """Downsampling of the line traces of a figure with the largest-triangle-three-buckets algorithm."""
+
+    trace_types = ["scatter", "scattergl"]
+    # keys of a trace with one value per point
+    point_keys = ["x", "y", "customdata", "text", "hovertext"]
+
+    @staticmethod
+    def downsample(fig: Union[Figure, dict],
+                   max_points: int,
+                   min_points_per_trace: int = 100,
+                   axis_ranges: Dict[str, list] = None) -> dict:
+        """Returns the figure as dict with its line traces downsampled within the given x axis ranges."""
+        if isinstance(fig, Figure):
+            fig = fig.to_plotly_json()
+        if axis_ranges is None:
+            axis_ranges = {}
+
+        traces = fig.get("data", [])
+        line_traces = [trace for trace in traces if trace.get("type", "scatter") in FigureDownsampling.trace_types]
+        if (max_points > 0) and (len(line_traces) > 0):
+            points_per_trace = max(min_points_per_trace, max_points // len(line_traces))
+        else:
+            points_per_trace = None
+
+        data = []
+        for trace in traces:
+            x_range = axis_ranges.get(FigureDownsampling._axis_name(trace.get("xaxis", "x")))
+            if (trace.get("type", "scatter") in FigureDownsampling.trace_types) \
+                    and ((points_per_trace is not None) or (x_range is not None)):
+                trace = FigureDownsampling._downsample_trace(trace, points_per_trace, x_range)
+            data.append(trace)
+
+        layout = dict(fig.get("layout", {}))
+        # keeps hidden traces and the zoom of the user when the figure is replaced by a callback
+        layout["uirevision"] = "downsampled"
+        for axis_name, axis_range in axis_ranges.items():
+            layout[axis_name] = {**layout.get(axis_name, {}), "range": axis_range, "autorange": False}
+        return {**fig, "data": data, "layout": layout}
+
+    @staticmethod
+    def axis_ranges(relayout_data: Optional[dict]) -> Optional[Dict[str, list]]:
+        """Returns the zoomed ranges of relayoutData, {} on reset or None if the x axes did not change."""
+        if relayout_data is None:
+            return None
+
+        axis_ranges = {}
+        x_axes_reset = False
+        for key, value in relayout_data.items():
+            axis_name = key.split(".")[0]
+            if key.endswith(".range[0]") or key.endswith(".range[1]"):
+                axis_ranges.setdefault(axis_name, [None, None])[int(key[-2])] = value
+            elif key.endswith(".range"):
+                axis_ranges[axis_name] = list(value)
+            elif key.endswith(".autorange") and axis_name.startswith("xaxis"):
+                x_axes_reset = True
+
+        if any(axis_name.startswith("xaxis") for axis_name in axis_ranges):
+            return {axis_name: axis_range for axis_name, axis_range in axis_ranges.items() if None not in axis_range}
+        if x_axes_reset:
+            return {}
+        return None
+
+    @staticmethod
+    def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+        """Returns the indices of the points selected by largest-triangle-three-buckets."""
+        n = len(x)
+        if (n_out >= n) or (n_out < 3):
+            return np.arange(n)
+
+        bucket_starts = np.linspace(1, n - 1, n_out - 1).astype(int)
+        bucket_ends = np.append(bucket_starts[1:], n)
+        indices = np.empty(n_out, dtype=int)
+        indices[0] = 0
+        indices[-1] = n - 1
+
+        selected = 0
+        for bucket in range(n_out - 2):
+            start, end = bucket_starts[bucket], bucket_ends[bucket]
+            next_start, next_end = bucket_ends[bucket], bucket_ends[bucket + 1]
+            next_x = x[next_start:next_end].mean()
+            next_y = y[next_start:next_end].mean()
+            areas = np.abs((x[selected] - next_x) * (y[start:end] - y[selected])
+                           - (x[selected] - x[start:end]) * (next_y - y[selected]))
+            selected = start + int(np.argmax(areas))
+            indices[bucket + 1] = selected
+        return indices
+
+    @staticmethod
+    def _downsample_trace(trace: dict, points_per_trace: Optional[int], x_range: Optional[list]) -> dict:
+        n = len(trace.get("x", []))
+        try:
+            x = FigureDownsampling._numeric(trace["x"])
+            y = np.asarray(trace["y"], dtype=float)
+        except (KeyError, TypeError, ValueError):
+            return trace
+        if len(y) != n:
+            return trace
+
+        # the range of a category axis is given by the positions of the categories instead of their values
+        if (x_range is not None) and (FigureDownsampling._is_numeric(trace["x"])
+                                      != FigureDownsampling._is_numeric(x_range)):
+            x_range = None
+
+        indices = np.arange(n)
+        if x_range is not None:
+            indices = FigureDownsampling._indices_in_range(x, x_range)
+        if (points_per_trace is not None) and (len(indices) > points_per_trace):
+            indices = FigureDownsampling._lttb_indices_with_gaps(x, y, indices, points_per_trace)
+        if len(indices) == n:
+            return trace
+
+        trace = dict(trace)
+        for key in FigureDownsampling.point_keys:
+            values = trace.get(key)
+            if (values is not None) and (not isinstance(values, str)) and (len(values) == n):
+                trace[key] = FigureDownsampling._take(values, indices)
+        return trace
+
+    @staticmethod
+    def _lttb_indices_with_gaps(x: np.ndarray, y: np.ndarray, indices: np.ndarray, n_out: int) -> np.ndarray:
+        """Keeps the first missing value after each selected point, so gaps of the line stay visible."""
+        valid = ~(np.isnan(x[indices]) | np.isnan(y[indices]))
+        valid_indices = indices[valid]
+        gap_starts = indices[1:][~valid[1:] & valid[:-1]]
+
+        selected = valid_indices[FigureDownsampling.lttb_indices(x[valid_indices], y[valid_indices], n_out)]
+        return np.sort(np.concatenate([selected, gap_starts]))
+
+    @staticmethod
+    def _indices_in_range(x: np.ndarray, x_range: list) -> np.ndarray:
+        """Returns the indices within the range and of the next point outside of it on both sides."""
+        lower, upper = FigureDownsampling._numeric(x_range)
+        in_range = np.flatnonzero((x >= lower) & (x <= upper))
+        if len(in_range) == 0:
+            return in_range
+        return np.arange(max(in_range[0] - 1, 0), min(in_range[-1] + 2, len(x)))
+
+    @staticmethod
+    def _is_numeric(values: Sequence) -> bool:
+        return np.issubdtype(np.asarray(values).dtype, np.number)
+
+    @staticmethod
+    def _numeric(values: Sequence) -> np.ndarray:
+        """Returns numbers as floats and dates as nanoseconds since the epoch."""
+        values = np.asarray(values)
+        if np.issubdtype(values.dtype, np.number):
+            return values.astype(float)
+        dates = pd.to_datetime(pd.Series(values))
+        return np.where(dates.isna(), np.nan, dates.values.astype("datetime64[ns]").astype("int64").astype(float))
+
+    @staticmethod
+    def _take(values: Sequence, indices: np.ndarray) -> Union[np.ndarray, List]:
+        if isinstance(values, np.ndarray):
+            return values[indices]
+        return [values[index] for index in indices]
+
+    @staticmethod
+    def _axis_name(axis_reference: str) -> str:
+        """Returns the name of the axis in the layout for the reference of a trace, e.g. xaxis2 for x2."""
+        return axis_reference.replace("x", "xaxis", 1).replace("y", "yaxis", 1)
@@ -0,0 +1,74 @@
+import configparser
+import json
+
+from types import MappingProxyType
+from typing import Mapping, NamedTuple, Optional, Tuple
+
+from layout.RenderMode import RenderMode
+
+
+class FigureSpec(NamedTuple):
+    """Settings of a figure or a subfigure compiled from its section of graph_definitions.ini."""
+
+    section: str
+    x: Optional[str] = None
+    y: Tuple[str, ...] = ()
+    color_discrete_map: Mapping[str, str] = MappingProxyType({})
+    labels: Mapping[str, str] = MappingProxyType({})
+    title: Optional[str] = None
+    xaxis_title: Optional[str] = None
+    yaxis_title: Optional[str] = None
+    yaxis_tickformat: Optional[str] = None
+    yaxis: Mapping = MappingProxyType({})
+    barmode: Optional[str] = None
+    hover_data: Tuple[str, ...] = ()
+    hover_data_strftime: Optional[str] = None
+    hover_data_format_column: Optional[str] = None
+    hover_data_format: Optional[str] = None
+    max_points: Optional[int] = None
+    render_mode: Optional[str] = None
+
+    # keys with a JSON list of column names and keys with a JSON object
+    list_keys = ["y", "hover_data"]
+    mapping_keys = ["color_discrete_map", "labels", "yaxis"]
+    int_keys = ["max_points"]
+
+    @staticmethod
+    def from_section(config: configparser.ConfigParser, section: str) -> 'FigureSpec':
+        """Compiles the section and raises a ValueError naming the section and the key of an invalid setting."""
+        values = {}
+        for key, value in config[section].items():
+            if key not in FigureSpec._fields or key == "section":
+                raise ValueError(f"unknown key {key} in section {section} of graph definitions")
+            try:
+                values[key] = FigureSpec._parse(key, value)
+            except ValueError as error:
+                raise ValueError(f"invalid value of {key} in section {section} of graph definitions: {error}") \
+                    from error
+
+        spec = FigureSpec(section=section, **values)
+        if spec.hover_data_format is not None:
+            try:
+                format(0, spec.hover_data_format)
+            except ValueError as error:
+                raise ValueError(f"invalid hover_data_format in section {section} of graph definitions: {error}") \
+                    from error
+        return spec
+
+    @staticmethod
+    def _parse(key: str, value: str):
+        if key in FigureSpec.list_keys:
+            parsed = json.loads(value)
+            if not isinstance(parsed, list) or not all(isinstance(column, str) for column in parsed):
+                raise ValueError("expected a list of column names")
+            return tuple(parsed)
+        if key in FigureSpec.mapping_keys:
+            parsed = json.loads(value)
+            if not isinstance(parsed, dict):
+                raise ValueError("expected an object")
+            return MappingProxyType(parsed)
+        if key in FigureSpec.int_keys:
+            return int(value)
+        if key == "render_mode":
+            return RenderMode.parse(value)
+        return value
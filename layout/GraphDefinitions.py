@@ -0,0 +1,70 @@
+import configparser
+import json
+
+from types import MappingProxyType
+from typing import Dict, Mapping
+
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from layout.FigureSpec import FigureSpec
+from layout.RenderMode import RenderMode
+
+
+class GraphDefinitions:
+    """graph_definitions.ini compiled once into the specs of all figures and a shared plotly template."""
+
+    shared_section = "ALL_FIGS"
+
+    def __init__(self,
+                 specs: Dict[str, FigureSpec],
+                 template: go.layout.Template,
+                 legend: Mapping,
+                 render_mode: str,
+                 webgl_threshold: int,
+                 max_points: int,
+                 min_points_per_trace: int):
+        self.specs = MappingProxyType(specs)
+        self.template = template
+        self.legend = legend
+        self.render_mode = render_mode
+        self.webgl_threshold = webgl_threshold
+        self.max_points = max_points
+        self.min_points_per_trace = min_points_per_trace
+
+    def __getitem__(self, section: str) -> FigureSpec:
+        return self.specs[section]
+
+    def get(self, section: str) -> FigureSpec:
+        return self.specs.get(section)
+
+    @staticmethod
+    def from_file(filename: str = 'layout/graph_definitions.ini') -> 'GraphDefinitions':
+        config = configparser.ConfigParser(interpolation=None)
+        if len(config.read(filename)) == 0:
+            raise ValueError(f"graph definitions {filename} not found")
+        return GraphDefinitions.from_config(config)
+
+    @staticmethod
+    def from_config(config: configparser.ConfigParser) -> 'GraphDefinitions':
+        if not config.has_section(GraphDefinitions.shared_section):
+            raise ValueError(f"section {GraphDefinitions.shared_section} missing in graph definitions")
+        shared = config[GraphDefinitions.shared_section]
+
+        try:
+            template = go.layout.Template(pio.templates["plotly"])
+            template.layout.update(font_family=shared["font_family"],
+                                   font_color=shared["font_color"],
+                                   plot_bgcolor=shared["plot_bgcolor"],
+                                   paper_bgcolor=shared["paper_bgcolor"])
+            legend = MappingProxyType(json.loads(shared["legend"]))
+            render_mode = RenderMode.parse(shared["render_mode"])
+            webgl_threshold = int(shared["webgl_threshold"])
+            max_points = int(shared["max_points"])
+            min_points_per_trace = int(shared["min_points_per_trace"])
+        except (KeyError, ValueError) as error:
+            raise ValueError(f"invalid section {GraphDefinitions.shared_section} of graph definitions: {error}") from error
+
+        specs = {section: FigureSpec.from_section(config, section)
+                 for section in config.sections() if section != GraphDefinitions.shared_section}
+        return GraphDefinitions(specs, template, legend, render_mode, webgl_threshold, max_points, min_points_per_trace)
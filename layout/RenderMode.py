@@ -0,0 +1,35 @@
+from layout.FigureDownsampling import FigureDownsampling
+
+
+class RenderMode:
+    """Render mode of the line traces of a figure, auto chooses WebGL above a number of points."""
+
+    trace_types = {"svg": "scatter", "webgl": "scattergl"}
+    render_modes = ["svg", "webgl", "auto"]
+
+    @staticmethod
+    def parse(value: str) -> str:
+        """Returns the render mode of a setting in graph_definitions.ini, which may be quoted."""
+        render_mode = value.strip().strip('"')
+        if render_mode not in RenderMode.render_modes:
+            raise ValueError(f"unknown render mode {value}, choose one of {RenderMode.render_modes}")
+        return render_mode
+
+    @staticmethod
+    def apply(fig: dict, render_mode: str, webgl_threshold: int) -> dict:
+        if render_mode == "auto":
+            render_mode = "webgl" if RenderMode.number_of_points(fig) > webgl_threshold else "svg"
+        if render_mode not in RenderMode.trace_types:
+            raise ValueError(f"unknown render mode {render_mode}")
+
+        data = [{**trace, "type": RenderMode.trace_types[render_mode]} if RenderMode._is_line_trace(trace) else trace
+                for trace in fig.get("data", [])]
+        return {**fig, "data": data}
+
+    @staticmethod
+    def number_of_points(fig: dict) -> int:
+        return sum(len(trace.get("x", [])) for trace in fig.get("data", []) if RenderMode._is_line_trace(trace))
+
+    @staticmethod
+    def _is_line_trace(trace: dict) -> bool:
+        return trace.get("type", "scatter") in FigureDownsampling.trace_types
@@ -0,0 +1,87 @@
+from typing import Dict, List
+
+from data_pandas_subclasses.date_index_classes.CoronaCasesAndDeaths import CoronaCasesAndDeathsDataFrame
+from data_pandas_subclasses.date_index_classes.NowcastRKI import NowcastRKIDataFrame
+from data_pandas_subclasses.AgeDistribution import AgeDistributionDataFrame
+from data_pandas_subclasses.week_index_classes.ClinicalAspects import ClinicalAspectsDataFrame
+from data_pandas_subclasses.week_index_classes.CasesPerOutbreak import CasesPerOutbreakDataFrame
+from data_pandas_subclasses.week_index_classes.DeathsByWeekOfDeathAndAgeGroup import \
+    DeathsByWeekOfDeathAndAgeGroupDataFrame
+from data_pandas_subclasses.date_index_classes.IntensiveRegister import IntensiveRegisterDataFrame
+from data_pandas_subclasses.week_index_classes.NumberPCRTests import NumberPCRTestsDataFrame
+from data_pandas_subclasses.week_index_classes.MedianAndMeanAges import MedianAndMeanAgesDataFrame
+from layout.DailyFigures import DailyFigures
+from layout.GraphDefinitions import GraphDefinitions
+
+
+class RequiredColumns:
+    """Columns of every dataset which are shown by the dashboard."""
+
+    # the figures built with cases and deaths are combined with the nowcast, so their sections apply to both datasets
+    cases_and_nowcast_sections = ["FIG_NEW_DEATHS_PER_REFDATE",
+                                  "FIG_NEW_CASES_BY_REPORTING_DATE",
+                                  "FIG_CASES_MEAN_3",
+                                  "FIG_CASES_MEAN_3_SUBFIG",
+                                  "FIG_CASES_MEAN_3_SUBFIG_2",
+                                  "FIG_TOTAL_CASES_PER_REFDATE",
+                                  "FIG_DEATHS_MEAN_3",
+                                  "FIG_DEATHS_MEAN_3_SUBFIG",
+                                  "FIG_DEATHS_MEAN_3_SUBFIG_2",
+                                  "FIG_TOTAL_DEATHS_PER_REFDATE",
+                                  "FIG_R_VALUE",
+                                  "FIG_7D_INCIDENCES"]
+
+    graph_sections = {
+        CoronaCasesAndDeathsDataFrame: cases_and_nowcast_sections,
+        NowcastRKIDataFrame: cases_and_nowcast_sections,
+        NumberPCRTestsDataFrame: ["FIG_PCR_TESTS",
+                                  "SUBFIG_PCR_TESTS_POSITIVE_RATE"],
+        IntensiveRegisterDataFrame: ["FIG_INTENSIVE_REPORTING_AREAS",
+                                     "FIG_INTENSIVE_NEW",
+                                     "FIG_INTENSIVE_R_VALUE",
+                                     "FIG_INTENSIVE_DAILY_CHANGE",
+                                     "FIG_INTENSIVE_CARE_VENTILATED",
+                                     "SUBFIG_INTENSIVE_CARE_VENTILATED_PERCENTAGE",
+                                     "FIG_INTENSIVE_BEDS",
+                                     "FIG_INTENSIVE_BEDS_COUNT",
+                                     "FIG_INTENSIVE_BEDS_PROP"],
+        ClinicalAspectsDataFrame: ["FIG_CLINICAL_ASPECTS",
+                                   "FIG_HOSPITALIZATIONS"],
+        MedianAndMeanAgesDataFrame: ["FIG_MEDIAN_AGES",
+                                     "FIG_MEAN_AGES"],
+        AgeDistributionDataFrame: ["FIG_DISTRIBUTION_OF_INHABITANTS",
+                                   "SUBFIG_DISTRIBUTION_OF_DEATHS",
+                                   "FIG_DISTRIBUTION_OF_CASES_PER_N_INHABITANTS",
+                                   "SUBFIG_DISTRIBUTION_OF_DEATHS_PER_N_INHABITANTS",
+                                   "SUBFIG_DISTRIBUTION_OF_CASES"],
+        CasesPerOutbreakDataFrame: ["FIG_CASES_PER_OUTBREAK",
+                                    "FIG_CASES_PER_OUTBREAK_IN_PERCENT"],
+        DeathsByWeekOfDeathAndAgeGroupDataFrame: ["FIG_DEATHS_BY_WEEK_OF_DEATH_AND_AGE_GROUP",
+                                                  "FIG_DEATHS_BY_WEEK_OF_DEATH_AND_AGE_GROUP_IN_PERCENT"]
+    }
+
+    # settings of a figure spec with a single column name and with a list of column names
+    column_keys = ["x", "hover_data_format_column", "hover_data_strftime"]
+    column_list_keys = ["y", "hover_data"]
+
+    @staticmethod
+    def from_graph_definitions(specs: GraphDefinitions) -> Dict[type, List[str]]:
+        """Returns the required columns by dataframe class, including the index column."""
+        required_columns = {}
+        for dataframe_class, sections in RequiredColumns.graph_sections.items():
+            columns = list(DailyFigures.required_columns.get(dataframe_class, []))
+            for section in sections:
+                columns += RequiredColumns._columns_of_section(specs, section)
+            required_columns[dataframe_class] = list(dict.fromkeys(columns))
+        return required_columns
+
+    @staticmethod
+    def _columns_of_section(specs: GraphDefinitions, section: str) -> List[str]:
+        spec = specs.get(section)
+        if spec is None:
+            return []
+
+        columns = [getattr(spec, key) for key in RequiredColumns.column_keys if getattr(spec, key) is not None]
+        for key in RequiredColumns.column_list_keys:
+            columns += getattr(spec, key)
+        return columns
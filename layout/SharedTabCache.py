@@ -0,0 +1,56 @@
+import json
+import os
+import tempfile
+import zlib
+
+import logging
+from typing import Optional, Union
+
+from flask_caching import Cache
+from plotly.utils import PlotlyJSONEncoder
+
+logging.basicConfig(level=logging.INFO)
+
+
+class SharedTabCache:
+    """Rendered tabs and variant figures shared by all workers, stored by the version of their data."""
+
+    key_prefix = "tab-content"
+
+    def __init__(self, cache: Cache):
+        self.cache = cache
+
+    @staticmethod
+    def config_from_environment() -> dict:
+        return {
+            'CACHE_TYPE': os.environ.get('CACHE_TYPE', 'FileSystemCache'),
+            'CACHE_DIR': os.environ.get('CACHE_DIR',
+                                        os.path.join(tempfile.gettempdir(), 'covid19-monitor-germany-cache')),
+            'CACHE_REDIS_URL': os.environ.get('CACHE_REDIS_URL', 'redis://localhost:6379/0'),
+            'CACHE_KEY_PREFIX': 'covid19-monitor-germany/',
+            'CACHE_DEFAULT_TIMEOUT': int(os.environ.get('CACHE_DEFAULT_TIMEOUT', 86400)),
+            'CACHE_THRESHOLD': int(os.environ.get('CACHE_THRESHOLD', 500))
+        }
+
+    def get(self, tab_id: str, data_version: str) -> Optional[Union[list, dict]]:
+        """Returns the cached content or None, also if the backend is unavailable."""
+        try:
+            data = self.cache.get(self._key(tab_id, data_version))
+        except Exception:
+            logging.exception(f"reading content of {tab_id} from shared cache failed")
+            return None
+        if data is None:
+            return None
+        return json.loads(zlib.decompress(data))
+
+    def set(self, tab_id: str, data_version: str, content: Union[list, dict]) -> None:
+        data = zlib.compress(json.dumps(content, cls=PlotlyJSONEncoder, separators=(',', ':')).encode('utf-8'))
+        try:
+            self.cache.set(self._key(tab_id, data_version), data)
+        except Exception:
+            logging.exception(f"writing content of {tab_id} to shared cache failed")
+            return
+        logging.info(f"content of {tab_id} stored in shared cache with {len(data)} bytes")
+
+    def _key(self, tab_id: str, data_version: str) -> str:
+        return f"{self.key_prefix}/{data_version}/{tab_id}"
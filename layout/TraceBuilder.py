@@ -0,0 +1,122 @@
+from typing import List, Mapping, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+import plotly.io as pio
+from plotly.graph_objects import Figure
+
+
+class TraceBuilder:
+    """Builds line and bar figures like plotly express, but directly from the columns of the dataframe."""
+
+    variable_label = "variable"
+    value_label = "value"
+
+    @staticmethod
+    def line(df: pd.DataFrame,
+             x: str,
+             y: Sequence[str],
+             color_discrete_map: Optional[Mapping[str, str]] = None,
+             hover_data: Sequence[str] = (),
+             render_mode: str = "svg") -> Figure:
+        return TraceBuilder.figure(TraceBuilder.line_traces(df, x, y, color_discrete_map, hover_data, render_mode),
+                                   TraceBuilder._layout(x))
+
+    @staticmethod
+    def bar(df: pd.DataFrame,
+            x: str,
+            y: Sequence[str],
+            color_discrete_map: Optional[Mapping[str, str]] = None,
+            hover_data: Sequence[str] = ()) -> Figure:
+        return TraceBuilder.figure(TraceBuilder.bar_traces(df, x, y, color_discrete_map, hover_data),
+                                   TraceBuilder._layout(x, barmode="relative"))
+
+    @staticmethod
+    def figure(traces: List[dict], layout: Optional[dict] = None) -> Figure:
+        return Figure(data=traces, layout=layout)
+
+    @staticmethod
+    def line_traces(df: pd.DataFrame,
+                    x: str,
+                    y: Sequence[str],
+                    color_discrete_map: Optional[Mapping[str, str]] = None,
+                    hover_data: Sequence[str] = (),
+                    render_mode: str = "svg",
+                    yaxis: str = "y") -> List[dict]:
+        trace_type = "scattergl" if render_mode == "webgl" else "scatter"
+        return [{"type": trace_type,
+                 "mode": "lines",
+                 "line": {"color": color, "dash": "solid"},
+                 **trace}
+                for trace, color in zip(TraceBuilder._traces(df, x, y, hover_data, yaxis),
+                                        TraceBuilder._colors(y, color_discrete_map))]
+
+    @staticmethod
+    def bar_traces(df: pd.DataFrame,
+                   x: str,
+                   y: Sequence[str],
+                   color_discrete_map: Optional[Mapping[str, str]] = None,
+                   hover_data: Sequence[str] = (),
+                   yaxis: str = "y") -> List[dict]:
+        return [{"type": "bar",
+                 "alignmentgroup": "True",
+                 "offsetgroup": trace["name"],
+                 "marker": {"color": color},
+                 "textposition": "auto",
+                 **trace}
+                for trace, color in zip(TraceBuilder._traces(df, x, y, hover_data, yaxis),
+                                        TraceBuilder._colors(y, color_discrete_map))]
+
+    @staticmethod
+    def _traces(df: pd.DataFrame, x: str, y: Sequence[str], hover_data: Sequence[str], yaxis: str) -> List[dict]:
+        x_values = TraceBuilder._column(df, x)
+        hover_template = "".join(f"<br>{column}=%{{customdata[{i}]}}" for i, column in enumerate(hover_data))
+        traces = []
+        for column in y:
+            trace = {"name": column,
+                     "legendgroup": column,
+                     "showlegend": True,
+                     "orientation": "v",
+                     "x": x_values,
+                     "y": TraceBuilder._column(df, column),
+                     "xaxis": "x",
+                     "yaxis": yaxis,
+                     "hovertemplate": f"{TraceBuilder.variable_label}={column}<br>{x}=%{{x}}"
+                                      f"<br>{TraceBuilder.value_label}=%{{y}}{hover_template}<extra></extra>"}
+            traces.append(trace)
+
+        if len(hover_data) > 0:
+            customdata = np.stack([TraceBuilder._column(df, column) for column in hover_data], axis=-1)
+            for trace in traces:
+                trace["customdata"] = customdata
+        return traces
+
+    @staticmethod
+    def _column(df: pd.DataFrame, column: str) -> np.ndarray:
+        """Returns the values of the column, dates as ISO strings to the second like plotly express."""
+        values = df[column].to_numpy()
+        if np.issubdtype(values.dtype, np.datetime64):
+            dates = np.datetime_as_string(values, unit="s").astype(object)
+            dates[np.isnat(values)] = None
+            return dates
+        return values
+
+    @staticmethod
+    def _colors(y: Sequence[str], color_discrete_map: Optional[Mapping[str, str]]) -> List[str]:
+        """Returns the color of every column, missing colors are taken from the template like in plotly express."""
+        colors = dict(color_discrete_map) if color_discrete_map is not None else {}
+        colorway = pio.templates[pio.templates.default].layout.colorway
+        for column in y:
+            if column not in colors:
+                colors[column] = colorway[len(colors) % len(colorway)]
+        return [colors[column] for column in y]
+
+    @staticmethod
+    def _layout(x: str, barmode: str = None) -> dict:
+        layout = {"xaxis": {"anchor": "y", "domain": [0.0, 1.0], "title": {"text": x}},
+                  "yaxis": {"anchor": "x", "domain": [0.0, 1.0], "title": {"text": TraceBuilder.value_label}},
+                  "legend": {"title": {"text": TraceBuilder.variable_label}, "tracegroupgap": 0},
+                  "margin": {"t": 60}}
+        if barmode is not None:
+            layout["barmode"] = barmode
+        return layout
@@ -1,22 +1,21 @@
 # ------------------------------ CREATE PLOTS ----------------------------------------#
+import functools
+import os
+import threading
 import time
 
 import logging
-from typing import List, TypeVar
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple, TypeVar
 
 import dash_core_components as dcc
 import dash_bootstrap_components as dbc
 import dash_html_components as html
 
-import configparser
-import json
-
-import plotly.express as px
 from plotly.subplots import make_subplots
 from plotly.graph_objects import Figure
 
 import pandas as pd
-import numpy as np
 
 from data_pandas_subclasses.date_index_classes.CoronaCasesAndDeaths import CoronaCasesAndDeathsDataFrame, \
     CoronaCasesAndDeathsSeries
@@ -30,19 +29,180 @@ from data_pandas_subclasses.date_index_classes.IntensiveRegister import Intensiv
 from data_pandas_subclasses.week_index_classes.NumberPCRTests import NumberPCRTestsDataFrame
 from data_pandas_subclasses.week_index_classes.MedianAndMeanAges import MedianAndMeanAgesDataFrame
 from layout.DailyFiguresDict import DailyFiguresDict
+from data_pandas_subclasses.storage.StorageBackend import StorageBackend
+from layout.DashboardData import DashboardData
+from layout.DatasetRegistry import DatasetRegistry
+from layout.FigureArtifacts import FigureArtifacts
+from layout.FigureDownsampling import FigureDownsampling
+from layout.GraphDefinitions import GraphDefinitions
+from layout.RenderMode import RenderMode
+from layout.RequiredColumns import RequiredColumns
+from layout.SharedTabCache import SharedTabCache
+from layout.TraceBuilder import TraceBuilder
 
 logging.basicConfig(level=logging.INFO)
 THtml = TypeVar('THtml', html.H1, html.H2, html.H3, html.H4, html.H5, html.H6, html.Br, html.A, html.Hr, str)
 TNum = TypeVar('TNum', int, float)
 
 
+def figure_of_datasets(figure_method):
+    """Caches the figure by its dataframes and arguments, a figure which cannot be built is a placeholder."""
+
+    @functools.wraps(figure_method)
+    def figure(self, *args, **kwargs):
+        if any(arg is None for arg in args):
+            logging.info(f"dataset of {figure_method.__name__} not available, show placeholder figure")
+            return self._figure_not_available()
+
+        datasets = tuple(arg for arg in args if isinstance(arg, pd.DataFrame))
+        key = (figure_method.__name__,
+               tuple(arg for arg in args if not isinstance(arg, pd.DataFrame)),
+               tuple(sorted(kwargs.items())))
+
+        cached = self._figures.get(key)
+        if (cached is not None) and (len(cached[0]) == len(datasets)) \
+                and all(cached_dataset is dataset for cached_dataset, dataset in zip(cached[0], datasets)):
+            return cached[1]
+
+        try:
+            fig = figure_method(self, *args, **kwargs)
+        except Exception:
+            logging.exception(f"building of {figure_method.__name__} failed, show placeholder figure")
+            return self._figure_not_available()
+        self._figures[key] = (datasets, fig)
+        return fig
+
+    return figure
+
+
 class Layout:
 
-    def __init__(self):
-        self.config = configparser.ConfigParser(interpolation=None)
-        self.config.read('layout/graph_definitions.ini')
+    tab_labels = {'tab-daily-overview': 'Daily Overview',
+                  'tab-corona-cases': 'Corona cases',
+                  'tab-intensive-care': 'Intensive care',
+                  'tab-data-sources-description': 'Data sources description'}
+    default_tab = 'tab-daily-overview'
+
+    # section of graph_definitions.ini with the settings of the figure of a graph
+    graph_sections = {'graph-new-deaths-by-refdate': 'FIG_NEW_DEATHS_PER_REFDATE',
+                      'graph-new-cases-by-reporting-date': 'FIG_NEW_CASES_BY_REPORTING_DATE',
+                      'graph-cases-mean-3': 'FIG_CASES_MEAN_3',
+                      'graph-total-cases-by-refdate': 'FIG_TOTAL_CASES_PER_REFDATE',
+                      'graph-deaths-mean-3': 'FIG_DEATHS_MEAN_3',
+                      'graph-total-deaths-by-refdate': 'FIG_TOTAL_DEATHS_PER_REFDATE',
+                      'graph-r-value': 'FIG_R_VALUE',
+                      'graph-7d-incidence': 'FIG_7D_INCIDENCES',
+                      'graph-fig-tested': 'FIG_PCR_TESTS',
+                      'graph-fig-clinical-aspects': 'FIG_CLINICAL_ASPECTS',
+                      'graph-fig-median_ages': 'FIG_MEDIAN_AGES',
+                      'graph-fig-mean_ages': 'FIG_MEAN_AGES',
+                      'graph-fig-hospitalizations-per-age-group-bar-plot': 'FIG_HOSPITALIZATIONS',
+                      'graph-fig-hospitalizations-per-age-group-line-plot': 'FIG_HOSPITALIZATIONS',
+                      'graph-fig-deaths-by-week-and-age-group-bar-plot': 'FIG_DEATHS_BY_WEEK_OF_DEATH_AND_AGE_GROUP',
+                      'graph-fig-deaths-by-week-and-age-group-line-plot': 'FIG_DEATHS_BY_WEEK_OF_DEATH_AND_AGE_GROUP',
+                      'graph-fig-deaths-in-percent-by-week-and-age-group-bar-plot':
+                          'FIG_DEATHS_BY_WEEK_OF_DEATH_AND_AGE_GROUP_IN_PERCENT',
+                      'graph-fig-deaths-in-percent-by-week-and-age-group-line-plot':
+                          'FIG_DEATHS_BY_WEEK_OF_DEATH_AND_AGE_GROUP_IN_PERCENT',
+                      'graph-fig-distribution-of-inhabitants-and-deaths': 'FIG_DISTRIBUTION_OF_INHABITANTS',
+                      'graph-fig-distribution-of-cases-and-deaths-per-n-inhabitants':
+                          'FIG_DISTRIBUTION_OF_CASES_PER_N_INHABITANTS',
+                      'graph-fig-cases-per-outbreak-bar-plot': 'FIG_CASES_PER_OUTBREAK',
+                      'graph-fig-cases-per-outbreak-in-percent-bar-plot': 'FIG_CASES_PER_OUTBREAK_IN_PERCENT',
+                      'graph-fig-cases-per-outbreak-line-plot': 'FIG_CASES_PER_OUTBREAK',
+                      'graph-fig-cases-per-outbreak-in-percent-line-plot': 'FIG_CASES_PER_OUTBREAK_IN_PERCENT',
+                      'graph-fig-intensive-reporting-areas': 'FIG_INTENSIVE_REPORTING_AREAS',
+                      'graph-fig-intensive-new': 'FIG_INTENSIVE_NEW',
+                      'graph-fig-intensive-r-value': 'FIG_INTENSIVE_R_VALUE',
+                      'graph-fig-intensive-daily-change': 'FIG_INTENSIVE_DAILY_CHANGE',
+                      'graph-fig-intensive-care-ventilated': 'FIG_INTENSIVE_CARE_VENTILATED',
+                      'graph-fig-intensive-beds': 'FIG_INTENSIVE_BEDS',
+                      'graph-fig-intensive-beds-prop': 'FIG_INTENSIVE_BEDS_PROP'}
+
+    # graphs shown alternatively by the value of a dropdown, only the graph of the selected value is displayed
+    variant_groups = {'radio-items-for-median-and-mean-ages':
+                          {'median-ages': 'graph-fig-median_ages',
+                           'mean-ages': 'graph-fig-mean_ages'},
+                      'radio-items-for-hospitalizations-per-age-group':
+                          {'hospitalizations-per-age-group-stacked-bar':
+                               'graph-fig-hospitalizations-per-age-group-bar-plot',
+                           'hospitalizations-per-age-group-line-plot':
+                               'graph-fig-hospitalizations-per-age-group-line-plot'},
+                      'radio-items-for-cases-per-outbreak':
+                          {'cases-per-outbreak-stacked-bar': 'graph-fig-cases-per-outbreak-bar-plot',
+                           'cases-in-percent-per-outbreak-stacked-bar': 'graph-fig-cases-per-outbreak-in-percent-bar-plot',
+                           'cases-per-outbreak-line-plot': 'graph-fig-cases-per-outbreak-line-plot',
+                           'cases-in-percent-per-outbreak-line-plot':
+                               'graph-fig-cases-per-outbreak-in-percent-line-plot'},
+                      'radio-items-for-deaths-by-week-of-death-and-age-group':
+                          {'deaths-by-week-of-death-and-age-group-stacked-bar':
+                               'graph-fig-deaths-by-week-and-age-group-bar-plot',
+                           'deaths-by-week-of-death-and-age-group-line-plot':
+                               'graph-fig-deaths-by-week-and-age-group-line-plot',
+                           'deaths-in-percent-by-week-of-death-and-age-group-stacked-bar':
+                               'graph-fig-deaths-in-percent-by-week-and-age-group-bar-plot',
+                           'deaths-in-percent-by-week-of-death-and-age-group-line-plot':
+                               'graph-fig-deaths-in-percent-by-week-and-age-group-line-plot'}}
+    # the first variant of a group is selected by default, the figures of the others are loaded on their first selection
+    hidden_variant_graph_ids = [graph_id for variants in variant_groups.values()
+                                for graph_id in list(variants.values())[1:]]
+
+    # graphs of a tab, their figures are built concurrently before the content of the tab is rendered
+    tab_graph_ids = {'tab-daily-overview': ['graph-new-deaths-by-refdate',
+                                            'graph-new-cases-by-reporting-date'],
+                     'tab-corona-cases': ['graph-cases-mean-3',
+                                          'graph-total-cases-by-refdate',
+                                          'graph-deaths-mean-3',
+                                          'graph-total-deaths-by-refdate',
+                                          'graph-r-value',
+                                          'graph-7d-incidence',
+                                          'graph-fig-tested',
+                                          'graph-fig-clinical-aspects',
+                                          'graph-fig-median_ages',
+                                          'graph-fig-mean_ages',
+                                          'graph-fig-hospitalizations-per-age-group-bar-plot',
+                                          'graph-fig-hospitalizations-per-age-group-line-plot',
+                                          'graph-fig-deaths-by-week-and-age-group-bar-plot',
+                                          'graph-fig-deaths-by-week-and-age-group-line-plot',
+                                          'graph-fig-deaths-in-percent-by-week-and-age-group-bar-plot',
+                                          'graph-fig-deaths-in-percent-by-week-and-age-group-line-plot',
+                                          'graph-fig-distribution-of-inhabitants-and-deaths',
+                                          'graph-fig-distribution-of-cases-and-deaths-per-n-inhabitants',
+                                          'graph-fig-cases-per-outbreak-bar-plot',
+                                          'graph-fig-cases-per-outbreak-in-percent-bar-plot',
+                                          'graph-fig-cases-per-outbreak-line-plot',
+                                          'graph-fig-cases-per-outbreak-in-percent-line-plot'],
+                     'tab-intensive-care': ['graph-fig-intensive-reporting-areas',
+                                            'graph-fig-intensive-new',
+                                            'graph-fig-intensive-r-value',
+                                            'graph-fig-intensive-daily-change',
+                                            'graph-fig-intensive-care-ventilated',
+                                            'graph-fig-intensive-beds',
+                                            'graph-fig-intensive-beds-prop']}
+
+    # seconds between two checks of the browser for new data, the figures are refreshed at most once in this interval
+    graph_update_interval = 600
+
+    def __init__(self, shared_tab_cache: SharedTabCache = None):
+        self.specs = GraphDefinitions.from_file('layout/graph_definitions.ini')
+        self.required_columns = RequiredColumns.from_graph_definitions(self.specs)
+        self.dataset_registry = DatasetRegistry(self.required_columns)
+        self.figure_artifacts = FigureArtifacts(StorageBackend.from_environment())
+        self.shared_tab_cache = shared_tab_cache
+        self._figures = {}
+        self._loaded_figures = None
+        self._loaded_figures_time = None
+        self._loaded_figures_lock = threading.Lock()
+        self._cases_and_deaths_with_nowcast_frame = None
+        self._cases_and_deaths_with_nowcast_lock = threading.Lock()
+        self._tab_contents: Dict[str, Tuple[str, Future]] = {}
+        self._tab_contents_lock = threading.Lock()
+        self._prefetch_executor = ThreadPoolExecutor(max_workers=1)
+        self._figure_executor = ThreadPoolExecutor(max_workers=int(os.environ.get('FIGURE_WORKERS',
+                                                                                  os.cpu_count() or 1)))
 
     def layout(self) -> html.Div:
+        tabs, data_version = self.tabs_with_graphs_and_data_version(self.default_tab)
         return html.Div(
             id='layout',
             children=[
@@ -54,11 +214,15 @@ class Layout:
                     id='tabs-with-graphs-and-figures',
                     children=[
                         dcc.Interval('graph-update',
-                                     interval=600000,
+                                     interval=self.graph_update_interval * 1000,
                                      n_intervals=0),
+                        # version of the data the tabs in the browser are rendered from
+                        dcc.Store(id='tabs-data-version',
+                                  data=data_version),
                         dbc.Tabs(id='tabs-global-overview',
                                  className='nav-justified',  # bootstrap class name for justified navigation tabs
-                                 children=self.tabs_with_graphs())
+                                 active_tab=self.default_tab,
+                                 children=tabs)
                     ]
                 ),
                 html.Div(
@@ -107,218 +271,424 @@ class Layout:
             "Please rotate your screen."
         ]
 
-    def tabs_with_graphs(self) -> List[dcc.Tab]:
-        # ----------------------------- LOAD DATA AS DATAFRAMES ----------------------#
-        logging.info("START LOADING OF DATAFRAMES")
-        start_time = time.time()
-        corona_cases_and_deaths = CoronaCasesAndDeathsDataFrame.from_csv()
-        nowcast_rki = NowcastRKIDataFrame.from_csv()
-        number_pcr_tests = NumberPCRTestsDataFrame.from_csv()
-        intensive_register = IntensiveRegisterDataFrame.from_csv()
-        clinical_aspects = ClinicalAspectsDataFrame.from_csv()
-        median_and_mean_ages = MedianAndMeanAgesDataFrame.from_csv()
-        age_distribution = AgeDistributionDataFrame.from_csv()
-        cases_per_outbreak = CasesPerOutbreakDataFrame.from_csv()
-        deaths_by_week_of_death_and_age_group = DeathsByWeekOfDeathAndAgeGroupDataFrame.from_csv()
-        end_time = time.time()
-        logging.info(f"FINISHED LOADING OF DATAFRAMES IN {end_time - start_time} SECONDS")
-
-        # ----------------------------- LOAD DATA FOR DAILY OVERVIEW ----------------------#
-
-        daily_figures = self._get_daily_figures(corona_cases_and_deaths, nowcast_rki, intensive_register)
+    def tabs_with_graphs(self, active_tab: str = None) -> List[dbc.Tab]:
+        tabs, _ = self.tabs_with_graphs_and_data_version(active_tab)
+        return tabs
+
+    def tabs_with_graphs_and_data_version(self,
+                                          active_tab: str = None,
+                                          rendered_data_version: str = None) -> Tuple[Optional[List[dbc.Tab]], str]:
+        """Returns all tabs with the content of the active tab only, and the version of the data. The tabs are None if
+        they are already rendered from this version."""
+        if active_tab not in self.tab_labels:
+            active_tab = self.default_tab
+
+        full_figure, daily_figures, data_version = self._load_figures()
+        if data_version == rendered_data_version:
+            return None, data_version
+        figure = lambda graph_id: self._rendered_figure(graph_id, full_figure(graph_id))
+        content = self._tab_content(active_tab, figure, daily_figures, data_version).result()
+        self._prefetch_tab_content(self._next_tab(active_tab), figure, daily_figures, data_version)
 
         # TAB STYLING
         # https://dash.plotly.com/dash-core-components/tabs
 
-        return [dbc.Tab(label='Daily Overview',
+        tabs = [dbc.Tab(label=label,
                         labelClassName='tab',
                         activeLabelClassName='tab-selected',
-                        id='tab-daily-overview',
-                        children=self._tab_daily_overview(daily_figures,
-                                                          corona_cases_and_deaths,
-                                                          nowcast_rki)
-                        ),
+                        id=tab_id,
+                        tab_id=tab_id,
+                        children=content if tab_id == active_tab else [])
+                for tab_id, label in self.tab_labels.items()]
+        return tabs, data_version
+
+    def _load_figures(self) -> Tuple[Callable[[str], Figure], DailyFiguresDict, str]:
+        """Returns a function which returns the figure of a graph id, the daily figures and the version of the data,
+        refreshed at most once per graph update interval."""
+        with self._loaded_figures_lock:
+            if (self._loaded_figures is None) \
+                    or (time.time() - self._loaded_figures_time >= self.graph_update_interval):
+                self._loaded_figures = self._refreshed_figures()
+                self._loaded_figures_time = time.time()
+            return self._loaded_figures
+
+    def _refreshed_figures(self) -> Tuple[Callable[[str], Figure], DailyFiguresDict, str]:
+        if (os.environ.get('USE_FIGURE_ARTIFACTS', 'true').lower() == 'true') and self.figure_artifacts.exists():
+            artifacts = self.figure_artifacts.refresh()
+            if (artifacts is not None) and (artifacts[1] is not None) \
+                    and (self.graph_sections.keys() <= artifacts[0].keys()):
+                figures, daily_figures, data_version = artifacts
+                return figures.__getitem__, daily_figures, data_version
+            logging.info("figure artifacts are outdated or incomplete, build the figures")
+
+        self.dataset_registry.refresh()
+        dashboard_data = self.dataset_registry.dashboard_data()
+        figure_builders = self._figure_builders(dashboard_data)
+        return lambda graph_id: figure_builders[graph_id](), dashboard_data.daily_figures, dashboard_data.version
+
+    def zoomed_figure(self, graph_id: str, relayout_data: Optional[dict]) -> Optional[dict]:
+        """Returns the figure downsampled within the zoomed range, or None if the x axes did not change."""
+        axis_ranges = FigureDownsampling.axis_ranges(relayout_data)
+        if axis_ranges is None:
+            return None
+
+        full_figure, _, _ = self._load_figures()
+        return self._rendered_figure(graph_id, full_figure(graph_id), axis_ranges)
+
+    def variant_figure(self, graph_id: str) -> dict:
+        """Returns the figure of a variant which was hidden when its tab was rendered."""
+        full_figure, _, data_version = self._load_figures()
+        if self.shared_tab_cache is None:
+            return self._rendered_figure(graph_id, full_figure(graph_id))
+
+        fig = self.shared_tab_cache.get(graph_id, data_version)
+        if fig is None:
+            fig = self._rendered_figure(graph_id, full_figure(graph_id))
+            self.shared_tab_cache.set(graph_id, data_version, fig)
+        return fig
 
-                dbc.Tab(label='Corona cases',
-                        labelClassName='tab',
-                        activeLabelClassName='tab-selected',
-                        id='tab-corona-cases',
-                        children=self._tab_corona_cases(corona_cases_and_deaths,
-                                                        nowcast_rki,
-                                                        number_pcr_tests,
-                                                        clinical_aspects,
-                                                        median_and_mean_ages,
-                                                        age_distribution,
-                                                        cases_per_outbreak,
-                                                        deaths_by_week_of_death_and_age_group)
-                        ),
-
-                dbc.Tab(label='Intensive care',
-                        labelClassName='tab',
-                        activeLabelClassName='tab-selected',
-                        id='tab-intensive-care',
-                        children=self._tab_corona_intensive_care(intensive_register)
-                        ),
+    def _rendered_figure(self, graph_id: str, fig: Figure, axis_ranges: Dict[str, list] = None) -> dict:
+        """Returns the downsampled figure with its render mode as it is sent to the browser."""
+        spec = self.specs[self.graph_sections[graph_id]]
+        fig = FigureDownsampling.downsample(fig,
+                                            spec.max_points if spec.max_points is not None else self.specs.max_points,
+                                            self.specs.min_points_per_trace,
+                                            axis_ranges)
+        return RenderMode.apply(fig, spec.render_mode or self.specs.render_mode, self.specs.webgl_threshold)
+
+    def _tab_content(self,
+                     tab_id: str,
+                     figure: Callable[[str], Figure],
+                     daily_figures: DailyFiguresDict,
+                     data_version: str,
+                     prefetch: bool = False) -> Future:
+        with self._tab_contents_lock:
+            cached = self._tab_contents.get(tab_id)
+            if (cached is not None) and (cached[0] == data_version):
+                return cached[1]
+
+            if prefetch:
+                content = self._prefetch_executor.submit(self._shared_tab_content, tab_id, figure, daily_figures,
+                                                         data_version)
+            else:
+                content = Future()
+            self._tab_contents[tab_id] = (data_version, content)
+
+        if prefetch:
+            content.add_done_callback(lambda done: self._evict_failed_tab_content(tab_id, done))
+        else:
+            try:
+                content.set_result(self._shared_tab_content(tab_id, figure, daily_figures, data_version))
+            except Exception as error:
+                content.set_exception(error)
+                self._evict_failed_tab_content(tab_id, content)
+                raise
+        return content
+
+    def _evict_failed_tab_content(self, tab_id: str, content: Future) -> None:
+        """Removes a failed rendering, so the tab is rendered again when it is requested the next time."""
+        if content.exception() is None:
+            return
+        with self._tab_contents_lock:
+            cached = self._tab_contents.get(tab_id)
+            if (cached is not None) and (cached[1] is content):
+                del self._tab_contents[tab_id]
+
+    def _shared_tab_content(self,
+                            tab_id: str,
+                            figure: Callable[[str], Figure],
+                            daily_figures: DailyFiguresDict,
+                            data_version: str) -> list:
+        """Returns the content of the tab rendered by any worker for the version of the data or renders it."""
+        if self.shared_tab_cache is None:
+            return self._render_tab_content(tab_id, figure, daily_figures)
+
+        content = self.shared_tab_cache.get(tab_id, data_version)
+        if content is None:
+            content = self._render_tab_content(tab_id, figure, daily_figures)
+            self.shared_tab_cache.set(tab_id, data_version, content)
+        return content
+
+    def _prefetch_tab_content(self,
+                              tab_id: str,
+                              figure: Callable[[str], Figure],
+                              daily_figures: DailyFiguresDict,
+                              data_version: str) -> None:
+        if tab_id is not None:
+            logging.info(f"prefetch content of {tab_id}")
+            self._tab_content(tab_id, figure, daily_figures, data_version, prefetch=True)
+
+    def _next_tab(self, tab_id: str) -> Optional[str]:
+        tab_ids = list(self.tab_labels)
+        if tab_ids.index(tab_id) + 1 < len(tab_ids):
+            return tab_ids[tab_ids.index(tab_id) + 1]
+        return None
+
+    def _render_tab_content(self,
+                            tab_id: str,
+                            figure: Callable[[str], Figure],
+                            daily_figures: DailyFiguresDict) -> list:
+        logging.info(f"START RENDERING OF {tab_id}")
+        start_time = time.time()
 
-                dbc.Tab(label='Data sources description',
-                        labelClassName='tab',
-                        activeLabelClassName='tab-selected',
-                        id='tab-data-sources-description',
-                        children=self._tab_data_sources_description()
-                        )
-                ]
+        figure = self._figures_in_parallel([graph_id for graph_id in self.tab_graph_ids.get(tab_id, [])
+                                            if graph_id not in self.hidden_variant_graph_ids],
+                                           figure)
+        if tab_id == 'tab-daily-overview':
+            content = self._tab_daily_overview(daily_figures, figure)
+        elif tab_id == 'tab-corona-cases':
+            content = self._tab_corona_cases(figure)
+        elif tab_id == 'tab-intensive-care':
+            content = self._tab_corona_intensive_care(figure)
+        else:
+            content = self._tab_data_sources_description()
+
+        end_time = time.time()
+        logging.info(f"FINISHED RENDERING OF {tab_id} IN {end_time - start_time} SECONDS")
+        return content
+
+    def figures(self, dashboard_data: DashboardData) -> Dict[str, Figure]:
+        """Builds the figures of all graphs whose datasets are loaded by the id of their graph."""
+        missing_sections = {section
+                            for dataframe_class, sections in RequiredColumns.graph_sections.items()
+                            if dashboard_data[dataframe_class] is None
+                            for section in sections}
+        figure_builders = {graph_id: figure_builder
+                           for graph_id, figure_builder in self._figure_builders(dashboard_data).items()
+                           if self.graph_sections[graph_id] not in missing_sections}
+        figure = self._figures_in_parallel(list(figure_builders), lambda graph_id: figure_builders[graph_id]())
+        return {graph_id: figure(graph_id) for graph_id in figure_builders}
+
+    def _figures_in_parallel(self, graph_ids: List[str], figure: Callable[[str], Figure]) -> Callable[[str], Figure]:
+        """Starts building the figures and returns a function which waits for the figure of a graph."""
+        futures = {graph_id: self._figure_executor.submit(self._timed_figure, graph_id, figure)
+                   for graph_id in graph_ids}
+        return lambda graph_id: futures[graph_id].result() if graph_id in futures else figure(graph_id)
+
+    @staticmethod
+    def _timed_figure(graph_id: str, figure: Callable[[str], Figure]) -> Figure:
+        start_time = time.time()
+        fig = figure(graph_id)
+        end_time = time.time()
+        logging.info(f"FINISHED BUILDING OF {graph_id} IN {end_time - start_time} SECONDS")
+        return fig
+
+    def _figure_builders(self, dashboard_data: DashboardData) -> Dict[str, Callable[[], Figure]]:
+        corona_cases_and_deaths = dashboard_data[CoronaCasesAndDeathsDataFrame]
+        nowcast_rki = dashboard_data[NowcastRKIDataFrame]
+        number_pcr_tests = dashboard_data[NumberPCRTestsDataFrame]
+        intensive_register = dashboard_data[IntensiveRegisterDataFrame]
+        clinical_aspects = dashboard_data[ClinicalAspectsDataFrame]
+        median_and_mean_ages = dashboard_data[MedianAndMeanAgesDataFrame]
+        age_distribution = dashboard_data[AgeDistributionDataFrame]
+        cases_per_outbreak = dashboard_data[CasesPerOutbreakDataFrame]
+        deaths_by_week_of_death_and_age_group = dashboard_data[DeathsByWeekOfDeathAndAgeGroupDataFrame]
+
+        return {
+            'graph-new-deaths-by-refdate':
+                lambda: self._figure_new_deaths_by_refdate(corona_cases_and_deaths, nowcast_rki),
+            'graph-new-cases-by-reporting-date':
+                lambda: self._figure_new_cases_by_reporting_date(corona_cases_and_deaths, nowcast_rki),
+            'graph-cases-mean-3':
+                lambda: self._figure_cases_mean_3(corona_cases_and_deaths, nowcast_rki),
+            'graph-total-cases-by-refdate':
+                lambda: self._figure_total_cases_by_refdate(corona_cases_and_deaths, nowcast_rki),
+            'graph-deaths-mean-3':
+                lambda: self._figure_deaths_mean_3(corona_cases_and_deaths, nowcast_rki),
+            'graph-total-deaths-by-refdate':
+                lambda: self._figure_total_deaths_by_refdate(corona_cases_and_deaths, nowcast_rki),
+            'graph-r-value':
+                lambda: self._figure_r_value(corona_cases_and_deaths, nowcast_rki),
+            'graph-7d-incidence':
+                lambda: self._figure_7d_incidences(corona_cases_and_deaths, nowcast_rki),
+            'graph-fig-tested':
+                lambda: self._figure_pcr_tests(number_pcr_tests),
+            'graph-fig-clinical-aspects':
+                lambda: self._figure_clinical_aspects(clinical_aspects),
+            'graph-fig-median_ages':
+                lambda: self._figure_median_or_mean_ages(median_and_mean_ages),
+            'graph-fig-mean_ages':
+                lambda: self._figure_median_or_mean_ages(median_and_mean_ages, median=False),
+            'graph-fig-hospitalizations-per-age-group-bar-plot':
+                lambda: self._figure_hospitalizations_per_age_group(clinical_aspects, type='bar'),
+            'graph-fig-hospitalizations-per-age-group-line-plot':
+                lambda: self._figure_hospitalizations_per_age_group(clinical_aspects, type='line'),
+            'graph-fig-deaths-by-week-and-age-group-bar-plot':
+                lambda: self._figure_deaths_by_week_of_death_and_age_group(
+                    deaths_by_week_of_death_and_age_group, type='bar'),
+            'graph-fig-deaths-by-week-and-age-group-line-plot':
+                lambda: self._figure_deaths_by_week_of_death_and_age_group(
+                    deaths_by_week_of_death_and_age_group, type='line'),
+            'graph-fig-deaths-in-percent-by-week-and-age-group-bar-plot':
+                lambda: self._figure_deaths_by_week_of_death_and_age_group_in_percent(
+                    deaths_by_week_of_death_and_age_group, type='bar'),
+            'graph-fig-deaths-in-percent-by-week-and-age-group-line-plot':
+                lambda: self._figure_deaths_by_week_of_death_and_age_group_in_percent(
+                    deaths_by_week_of_death_and_age_group, type='line'),
+            'graph-fig-distribution-of-inhabitants-and-deaths':
+                lambda: self._figure_distribution_of_inhabitants_and_deaths(age_distribution),
+            'graph-fig-distribution-of-cases-and-deaths-per-n-inhabitants':
+                lambda: self._figure_distribution_of_cases_and_deaths_per_n_inhabitants(age_distribution),
+            'graph-fig-cases-per-outbreak-bar-plot':
+                lambda: self._figure_cases_per_outbreak(cases_per_outbreak, type='bar'),
+            'graph-fig-cases-per-outbreak-in-percent-bar-plot':
+                lambda: self._figure_cases_per_outbreak_in_percent(cases_per_outbreak, type='bar'),
+            'graph-fig-cases-per-outbreak-line-plot':
+                lambda: self._figure_cases_per_outbreak(cases_per_outbreak, type='line'),
+            'graph-fig-cases-per-outbreak-in-percent-line-plot':
+                lambda: self._figure_cases_per_outbreak_in_percent(cases_per_outbreak, type='line'),
+            'graph-fig-intensive-reporting-areas':
+                lambda: self._figure_intensive_reporting_areas(intensive_register),
+            'graph-fig-intensive-new':
+                lambda: self._figure_intensive_new(intensive_register),
+            'graph-fig-intensive-r-value':
+                lambda: self._figure_intensive_r_value(intensive_register),
+            'graph-fig-intensive-daily-change':
+                lambda: self._figure_intensive_daily_change(intensive_register),
+            'graph-fig-intensive-care-ventilated':
+                lambda: self._figure_intensive_care_ventilated(intensive_register),
+            'graph-fig-intensive-beds':
+                lambda: self._figure_intensive_beds(intensive_register),
+            'graph-fig-intensive-beds-prop':
+                lambda: self._figure_intensive_beds_prop(intensive_register)
+        }
 
     def _tab_daily_overview(self,
                             daily_figures: DailyFiguresDict,
-                            corona_cases_and_deaths: CoronaCasesAndDeathsDataFrame,
-                            nowcast_rki: NowcastRKIDataFrame) -> List[html.Div]:
+                            figure: Callable[[str], Figure]) -> List[html.Div]:
 
         return [html.Div(className="daily-overview-figures",
-                         children=[
-                             html.Div(
-                                 className='daily-overview-single-figure',
-                                 id='daily-overview-cases',
-                                 children=self._block_daily_overview_cases(daily_figures)
-                             ),
-                             html.Div(
-                                 className='daily-overview-single-figure',
-                                 id='daily-overview-deaths',
-                                 children=self._block_daily_overview_deaths(daily_figures)
-                             ),
-                             html.Div(
-                                 className='daily-overview-single-figure',
-                                 id='daily-overview-r-value',
-                                 children=self._block_daily_overview_r_value(daily_figures)
-                             ),
-                             html.Div(
-                                 className='daily-overview-single-figure',
-                                 id='daily-overview-last-7-days',
-                                 children=self._block_daily_overview_last_7_days(daily_figures)
-                             )
-                         ]
+                         children=self._daily_overview_figures(daily_figures)
                          ),
                 html.Div(className='daily-overview-plots',
                          children=[
                              dcc.Graph(
                                  id='graph-new-deaths-by-refdate',
-                                 figure=self._figure_new_deaths_by_refdate(corona_cases_and_deaths, nowcast_rki)),
+                                 figure=figure('graph-new-deaths-by-refdate')),
                              dcc.Graph(
                                  id='graph-new-cases-by-reporting-date',
-                                 figure=self._figure_new_cases_by_reporting_date(corona_cases_and_deaths, nowcast_rki))
+                                 figure=figure('graph-new-cases-by-reporting-date'))
                          ]
                          )
                 ]
 
-    def _tab_corona_cases(self,
-                          corona_cases_and_deaths: CoronaCasesAndDeathsDataFrame,
-                          nowcast_rki: NowcastRKIDataFrame,
-                          number_pcr_tests: NumberPCRTestsDataFrame,
-                          clinical_aspects: ClinicalAspectsDataFrame,
-                          median_and_mean_ages: MedianAndMeanAgesDataFrame,
-                          age_distribution: AgeDistributionDataFrame,
-                          cases_per_outbreak: CasesPerOutbreakDataFrame,
-                          deaths_by_week_of_death_and_age_group: DeathsByWeekOfDeathAndAgeGroupDataFrame) \
-            -> List[dcc.Graph]:
+    def _daily_overview_figures(self, daily_figures: DailyFiguresDict) -> List[html.Div]:
+        if daily_figures is None:
+            return [html.Div(className='daily-overview-single-figure',
+                             children="Daily figures currently not available")]
+
+        return [
+            html.Div(
+                className='daily-overview-single-figure',
+                id='daily-overview-cases',
+                children=self._block_daily_overview_cases(daily_figures)
+            ),
+            html.Div(
+                className='daily-overview-single-figure',
+                id='daily-overview-deaths',
+                children=self._block_daily_overview_deaths(daily_figures)
+            ),
+            html.Div(
+                className='daily-overview-single-figure',
+                id='daily-overview-r-value',
+                children=self._block_daily_overview_r_value(daily_figures)
+            ),
+            html.Div(
+                className='daily-overview-single-figure',
+                id='daily-overview-last-7-days',
+                children=self._block_daily_overview_last_7_days(daily_figures)
+            )
+        ]
+
+    def _tab_corona_cases(self, figure: Callable[[str], Figure]) -> List[dcc.Graph]:
         return [
             dcc.Graph(
                 id='graph-cases-mean-3',
-                figure=self._figure_cases_mean_3(corona_cases_and_deaths, nowcast_rki)),
+                figure=figure('graph-cases-mean-3')),
             dcc.Graph(
                 id='graph-total-cases-by-refdate',
-                figure=self._figure_total_cases_by_refdate(corona_cases_and_deaths, nowcast_rki)),
+                figure=figure('graph-total-cases-by-refdate')),
             dcc.Graph(
                 id='graph-deaths-mean-3',
-                figure=self._figure_deaths_mean_3(corona_cases_and_deaths, nowcast_rki)),
+                figure=figure('graph-deaths-mean-3')),
             dcc.Graph(
                 id='graph-total-deaths-by-refdate',
-                figure=self._figure_total_deaths_by_refdate(corona_cases_and_deaths, nowcast_rki)),
+                figure=figure('graph-total-deaths-by-refdate')),
             dcc.Graph(
                 id='graph-r-value',
-                figure=self._figure_r_value(corona_cases_and_deaths, nowcast_rki)),
+                figure=figure('graph-r-value')),
             dcc.Graph(
                 id='graph-7d-incidence',
-                figure=self._figure_7d_incidences(corona_cases_and_deaths, nowcast_rki)),
+                figure=figure('graph-7d-incidence')),
             dcc.Graph(
                 id='graph-fig-tested',
-                figure=self._figure_pcr_tests(number_pcr_tests)),
+                figure=figure('graph-fig-tested')),
             dcc.Graph(
                 id='graph-fig-clinical-aspects',
-                figure=self._figure_clinical_aspects(clinical_aspects)),
+                figure=figure('graph-fig-clinical-aspects')),
             self._dropdown_for_median_and_mean_ages(),
-            dcc.Graph(
-                id='graph-fig-median_ages',
-                figure=self._figure_median_or_mean_ages(median_and_mean_ages)),
-            dcc.Graph(
-                id='graph-fig-mean_ages',
-                figure=self._figure_median_or_mean_ages(median_and_mean_ages, median=False)),
+            self._variant_graph('graph-fig-median_ages', figure),
+            self._variant_graph('graph-fig-mean_ages', figure),
             self._dropdown_for_hospitalizations_per_age_group(),
-            dcc.Graph(
-                id='graph-fig-hospitalizations-per-age-group-bar-plot',
-                figure=self._figure_hospitalizations_per_age_group(clinical_aspects, type='bar')),
-            dcc.Graph(
-                id='graph-fig-hospitalizations-per-age-group-line-plot',
-                figure=self._figure_hospitalizations_per_age_group(clinical_aspects, type='line')),
+            self._variant_graph('graph-fig-hospitalizations-per-age-group-bar-plot', figure),
+            self._variant_graph('graph-fig-hospitalizations-per-age-group-line-plot', figure),
             self._dropdown_for_deaths_by_week_of_death_and_age_group(),
-            dcc.Graph(
-                id='graph-fig-deaths-by-week-and-age-group-bar-plot',
-                figure=self._figure_deaths_by_week_of_death_and_age_group(deaths_by_week_of_death_and_age_group,
-                                                                          type='bar')),
-            dcc.Graph(
-                id='graph-fig-deaths-by-week-and-age-group-line-plot',
-                figure=self._figure_deaths_by_week_of_death_and_age_group(deaths_by_week_of_death_and_age_group,
-                                                                          type='line')),
-            dcc.Graph(
-                id='graph-fig-deaths-in-percent-by-week-and-age-group-bar-plot',
-                figure=self._figure_deaths_by_week_of_death_and_age_group_in_percent(deaths_by_week_of_death_and_age_group,
-                                                                                     type='bar')),
-            dcc.Graph(
-                id='graph-fig-deaths-in-percent-by-week-and-age-group-line-plot',
-                figure=self._figure_deaths_by_week_of_death_and_age_group_in_percent(deaths_by_week_of_death_and_age_group,
-                                                                                     type='line')),
+            self._variant_graph('graph-fig-deaths-by-week-and-age-group-bar-plot', figure),
+            self._variant_graph('graph-fig-deaths-by-week-and-age-group-line-plot', figure),
+            self._variant_graph('graph-fig-deaths-in-percent-by-week-and-age-group-bar-plot', figure),
+            self._variant_graph('graph-fig-deaths-in-percent-by-week-and-age-group-line-plot', figure),
             dcc.Graph(
                 id='graph-fig-distribution-of-inhabitants-and-deaths',
-                figure=self._figure_distribution_of_inhabitants_and_deaths(age_distribution)),
+                figure=figure('graph-fig-distribution-of-inhabitants-and-deaths')),
             dcc.Graph(
                 id='graph-fig-distribution-of-cases-and-deaths-per-n-inhabitants',
-                figure=self._figure_distribution_of_cases_and_deaths_per_n_inhabitants(age_distribution)),
+                figure=figure('graph-fig-distribution-of-cases-and-deaths-per-n-inhabitants')),
             self._dropdown_for_cases_per_outbreak(),
-            dcc.Graph(
-                id='graph-fig-cases-per-outbreak-bar-plot',
-                figure=self._figure_cases_per_outbreak(cases_per_outbreak, type='bar')),
-            dcc.Graph(
-                id='graph-fig-cases-per-outbreak-in-percent-bar-plot',
-                figure=self._figure_cases_per_outbreak_in_percent(cases_per_outbreak, type='bar')),
-            dcc.Graph(
-                id='graph-fig-cases-per-outbreak-line-plot',
-                figure=self._figure_cases_per_outbreak(cases_per_outbreak, type='line')),
-            dcc.Graph(
-                id='graph-fig-cases-per-outbreak-in-percent-line-plot',
-                figure=self._figure_cases_per_outbreak_in_percent(cases_per_outbreak, type='line'))
+            self._variant_graph('graph-fig-cases-per-outbreak-bar-plot', figure),
+            self._variant_graph('graph-fig-cases-per-outbreak-in-percent-bar-plot', figure),
+            self._variant_graph('graph-fig-cases-per-outbreak-line-plot', figure),
+            self._variant_graph('graph-fig-cases-per-outbreak-in-percent-line-plot', figure),
+            *self._variant_figure_requests()
         ]
 
-    def _tab_corona_intensive_care(self, intensive_register: IntensiveRegisterDataFrame) -> List[dcc.Graph]:
+    def _variant_graph(self, graph_id: str, figure: Callable[[str], Figure]) -> dcc.Graph:
+        if graph_id in self.hidden_variant_graph_ids:
+            return dcc.Graph(id=graph_id, figure={}, style={'display': 'none'})
+        return dcc.Graph(id=graph_id, figure=figure(graph_id))
+
+    def _variant_figure_requests(self) -> List[dcc.Store]:
+        """Returns a store per variant which is set when its figure is requested."""
+        return [dcc.Store(id=self.variant_figure_request_id(graph_id),
+                          data=graph_id not in self.hidden_variant_graph_ids)
+                for variants in self.variant_groups.values() for graph_id in variants.values()]
+
+    @staticmethod
+    def variant_figure_request_id(graph_id: str) -> str:
+        return f"{graph_id}-figure-requested"
+
+    def _tab_corona_intensive_care(self, figure: Callable[[str], Figure]) -> List[dcc.Graph]:
         return [
             dcc.Graph(
                 id='graph-fig-intensive-reporting-areas',
-                figure=self._figure_intensive_reporting_areas(intensive_register)),
+                figure=figure('graph-fig-intensive-reporting-areas')),
             dcc.Graph(
                 id='graph-fig-intensive-new',
-                figure=self._figure_intensive_new(intensive_register)),
+                figure=figure('graph-fig-intensive-new')),
             dcc.Graph(
                 id='graph-fig-intensive-r-value',
-                figure=self._figure_intensive_r_value(intensive_register)),
+                figure=figure('graph-fig-intensive-r-value')),
             dcc.Graph(
                 id='graph-fig-intensive-daily-change',
-                figure=self._figure_intensive_daily_change(intensive_register)),
+                figure=figure('graph-fig-intensive-daily-change')),
             dcc.Graph(
                 id='graph-fig-intensive-care-ventilated',
-                figure=self._figure_intensive_care_ventilated(intensive_register)),
+                figure=figure('graph-fig-intensive-care-ventilated')),
             dcc.Graph(
                 id='graph-fig-intensive-beds',
-                figure=self._figure_intensive_beds(intensive_register)),
+                figure=figure('graph-fig-intensive-beds')),
             dcc.Graph(
                 id='graph-fig-intensive-beds-prop',
-                figure=self._figure_intensive_beds_prop(intensive_register))
+                figure=figure('graph-fig-intensive-beds-prop'))
         ]
 
     def _tab_data_sources_description(self) -> dcc.Markdown:
@@ -437,6 +807,12 @@ class Layout:
                 'deaths per 1,000,000 inhabitants'
                 ]
 
+    def _figure_not_available(self) -> Figure:
+        fig = Figure()
+        fig.update_layout(title="Data currently not available",
+                          template=self.specs.template)
+        return fig
+
     def _get_prefix(self, number: TNum) -> str:
         prefix = ""
 
@@ -447,205 +823,131 @@ class Layout:
 
         return prefix
 
-    def _get_daily_figures(self,
-                           corona_cases_and_deaths: CoronaCasesAndDeathsDataFrame,
-                           nowcast_rki: NowcastRKIDataFrame,
-                           intensive_register: IntensiveRegisterDataFrame) -> DailyFiguresDict:
-
-        cases_cumulative = int(corona_cases_and_deaths.last_cases_cumulative())
-        cases_last_365_days = int(corona_cases_and_deaths.cases_last_365_days())
-        last_rki_reported_cases = int(corona_cases_and_deaths.last_reported_cases())
-        last_mean_cases = int(np.round(corona_cases_and_deaths.last_mean_cases()))
-
-        last_mean_cases_change_day_before = \
-            corona_cases_and_deaths.change_from_second_last_to_last_date_for_mean_cases()
-        last_mean_cases_change_day_before = int(np.round(last_mean_cases_change_day_before))
-
-        incidence_cases = np.round(corona_cases_and_deaths.last_7_day_incidence_per_100_000_inhabitants(), 2)
-
-        incidence_cases_change = \
-            corona_cases_and_deaths.change_from_second_last_to_last_date_for_7_day_incidence_per_100_000_inhabitants()
-        incidence_cases_change = np.round(incidence_cases_change, 2)
-
-        incidence_cases_by_reporting_date = \
-            corona_cases_and_deaths.last_7_day_incidence_per_100_000_inhabitants_by_reporting_date()
-        incidence_cases_by_reporting_date = np.round(incidence_cases_by_reporting_date, 2)
-
-        incidence_cases_change_by_reporting_date = \
-            corona_cases_and_deaths. \
-                change_from_second_last_to_last_date_for_7_day_incidence_per_100_000_inhabitants_by_reporting_date()
-        incidence_cases_change_by_reporting_date = np.round(incidence_cases_change_by_reporting_date, 2)
-
-        deaths_cumulative = int(corona_cases_and_deaths.last_deaths_cumulative())
-        deaths_last_365_days = int(corona_cases_and_deaths.deaths_last_365_days())
-        last_rki_reported_deaths = int(corona_cases_and_deaths.last_reported_deaths())
-        last_mean_deaths = int(np.round(corona_cases_and_deaths.last_mean_deaths()))
-
-        last_mean_deaths_change_day_before = \
-            corona_cases_and_deaths.change_from_second_last_to_last_date_for_mean_deaths()
-        last_mean_deaths_change_day_before = int(np.round(last_mean_deaths_change_day_before))
-
-        incidence_deaths = corona_cases_and_deaths.last_7_day_deaths_by_mean_cases_per_1_000_000_inhabitants()
-        incidence_deaths = np.round(incidence_deaths, 2)
-
-        incidence_deaths_change = \
-            corona_cases_and_deaths. \
-                change_from_second_last_to_last_date_for_7_day_deaths_by_mean_cases_per_1_000_000_inhabitants()
-        incidence_deaths_change = np.round(incidence_deaths_change, 2)
-
-        last_r_value = np.round(corona_cases_and_deaths.last_r_value_by_mean_cases(), 2)
-        r_value_change = np.round(
-            corona_cases_and_deaths.change_from_second_last_to_last_date_for_r_value_by_mean_cases(), 2)
-        last_r_value_nowcast = np.round(nowcast_rki.last_r_value(), 2)
-        r_value_nowcast_change = np.round(nowcast_rki.change_from_second_last_to_last_date_for_r_value(), 2)
-        last_r_value_intensive_register = np.round(intensive_register.last_r_value_by_mean_cases(), 2)
-        r_value_intensive_register_change = np.round(
-            intensive_register.change_from_second_last_to_last_date_for_r_value_by_mean_cases(), 2)
-
-        daily_figures: DailyFiguresDict = \
-            {"cases_cumulative": cases_cumulative,
-             "cases_last_365_days": cases_last_365_days,
-             "last_cases_reported_by_rki": last_rki_reported_cases,
-             "last_mean_cases": last_mean_cases,
-             "last_mean_cases_change_since_day_before": last_mean_cases_change_day_before,
-             "cases_last_7_days": incidence_cases,
-             "cases_last_7_days_change_since_day_before": incidence_cases_change,
-             "cases_last_7_days_by_reporting_date": incidence_cases_by_reporting_date,
-             "cases_last_7_days_by_reporting_date_change_since_day_before": incidence_cases_change_by_reporting_date,
-             "deaths_cumulative": deaths_cumulative,
-             "deaths_last_365_days": deaths_last_365_days,
-             "last_deaths_reported_by_rki": last_rki_reported_deaths,
-             "last_mean_deaths": last_mean_deaths,
-             "last_mean_deaths_change_since_day_before": last_mean_deaths_change_day_before,
-             "deaths_last_7_days": incidence_deaths,
-             "deaths_last_7_days_change_since_day_before": incidence_deaths_change,
-             "last_r_value": last_r_value,
-             "last_r_value_change_since_day_before": r_value_change,
-             "last_r_value_by_nowcast_rki": last_r_value_nowcast,
-             "last_r_value_by_nowcast_rki_change_since_day_before": r_value_nowcast_change,
-             "last_r_value_by_new_admissions_to_intensive_care": last_r_value_intensive_register,
-             "last_r_value_by_new_admissions_to_intensive_care_change_since_day_before": r_value_intensive_register_change
-             }
-
-        return daily_figures
-
+    @figure_of_datasets
     def _figure_cases_mean_3(self,
                              corona_cases_and_deaths: CoronaCasesAndDeathsDataFrame,
                              nowcast_rki: NowcastRKIDataFrame) -> Figure:
 
-        corona_cases_and_deaths_with_nowcast = pd.concat([corona_cases_and_deaths, nowcast_rki], axis=1).reset_index()
-        corona_cases_and_deaths_with_nowcast.loc[:, self.config["FIG_CASES_MEAN_3"]["hover_data_strftime"]] = \
-            self._format_column_strftime(corona_cases_and_deaths_with_nowcast, "FIG_CASES_MEAN_3")
-        corona_cases_and_deaths_with_nowcast.loc[:, self.config["FIG_CASES_MEAN_3"]["hover_data_format_column"]] = \
-            self._format_hover_data_column(corona_cases_and_deaths_with_nowcast, "FIG_CASES_MEAN_3")
+        corona_cases_and_deaths_with_nowcast = self._cases_and_deaths_with_nowcast(corona_cases_and_deaths, nowcast_rki)
 
-        fig = make_subplots(specs=[[{"secondary_y": False}]])
+        main_traces = \
+            TraceBuilder.line_traces(corona_cases_and_deaths_with_nowcast,
+                                     x=self.specs["FIG_CASES_MEAN_3"].x,
+                                     y=self.specs["FIG_CASES_MEAN_3"].y,
+                                     color_discrete_map=self.specs["FIG_CASES_MEAN_3"].color_discrete_map,
+                                     hover_data=self.specs["FIG_CASES_MEAN_3"].hover_data)
+
+        sub_traces = \
+            TraceBuilder.line_traces(corona_cases_and_deaths_with_nowcast,
+                                     x=self.specs["FIG_CASES_MEAN_3"].x,
+                                     y=self.specs["FIG_CASES_MEAN_3_SUBFIG"].y,
+                                     color_discrete_map=self.specs["FIG_CASES_MEAN_3_SUBFIG"].color_discrete_map,
+                                     hover_data=self.specs["FIG_CASES_MEAN_3_SUBFIG"].hover_data)
+
+        sub_traces_2 = \
+            TraceBuilder.line_traces(corona_cases_and_deaths_with_nowcast,
+                                     x=self.specs["FIG_CASES_MEAN_3"].x,
+                                     y=self.specs["FIG_CASES_MEAN_3_SUBFIG_2"].y,
+                                     color_discrete_map=self.specs["FIG_CASES_MEAN_3_SUBFIG_2"].color_discrete_map)
 
-        mainfig = px.line(corona_cases_and_deaths_with_nowcast,
-                          x=self.config["FIG_CASES_MEAN_3"]["x"],
-                          y=json.loads(self.config["FIG_CASES_MEAN_3"]["y"]),
-                          color_discrete_map=json.loads(self.config["FIG_CASES_MEAN_3"]["color_discrete_map"]),
-                          render_mode=self.config["ALL_FIGS"]["render_mode"],
-                          hover_data=json.loads(self.config["FIG_CASES_MEAN_3"]["hover_data"]))
-
-        subfig = px.line(corona_cases_and_deaths_with_nowcast,
-                         x=self.config["FIG_CASES_MEAN_3"]["x"],
-                         y=json.loads(self.config["FIG_CASES_MEAN_3_SUBFIG"]["y"]),
-                         color_discrete_map=json.loads(self.config["FIG_CASES_MEAN_3_SUBFIG"]["color_discrete_map"]),
-                         render_mode=self.config["ALL_FIGS"]["render_mode"],
-                         hover_data=json.loads(self.config["FIG_CASES_MEAN_3_SUBFIG"]["hover_data"]))
-
-        subfig_2 = px.line(corona_cases_and_deaths_with_nowcast,
-                           x=self.config["FIG_CASES_MEAN_3"]["x"],
-                           y=json.loads(self.config["FIG_CASES_MEAN_3_SUBFIG_2"]["y"]),
-                           color_discrete_map=json.loads(
-                               self.config["FIG_CASES_MEAN_3_SUBFIG_2"]["color_discrete_map"]),
-                           render_mode=self.config["ALL_FIGS"]["render_mode"])
-
-        fig.add_traces(mainfig.data + subfig.data + subfig_2.data)
-
-        fig.update_layout(title=self.config["FIG_CASES_MEAN_3"]["title"],
-                          xaxis_title=self.config["FIG_CASES_MEAN_3"]["xaxis_title"],
-                          yaxis_title=self.config["FIG_CASES_MEAN_3"]["yaxis_title"],
-                          legend=json.loads(self.config["ALL_FIGS"]["legend"]),
-                          font_family=self.config["ALL_FIGS"]["font_family"],
-                          font_color=self.config["ALL_FIGS"]["font_color"],
-                          plot_bgcolor=self.config["ALL_FIGS"]["plot_bgcolor"],
-                          paper_bgcolor=self.config["ALL_FIGS"]["paper_bgcolor"],
-                          yaxis_tickformat=self.config["FIG_CASES_MEAN_3"]["yaxis_tickformat"])
+        fig = make_subplots(specs=[[{"secondary_y": False}]])
+        fig.add_traces(main_traces + sub_traces + sub_traces_2)
+
+        fig.update_layout(title=self.specs["FIG_CASES_MEAN_3"].title,
+                          xaxis_title=self.specs["FIG_CASES_MEAN_3"].xaxis_title,
+                          yaxis_title=self.specs["FIG_CASES_MEAN_3"].yaxis_title,
+                          legend=dict(self.specs.legend),
+                          template=self.specs.template,
+                          yaxis_tickformat=self.specs["FIG_CASES_MEAN_3"].yaxis_tickformat)
         return fig
 
+    @figure_of_datasets
     def _figure_deaths_mean_3(self,
                               corona_cases_and_deaths: CoronaCasesAndDeathsDataFrame,
                               nowcast_rki: NowcastRKIDataFrame) -> Figure:
 
-        corona_cases_and_deaths_with_nowcast = pd.concat([corona_cases_and_deaths, nowcast_rki], axis=1).reset_index()
-        corona_cases_and_deaths_with_nowcast.loc[:, self.config["FIG_DEATHS_MEAN_3"]["hover_data_strftime"]] = \
-            self._format_column_strftime(corona_cases_and_deaths_with_nowcast, "FIG_DEATHS_MEAN_3")
-        corona_cases_and_deaths_with_nowcast.loc[:, self.config["FIG_DEATHS_MEAN_3"]["hover_data_format_column"]] = \
-            self._format_hover_data_column(corona_cases_and_deaths_with_nowcast, "FIG_DEATHS_MEAN_3")
+        corona_cases_and_deaths_with_nowcast = self._cases_and_deaths_with_nowcast(corona_cases_and_deaths, nowcast_rki)
+
+        main_traces = \
+            TraceBuilder.line_traces(corona_cases_and_deaths_with_nowcast,
+                                     x=self.specs["FIG_DEATHS_MEAN_3"].x,
+                                     y=self.specs["FIG_DEATHS_MEAN_3"].y,
+                                     color_discrete_map=self.specs["FIG_DEATHS_MEAN_3"].color_discrete_map,
+                                     hover_data=self.specs["FIG_DEATHS_MEAN_3"].hover_data)
+
+        sub_traces = \
+            TraceBuilder.line_traces(corona_cases_and_deaths_with_nowcast,
+                                     x=self.specs["FIG_DEATHS_MEAN_3"].x,
+                                     y=self.specs["FIG_DEATHS_MEAN_3_SUBFIG"].y,
+                                     color_discrete_map=self.specs["FIG_DEATHS_MEAN_3_SUBFIG"].color_discrete_map,
+                                     hover_data=self.specs["FIG_DEATHS_MEAN_3_SUBFIG"].hover_data)
+
+        sub_traces_2 = \
+            TraceBuilder.line_traces(corona_cases_and_deaths_with_nowcast,
+                                     x=self.specs["FIG_DEATHS_MEAN_3"].x,
+                                     y=self.specs["FIG_DEATHS_MEAN_3_SUBFIG_2"].y,
+                                     color_discrete_map=self.specs["FIG_DEATHS_MEAN_3_SUBFIG_2"].color_discrete_map)
 
         fig = make_subplots(specs=[[{"secondary_y": False}]])
+        fig.add_traces(main_traces + sub_traces + sub_traces_2)
 
-        mainfig = px.line(corona_cases_and_deaths_with_nowcast,
-                          x=self.config["FIG_DEATHS_MEAN_3"]["x"],
-                          y=json.loads(self.config["FIG_DEATHS_MEAN_3"]["y"]),
-                          color_discrete_map=json.loads(self.config["FIG_DEATHS_MEAN_3"]["color_discrete_map"]),
-                          render_mode=self.config["ALL_FIGS"]["render_mode"],
-                          hover_data=json.loads(self.config["FIG_DEATHS_MEAN_3"]["hover_data"]))
-
-        subfig = px.line(corona_cases_and_deaths_with_nowcast,
-                         x=self.config["FIG_DEATHS_MEAN_3"]["x"],
-                         y=json.loads(self.config["FIG_DEATHS_MEAN_3_SUBFIG"]["y"]),
-                         color_discrete_map=json.loads(self.config["FIG_DEATHS_MEAN_3_SUBFIG"]["color_discrete_map"]),
-                         render_mode=self.config["ALL_FIGS"]["render_mode"],
-                         hover_data=json.loads(self.config["FIG_DEATHS_MEAN_3_SUBFIG"]["hover_data"]))
-
-        subfig_2 = px.line(corona_cases_and_deaths_with_nowcast,
-                           x=self.config["FIG_DEATHS_MEAN_3"]["x"],
-                           y=json.loads(self.config["FIG_DEATHS_MEAN_3_SUBFIG_2"]["y"]),
-                           color_discrete_map=json.loads(
-                               self.config["FIG_DEATHS_MEAN_3_SUBFIG_2"]["color_discrete_map"]),
-                           render_mode=self.config["ALL_FIGS"]["render_mode"])
-
-        fig.add_traces(mainfig.data + subfig.data + subfig_2.data)
-
-        fig.update_layout(title=self.config["FIG_DEATHS_MEAN_3"]["title"],
-                          xaxis_title=self.config["FIG_DEATHS_MEAN_3"]["xaxis_title"],
-                          yaxis_title=self.config["FIG_DEATHS_MEAN_3"]["yaxis_title"],
-                          legend=json.loads(self.config["ALL_FIGS"]["legend"]),
-                          font_family=self.config["ALL_FIGS"]["font_family"],
-                          font_color=self.config["ALL_FIGS"]["font_color"],
-                          plot_bgcolor=self.config["ALL_FIGS"]["plot_bgcolor"],
-                          paper_bgcolor=self.config["ALL_FIGS"]["paper_bgcolor"],
-                          yaxis_tickformat=self.config["FIG_DEATHS_MEAN_3"]["yaxis_tickformat"])
+        fig.update_layout(title=self.specs["FIG_DEATHS_MEAN_3"].title,
+                          xaxis_title=self.specs["FIG_DEATHS_MEAN_3"].xaxis_title,
+                          yaxis_title=self.specs["FIG_DEATHS_MEAN_3"].yaxis_title,
+                          legend=dict(self.specs.legend),
+                          template=self.specs.template,
+                          yaxis_tickformat=self.specs["FIG_DEATHS_MEAN_3"].yaxis_tickformat)
 
         return fig
 
+    def _cases_and_deaths_with_nowcast(self,
+                                       corona_cases_and_deaths: CoronaCasesAndDeathsDataFrame,
+                                       nowcast_rki: NowcastRKIDataFrame) -> pd.DataFrame:
+        """Returns cases and deaths joined with the nowcast, shared by all figures which must not modify it."""
+        with self._cases_and_deaths_with_nowcast_lock:
+            cached = self._cases_and_deaths_with_nowcast_frame
+            if (cached is not None) and (cached[0] is corona_cases_and_deaths) and (cached[1] is nowcast_rki):
+                return cached[2]
+
+            df = pd.concat([corona_cases_and_deaths, nowcast_rki], axis=1).reset_index()
+            formatted_columns = {}
+            for section in RequiredColumns.cases_and_nowcast_sections:
+                if self.specs[section].hover_data_strftime is not None:
+                    formatted_columns[self.specs[section].hover_data_strftime] = \
+                        self._format_column_strftime(df, section)
+                if self.specs[section].hover_data_format_column is not None:
+                    formatted_columns[self.specs[section].hover_data_format_column] = \
+                        self._format_hover_data_column(df, section)
+            for column, values in formatted_columns.items():
+                df.loc[:, column] = values
+
+            self._cases_and_deaths_with_nowcast_frame = (corona_cases_and_deaths, nowcast_rki, df)
+            return df
+
     def _format_hover_data_column(self,
                                   df: pd.DataFrame,
                                   config_section: str) -> pd.Series:
-        str_format = "{:" + self.config[config_section]["hover_data_format"] + "}"
-        return df.loc[:, self.config[config_section]["hover_data_format_column"]] \
+        str_format = "{:" + self.specs[config_section].hover_data_format + "}"
+        return df.loc[:, self.specs[config_section].hover_data_format_column] \
             .map(str_format.format)
 
     def _format_column_strftime(self,
                                 corona_cases_and_deaths_with_nowcast: CoronaCasesAndDeathsDataFrame,
                                 config_section: str) -> CoronaCasesAndDeathsSeries:
-        return corona_cases_and_deaths_with_nowcast.loc[:, self.config[config_section]["hover_data_strftime"]] \
+        return corona_cases_and_deaths_with_nowcast.loc[:, self.specs[config_section].hover_data_strftime] \
             .dt.strftime('%b %d, %Y')
 
+    @figure_of_datasets
     def _figure_r_value(self,
                         corona_cases_and_deaths: CoronaCasesAndDeathsDataFrame,
                         nowcast_rki: NowcastRKIDataFrame) -> Figure:
 
-        corona_cases_and_deaths_with_nowcast = pd.concat([corona_cases_and_deaths, nowcast_rki], axis=1).reset_index()
+        corona_cases_and_deaths_with_nowcast = self._cases_and_deaths_with_nowcast(corona_cases_and_deaths, nowcast_rki)
 
-        fig = px.line(corona_cases_and_deaths_with_nowcast,
-                      x=self.config["FIG_R_VALUE"]["x"],
-                      y=json.loads(self.config["FIG_R_VALUE"]["y"]),
-                      color_discrete_map=json.loads(self.config["FIG_R_VALUE"]["color_discrete_map"]),
-                      render_mode=self.config["ALL_FIGS"]["render_mode"])
+        fig = TraceBuilder.line(corona_cases_and_deaths_with_nowcast,
+                                x=self.specs["FIG_R_VALUE"].x,
+                                y=self.specs["FIG_R_VALUE"].y,
+                                color_discrete_map=self.specs["FIG_R_VALUE"].color_discrete_map)
 
         min_date = corona_cases_and_deaths_with_nowcast.date.min()
         max_date = corona_cases_and_deaths_with_nowcast.date.max()
@@ -655,197 +957,173 @@ class Layout:
                    "x0": min_date,
                    "x1": max_date}]
 
-        fig.update_layout(title=self.config["FIG_R_VALUE"]["title"],
-                          xaxis_title=self.config["FIG_R_VALUE"]["xaxis_title"],
-                          yaxis_title=self.config["FIG_R_VALUE"]["yaxis_title"],
+        fig.update_layout(title=self.specs["FIG_R_VALUE"].title,
+                          xaxis_title=self.specs["FIG_R_VALUE"].xaxis_title,
+                          yaxis_title=self.specs["FIG_R_VALUE"].yaxis_title,
                           shapes=shapes,
-                          yaxis=json.loads(self.config["FIG_R_VALUE"]["yaxis"]),
-                          legend=json.loads(self.config["ALL_FIGS"]["legend"]),
-                          font_family=self.config["ALL_FIGS"]["font_family"],
-                          font_color=self.config["ALL_FIGS"]["font_color"],
-                          plot_bgcolor=self.config["ALL_FIGS"]["plot_bgcolor"],
-                          paper_bgcolor=self.config["ALL_FIGS"]["paper_bgcolor"],
-                          yaxis_tickformat=self.config["FIG_R_VALUE"]["yaxis_tickformat"])
+                          yaxis=dict(self.specs["FIG_R_VALUE"].yaxis),
+                          legend=dict(self.specs.legend),
+                          template=self.specs.template,
+                          yaxis_tickformat=self.specs["FIG_R_VALUE"].yaxis_tickformat)
         return fig
 
+    @figure_of_datasets
     def _figure_7d_incidences(self,
                               corona_cases_and_deaths: CoronaCasesAndDeathsDataFrame,
                               nowcast_rki: NowcastRKIDataFrame) -> Figure:
 
-        corona_cases_and_deaths_with_nowcast = pd.concat([corona_cases_and_deaths, nowcast_rki], axis=1).reset_index()
+        corona_cases_and_deaths_with_nowcast = self._cases_and_deaths_with_nowcast(corona_cases_and_deaths, nowcast_rki)
 
-        fig = px.line(corona_cases_and_deaths_with_nowcast,
-                      x=self.config["FIG_7D_INCIDENCES"]["x"],
-                      y=json.loads(self.config["FIG_7D_INCIDENCES"]["y"]),
-                      color_discrete_map=json.loads(self.config["FIG_7D_INCIDENCES"]["color_discrete_map"]),
-                      render_mode=self.config["ALL_FIGS"]["render_mode"])
+        fig = TraceBuilder.line(corona_cases_and_deaths_with_nowcast,
+                                x=self.specs["FIG_7D_INCIDENCES"].x,
+                                y=self.specs["FIG_7D_INCIDENCES"].y,
+                                color_discrete_map=self.specs["FIG_7D_INCIDENCES"].color_discrete_map)
 
-        fig.update_layout(title=self.config["FIG_7D_INCIDENCES"]["title"],
-                          xaxis_title=self.config["FIG_7D_INCIDENCES"]["xaxis_title"],
-                          yaxis_title=self.config["FIG_7D_INCIDENCES"]["yaxis_title"],
-                          legend=json.loads(self.config["ALL_FIGS"]["legend"]),
-                          font_family=self.config["ALL_FIGS"]["font_family"],
-                          font_color=self.config["ALL_FIGS"]["font_color"],
-                          plot_bgcolor=self.config["ALL_FIGS"]["plot_bgcolor"],
-                          paper_bgcolor=self.config["ALL_FIGS"]["paper_bgcolor"],
-                          yaxis_tickformat=self.config["FIG_7D_INCIDENCES"]["yaxis_tickformat"])
+        fig.update_layout(title=self.specs["FIG_7D_INCIDENCES"].title,
+                          xaxis_title=self.specs["FIG_7D_INCIDENCES"].xaxis_title,
+                          yaxis_title=self.specs["FIG_7D_INCIDENCES"].yaxis_title,
+                          legend=dict(self.specs.legend),
+                          template=self.specs.template,
+                          yaxis_tickformat=self.specs["FIG_7D_INCIDENCES"].yaxis_tickformat)
 
         return fig
 
+    @figure_of_datasets
     def _figure_pcr_tests(self, number_pcr_tests: NumberPCRTestsDataFrame) -> Figure:
 
         number_pcr_tests = number_pcr_tests.reset_index()
-        number_pcr_tests.loc[:, self.config["FIG_PCR_TESTS"]["hover_data_format_column"]] = \
+        number_pcr_tests.loc[:, self.specs["FIG_PCR_TESTS"].hover_data_format_column] = \
             self._format_hover_data_column(number_pcr_tests, "FIG_PCR_TESTS")
 
-        fig = make_subplots(specs=[[{"secondary_y": True}]])
-
-        mainfig = \
-            px.bar(number_pcr_tests,
-                   x=self.config["FIG_PCR_TESTS"]["x"],
-                   y=json.loads(self.config["FIG_PCR_TESTS"]["y"]),
-                   color_discrete_map=json.loads(self.config["FIG_PCR_TESTS"]["color_discrete_map"]),
-                   hover_data=json.loads(self.config["FIG_PCR_TESTS"]["hover_data"]))
-
-        subfig = \
-            px.line(number_pcr_tests,
-                    x=self.config["FIG_PCR_TESTS"]["x"],
-                    y=json.loads(self.config["SUBFIG_PCR_TESTS_POSITIVE_RATE"]["y"]),
-                    color_discrete_map=json.loads(self.config["SUBFIG_PCR_TESTS_POSITIVE_RATE"]["color_discrete_map"]),
-                    render_mode=self.config["ALL_FIGS"]["render_mode"])
+        main_traces = \
+            TraceBuilder.bar_traces(number_pcr_tests,
+                                    x=self.specs["FIG_PCR_TESTS"].x,
+                                    y=self.specs["FIG_PCR_TESTS"].y,
+                                    color_discrete_map=self.specs["FIG_PCR_TESTS"].color_discrete_map,
+                                    hover_data=self.specs["FIG_PCR_TESTS"].hover_data)
 
-        subfig.update_traces(yaxis="y2")
+        sub_traces = \
+            TraceBuilder.line_traces(number_pcr_tests,
+                                     x=self.specs["FIG_PCR_TESTS"].x,
+                                     y=self.specs["SUBFIG_PCR_TESTS_POSITIVE_RATE"].y,
+                                     color_discrete_map=self.specs["SUBFIG_PCR_TESTS_POSITIVE_RATE"].color_discrete_map,
+                                     yaxis="y2")
 
-        fig.add_traces(mainfig.data + subfig.data)
-        fig.update_yaxes(title_text=self.config["SUBFIG_PCR_TESTS_POSITIVE_RATE"]["yaxis_title"],
+        fig = make_subplots(specs=[[{"secondary_y": True}]])
+        fig.add_traces(main_traces + sub_traces)
+        fig.update_yaxes(title_text=self.specs["SUBFIG_PCR_TESTS_POSITIVE_RATE"].yaxis_title,
                          secondary_y=True)
 
-        fig.update_layout(title=self.config["FIG_PCR_TESTS"]["title"],
-                          barmode=self.config["FIG_PCR_TESTS"]["barmode"],
-                          xaxis_title=self.config["FIG_PCR_TESTS"]["xaxis_title"],
-                          yaxis_title=self.config["FIG_PCR_TESTS"]["yaxis_title"],
-                          legend=json.loads(self.config["ALL_FIGS"]["legend"]),
-                          font_family=self.config["ALL_FIGS"]["font_family"],
-                          font_color=self.config["ALL_FIGS"]["font_color"],
-                          plot_bgcolor=self.config["ALL_FIGS"]["plot_bgcolor"],
-                          paper_bgcolor=self.config["ALL_FIGS"]["paper_bgcolor"],
-                          yaxis1=dict(tickformat=self.config["FIG_PCR_TESTS"]["yaxis_tickformat"]),
-                          yaxis2=dict(tickformat=self.config["SUBFIG_PCR_TESTS_POSITIVE_RATE"]["yaxis_tickformat"]))
+        fig.update_layout(title=self.specs["FIG_PCR_TESTS"].title,
+                          barmode=self.specs["FIG_PCR_TESTS"].barmode,
+                          xaxis_title=self.specs["FIG_PCR_TESTS"].xaxis_title,
+                          yaxis_title=self.specs["FIG_PCR_TESTS"].yaxis_title,
+                          legend=dict(self.specs.legend),
+                          template=self.specs.template,
+                          yaxis1=dict(tickformat=self.specs["FIG_PCR_TESTS"].yaxis_tickformat),
+                          yaxis2=dict(tickformat=self.specs["SUBFIG_PCR_TESTS_POSITIVE_RATE"].yaxis_tickformat))
 
         return fig
 
+    @figure_of_datasets
     def _figure_distribution_of_inhabitants_and_deaths(self, age_distribution: AgeDistributionDataFrame) -> Figure:
 
         age_distribution = age_distribution.reset_index()
 
+        main_traces = \
+            TraceBuilder.bar_traces(age_distribution,
+                                    x=self.specs["FIG_DISTRIBUTION_OF_INHABITANTS"].x,
+                                    y=self.specs["FIG_DISTRIBUTION_OF_INHABITANTS"].y,
+                                    color_discrete_map=self.specs["FIG_DISTRIBUTION_OF_INHABITANTS"].color_discrete_map)
+
+        sub_traces = \
+            TraceBuilder.bar_traces(age_distribution,
+                                    x=self.specs["FIG_DISTRIBUTION_OF_INHABITANTS"].x,
+                                    y=self.specs["SUBFIG_DISTRIBUTION_OF_DEATHS"].y,
+                                    color_discrete_map=self.specs["SUBFIG_DISTRIBUTION_OF_DEATHS"].color_discrete_map,
+                                    yaxis="y2")
+
         fig = make_subplots(specs=[[{"secondary_y": True}]])
-        mainfig = \
-            px.bar(age_distribution,
-                   x=self.config["FIG_DISTRIBUTION_OF_INHABITANTS"]["x"],
-                   y=json.loads(self.config["FIG_DISTRIBUTION_OF_INHABITANTS"]["y"]),
-                   color_discrete_map=json.loads(self.config["FIG_DISTRIBUTION_OF_INHABITANTS"]["color_discrete_map"]))
-
-        subfig = \
-            px.bar(age_distribution,
-                   x=self.config["FIG_DISTRIBUTION_OF_INHABITANTS"]["x"],
-                   y=json.loads(self.config["SUBFIG_DISTRIBUTION_OF_DEATHS"]["y"]),
-                   color_discrete_map=json.loads(self.config["SUBFIG_DISTRIBUTION_OF_DEATHS"]["color_discrete_map"]))
-        subfig.update_traces(yaxis="y2")
-
-        fig.add_traces(mainfig.data + subfig.data)
-        fig.update_yaxes(title_text=self.config["SUBFIG_DISTRIBUTION_OF_DEATHS"]["yaxis_title"],
+        fig.add_traces(main_traces + sub_traces)
+        fig.update_yaxes(title_text=self.specs["SUBFIG_DISTRIBUTION_OF_DEATHS"].yaxis_title,
                          secondary_y=True)
 
-        fig.update_layout(title=self.config["FIG_DISTRIBUTION_OF_INHABITANTS"]["title"],
-                          barmode=self.config["SUBFIG_DISTRIBUTION_OF_DEATHS"]["barmode"],
-                          xaxis_title=self.config["FIG_DISTRIBUTION_OF_INHABITANTS"]["xaxis_title"],
-                          yaxis_title=self.config["FIG_DISTRIBUTION_OF_INHABITANTS"]["yaxis_title"],
-                          legend=json.loads(self.config["ALL_FIGS"]["legend"]),
-                          font_family=self.config["ALL_FIGS"]["font_family"],
-                          font_color=self.config["ALL_FIGS"]["font_color"],
-                          plot_bgcolor=self.config["ALL_FIGS"]["plot_bgcolor"],
-                          paper_bgcolor=self.config["ALL_FIGS"]["paper_bgcolor"],
-                          yaxis1=dict(tickformat=self.config["FIG_DISTRIBUTION_OF_INHABITANTS"]["yaxis_tickformat"]),
-                          yaxis2=dict(tickformat=self.config["SUBFIG_DISTRIBUTION_OF_DEATHS"]["yaxis_tickformat"]))
+        fig.update_layout(title=self.specs["FIG_DISTRIBUTION_OF_INHABITANTS"].title,
+                          barmode=self.specs["SUBFIG_DISTRIBUTION_OF_DEATHS"].barmode,
+                          xaxis_title=self.specs["FIG_DISTRIBUTION_OF_INHABITANTS"].xaxis_title,
+                          yaxis_title=self.specs["FIG_DISTRIBUTION_OF_INHABITANTS"].yaxis_title,
+                          legend=dict(self.specs.legend),
+                          template=self.specs.template,
+                          yaxis1=dict(tickformat=self.specs["FIG_DISTRIBUTION_OF_INHABITANTS"].yaxis_tickformat),
+                          yaxis2=dict(tickformat=self.specs["SUBFIG_DISTRIBUTION_OF_DEATHS"].yaxis_tickformat))
 
         return fig
 
+    @figure_of_datasets
     def _figure_distribution_of_cases_and_deaths_per_n_inhabitants(self,
                                                                    age_distribution: AgeDistributionDataFrame) -> Figure:
 
         age_distribution = age_distribution.reset_index()
 
-        fig = make_subplots(specs=[[{"secondary_y": True}]])
+        main_traces = \
+            TraceBuilder.bar_traces(age_distribution,
+                                    x=self.specs["FIG_DISTRIBUTION_OF_CASES_PER_N_INHABITANTS"].x,
+                                    y=self.specs["FIG_DISTRIBUTION_OF_CASES_PER_N_INHABITANTS"].y,
+                                    color_discrete_map=self.specs["FIG_DISTRIBUTION_OF_CASES_PER_N_INHABITANTS"].color_discrete_map)
+
+        sub_traces = \
+            TraceBuilder.bar_traces(age_distribution,
+                                    x=self.specs["FIG_DISTRIBUTION_OF_CASES_PER_N_INHABITANTS"].x,
+                                    y=self.specs["SUBFIG_DISTRIBUTION_OF_DEATHS_PER_N_INHABITANTS"].y,
+                                    color_discrete_map=self.specs["SUBFIG_DISTRIBUTION_OF_DEATHS_PER_N_INHABITANTS"].color_discrete_map,
+                                    yaxis="y2")
 
-        mainfig = \
-            px.bar(age_distribution,
-                   x=self.config["FIG_DISTRIBUTION_OF_CASES_PER_N_INHABITANTS"]["x"],
-                   y=json.loads(self.config["FIG_DISTRIBUTION_OF_CASES_PER_N_INHABITANTS"]["y"]),
-                   color_discrete_map=json.loads(
-                       self.config["FIG_DISTRIBUTION_OF_CASES_PER_N_INHABITANTS"]["color_discrete_map"]))
-
-        subfig = \
-            px.bar(age_distribution,
-                   x=self.config["FIG_DISTRIBUTION_OF_CASES_PER_N_INHABITANTS"]["x"],
-                   y=json.loads(self.config["SUBFIG_DISTRIBUTION_OF_DEATHS_PER_N_INHABITANTS"]["y"]),
-                   color_discrete_map=json.loads(
-                       self.config["SUBFIG_DISTRIBUTION_OF_DEATHS_PER_N_INHABITANTS"]["color_discrete_map"]))
-
-        subfig.update_traces(yaxis="y2")
-
-        fig.add_traces(
-            mainfig.data + subfig.data)
-        fig.update_yaxes(title_text=self.config["SUBFIG_DISTRIBUTION_OF_DEATHS_PER_N_INHABITANTS"]["yaxis_title"],
+        fig = make_subplots(specs=[[{"secondary_y": True}]])
+        fig.add_traces(main_traces + sub_traces)
+        fig.update_yaxes(title_text=self.specs["SUBFIG_DISTRIBUTION_OF_DEATHS_PER_N_INHABITANTS"].yaxis_title,
                          secondary_y=True)
 
-        fig.update_layout(title=self.config["FIG_DISTRIBUTION_OF_CASES_PER_N_INHABITANTS"]["title"],
-                          barmode=self.config["SUBFIG_DISTRIBUTION_OF_DEATHS_PER_N_INHABITANTS"]["barmode"],
-                          xaxis_title=self.config["FIG_DISTRIBUTION_OF_CASES_PER_N_INHABITANTS"]["xaxis_title"],
-                          yaxis_title=self.config["FIG_DISTRIBUTION_OF_CASES_PER_N_INHABITANTS"]["yaxis_title"],
-                          legend=json.loads(self.config["ALL_FIGS"]["legend"]),
-                          font_family=self.config["ALL_FIGS"]["font_family"],
-                          font_color=self.config["ALL_FIGS"]["font_color"],
-                          plot_bgcolor=self.config["ALL_FIGS"]["plot_bgcolor"],
-                          paper_bgcolor=self.config["ALL_FIGS"]["paper_bgcolor"],
+        fig.update_layout(title=self.specs["FIG_DISTRIBUTION_OF_CASES_PER_N_INHABITANTS"].title,
+                          barmode=self.specs["SUBFIG_DISTRIBUTION_OF_DEATHS_PER_N_INHABITANTS"].barmode,
+                          xaxis_title=self.specs["FIG_DISTRIBUTION_OF_CASES_PER_N_INHABITANTS"].xaxis_title,
+                          yaxis_title=self.specs["FIG_DISTRIBUTION_OF_CASES_PER_N_INHABITANTS"].yaxis_title,
+                          legend=dict(self.specs.legend),
+                          template=self.specs.template,
                           yaxis1=dict(tickformat=
-                                      self.config["FIG_DISTRIBUTION_OF_CASES_PER_N_INHABITANTS"]["yaxis_tickformat"]),
+                                      self.specs["FIG_DISTRIBUTION_OF_CASES_PER_N_INHABITANTS"].yaxis_tickformat),
                           yaxis2=dict(tickformat=
-                                      self.config["SUBFIG_DISTRIBUTION_OF_DEATHS_PER_N_INHABITANTS"][
-                                          "yaxis_tickformat"]))
+                                      self.specs["SUBFIG_DISTRIBUTION_OF_DEATHS_PER_N_INHABITANTS"].yaxis_tickformat))
 
         return fig
 
+    @figure_of_datasets
     def _figure_intensive_new(self, intensive_register: IntensiveRegisterDataFrame) -> Figure:
 
         intensive_register = intensive_register.reset_index()
 
-        fig = px.line(intensive_register,
-                      x=self.config["FIG_INTENSIVE_NEW"]["x"],
-                      y=json.loads(self.config["FIG_INTENSIVE_NEW"]["y"]),
-                      color_discrete_map=json.loads(self.config["FIG_INTENSIVE_NEW"]["color_discrete_map"]),
-                      render_mode=self.config["ALL_FIGS"]["render_mode"])
-
-        fig.update_layout(title=self.config["FIG_INTENSIVE_NEW"]["title"],
-                          xaxis_title=self.config["FIG_INTENSIVE_NEW"]["xaxis_title"],
-                          yaxis_title=self.config["FIG_INTENSIVE_NEW"]["yaxis_title"],
-                          legend=json.loads(self.config["ALL_FIGS"]["legend"]),
-                          font_family=self.config["ALL_FIGS"]["font_family"],
-                          font_color=self.config["ALL_FIGS"]["font_color"],
-                          plot_bgcolor=self.config["ALL_FIGS"]["plot_bgcolor"],
-                          paper_bgcolor=self.config["ALL_FIGS"]["paper_bgcolor"],
-                          yaxis_tickformat=self.config["FIG_INTENSIVE_NEW"]["yaxis_tickformat"])
+        fig = TraceBuilder.line(intensive_register,
+                                x=self.specs["FIG_INTENSIVE_NEW"].x,
+                                y=self.specs["FIG_INTENSIVE_NEW"].y,
+                                color_discrete_map=self.specs["FIG_INTENSIVE_NEW"].color_discrete_map)
+
+        fig.update_layout(title=self.specs["FIG_INTENSIVE_NEW"].title,
+                          xaxis_title=self.specs["FIG_INTENSIVE_NEW"].xaxis_title,
+                          yaxis_title=self.specs["FIG_INTENSIVE_NEW"].yaxis_title,
+                          legend=dict(self.specs.legend),
+                          template=self.specs.template,
+                          yaxis_tickformat=self.specs["FIG_INTENSIVE_NEW"].yaxis_tickformat)
 
         return fig
 
+    @figure_of_datasets
     def _figure_intensive_r_value(self, intensive_register: IntensiveRegisterDataFrame) -> Figure:
 
         intensive_register = intensive_register.reset_index()
 
-        fig = px.line(intensive_register,
-                      x=self.config["FIG_INTENSIVE_R_VALUE"]["x"],
-                      y=json.loads(self.config["FIG_INTENSIVE_R_VALUE"]["y"]),
-                      color_discrete_map=json.loads(self.config["FIG_INTENSIVE_R_VALUE"]["color_discrete_map"]),
-                      render_mode=self.config["ALL_FIGS"]["render_mode"])
+        fig = TraceBuilder.line(intensive_register,
+                                x=self.specs["FIG_INTENSIVE_R_VALUE"].x,
+                                y=self.specs["FIG_INTENSIVE_R_VALUE"].y,
+                                color_discrete_map=self.specs["FIG_INTENSIVE_R_VALUE"].color_discrete_map)
 
         min_date = intensive_register.date.min()
         max_date = intensive_register.date.max()
@@ -855,188 +1133,162 @@ class Layout:
                    "x0": min_date,
                    "x1": max_date}]
 
-        fig.update_layout(title=self.config["FIG_INTENSIVE_R_VALUE"]["title"],
-                          xaxis_title=self.config["FIG_INTENSIVE_R_VALUE"]["xaxis_title"],
-                          yaxis_title=self.config["FIG_INTENSIVE_R_VALUE"]["yaxis_title"],
+        fig.update_layout(title=self.specs["FIG_INTENSIVE_R_VALUE"].title,
+                          xaxis_title=self.specs["FIG_INTENSIVE_R_VALUE"].xaxis_title,
+                          yaxis_title=self.specs["FIG_INTENSIVE_R_VALUE"].yaxis_title,
                           shapes=shapes,
-                          yaxis=json.loads(self.config["FIG_INTENSIVE_R_VALUE"]["yaxis"]),
-                          legend=json.loads(self.config["ALL_FIGS"]["legend"]),
-                          font_family=self.config["ALL_FIGS"]["font_family"],
-                          font_color=self.config["ALL_FIGS"]["font_color"],
-                          plot_bgcolor=self.config["ALL_FIGS"]["plot_bgcolor"],
-                          paper_bgcolor=self.config["ALL_FIGS"]["paper_bgcolor"],
-                          yaxis_tickformat=self.config["FIG_INTENSIVE_R_VALUE"]["yaxis_tickformat"])
+                          yaxis=dict(self.specs["FIG_INTENSIVE_R_VALUE"].yaxis),
+                          legend=dict(self.specs.legend),
+                          template=self.specs.template,
+                          yaxis_tickformat=self.specs["FIG_INTENSIVE_R_VALUE"].yaxis_tickformat)
         return fig
 
 
+    @figure_of_datasets
     def _figure_intensive_daily_change(self, intensive_register: IntensiveRegisterDataFrame) -> Figure:
 
         intensive_register = intensive_register.reset_index()
 
         fig = \
-            px.line(intensive_register,
-                    x=self.config["FIG_INTENSIVE_DAILY_CHANGE"]["x"],
-                    y=json.loads(self.config["FIG_INTENSIVE_DAILY_CHANGE"]["y"]),
-                    color_discrete_map=json.loads(self.config["FIG_INTENSIVE_DAILY_CHANGE"]["color_discrete_map"]),
-                    render_mode=self.config["ALL_FIGS"]["render_mode"])
-
-        fig.update_layout(title=self.config["FIG_INTENSIVE_DAILY_CHANGE"]["title"],
-                          xaxis_title=self.config["FIG_INTENSIVE_DAILY_CHANGE"]["xaxis_title"],
-                          yaxis_title=self.config["FIG_INTENSIVE_DAILY_CHANGE"]["yaxis_title"],
-                          legend=json.loads(self.config["ALL_FIGS"]["legend"]),
-                          font_family=self.config["ALL_FIGS"]["font_family"],
-                          font_color=self.config["ALL_FIGS"]["font_color"],
-                          plot_bgcolor=self.config["ALL_FIGS"]["plot_bgcolor"],
-                          paper_bgcolor=self.config["ALL_FIGS"]["paper_bgcolor"],
-                          yaxis_tickformat=self.config["FIG_INTENSIVE_DAILY_CHANGE"]["yaxis_tickformat"])
+            TraceBuilder.line(intensive_register,
+                              x=self.specs["FIG_INTENSIVE_DAILY_CHANGE"].x,
+                              y=self.specs["FIG_INTENSIVE_DAILY_CHANGE"].y,
+                              color_discrete_map=self.specs["FIG_INTENSIVE_DAILY_CHANGE"].color_discrete_map)
+
+        fig.update_layout(title=self.specs["FIG_INTENSIVE_DAILY_CHANGE"].title,
+                          xaxis_title=self.specs["FIG_INTENSIVE_DAILY_CHANGE"].xaxis_title,
+                          yaxis_title=self.specs["FIG_INTENSIVE_DAILY_CHANGE"].yaxis_title,
+                          legend=dict(self.specs.legend),
+                          template=self.specs.template,
+                          yaxis_tickformat=self.specs["FIG_INTENSIVE_DAILY_CHANGE"].yaxis_tickformat)
 
         return fig
 
+    @figure_of_datasets
     def _figure_intensive_reporting_areas(self, intensive_register: IntensiveRegisterDataFrame) -> Figure:
 
         intensive_register = intensive_register.reset_index()
 
         fig = \
-            px.line(intensive_register,
-                    x=self.config["FIG_INTENSIVE_REPORTING_AREAS"]["x"],
-                    y=json.loads(self.config["FIG_INTENSIVE_REPORTING_AREAS"]["y"]),
-                    color_discrete_map=json.loads(self.config["FIG_INTENSIVE_REPORTING_AREAS"]["color_discrete_map"]),
-                    render_mode=self.config["ALL_FIGS"]["render_mode"])
-
-        fig.update_layout(title=self.config["FIG_INTENSIVE_REPORTING_AREAS"]["title"],
-                          xaxis_title=self.config["FIG_INTENSIVE_REPORTING_AREAS"]["xaxis_title"],
-                          yaxis_title=self.config["FIG_INTENSIVE_REPORTING_AREAS"]["yaxis_title"],
-                          legend=json.loads(self.config["ALL_FIGS"]["legend"]),
-                          font_family=self.config["ALL_FIGS"]["font_family"],
-                          font_color=self.config["ALL_FIGS"]["font_color"],
-                          plot_bgcolor=self.config["ALL_FIGS"]["plot_bgcolor"],
-                          paper_bgcolor=self.config["ALL_FIGS"]["paper_bgcolor"],
-                          yaxis_tickformat=self.config["FIG_INTENSIVE_REPORTING_AREAS"]["yaxis_tickformat"])
+            TraceBuilder.line(intensive_register,
+                              x=self.specs["FIG_INTENSIVE_REPORTING_AREAS"].x,
+                              y=self.specs["FIG_INTENSIVE_REPORTING_AREAS"].y,
+                              color_discrete_map=self.specs["FIG_INTENSIVE_REPORTING_AREAS"].color_discrete_map)
+
+        fig.update_layout(title=self.specs["FIG_INTENSIVE_REPORTING_AREAS"].title,
+                          xaxis_title=self.specs["FIG_INTENSIVE_REPORTING_AREAS"].xaxis_title,
+                          yaxis_title=self.specs["FIG_INTENSIVE_REPORTING_AREAS"].yaxis_title,
+                          legend=dict(self.specs.legend),
+                          template=self.specs.template,
+                          yaxis_tickformat=self.specs["FIG_INTENSIVE_REPORTING_AREAS"].yaxis_tickformat)
 
         return fig
 
+    @figure_of_datasets
     def _figure_intensive_care_ventilated(self, intensive_register: IntensiveRegisterDataFrame) -> Figure:
 
         intensive_register = intensive_register.reset_index()
 
-        fig = make_subplots(specs=[[{"secondary_y": True}]])
-
-        mainfig = \
-            px.bar(intensive_register,
-                   x=self.config["FIG_INTENSIVE_CARE_VENTILATED"]["x"],
-                   y=json.loads(self.config["FIG_INTENSIVE_CARE_VENTILATED"]["y"]),
-                   color_discrete_map=json.loads(self.config["FIG_INTENSIVE_CARE_VENTILATED"]["color_discrete_map"]))
-
-        subfig = \
-            px.line(intensive_register,
-                    x=self.config["FIG_INTENSIVE_CARE_VENTILATED"]["x"],
-                    y=json.loads(self.config["SUBFIG_INTENSIVE_CARE_VENTILATED_PERCENTAGE"]["y"]),
-                    color_discrete_map=
-                    json.loads(self.config["SUBFIG_INTENSIVE_CARE_VENTILATED_PERCENTAGE"]["color_discrete_map"]),
-                    render_mode=self.config["ALL_FIGS"]["render_mode"])
+        main_traces = \
+            TraceBuilder.bar_traces(intensive_register,
+                                    x=self.specs["FIG_INTENSIVE_CARE_VENTILATED"].x,
+                                    y=self.specs["FIG_INTENSIVE_CARE_VENTILATED"].y,
+                                    color_discrete_map=self.specs["FIG_INTENSIVE_CARE_VENTILATED"].color_discrete_map)
 
-        subfig.update_traces(yaxis="y2")
+        sub_traces = \
+            TraceBuilder.line_traces(intensive_register,
+                                     x=self.specs["FIG_INTENSIVE_CARE_VENTILATED"].x,
+                                     y=self.specs["SUBFIG_INTENSIVE_CARE_VENTILATED_PERCENTAGE"].y,
+                                     color_discrete_map=
+                                     dict(self.specs["SUBFIG_INTENSIVE_CARE_VENTILATED_PERCENTAGE"].color_discrete_map),
+                                     yaxis="y2")
 
-        fig.add_traces(mainfig.data + subfig.data)
-        fig.update_yaxes(title_text=self.config["SUBFIG_INTENSIVE_CARE_VENTILATED_PERCENTAGE"]["yaxis_title"],
+        fig = make_subplots(specs=[[{"secondary_y": True}]])
+        fig.add_traces(main_traces + sub_traces)
+        fig.update_yaxes(title_text=self.specs["SUBFIG_INTENSIVE_CARE_VENTILATED_PERCENTAGE"].yaxis_title,
                          secondary_y=True)
 
-        fig.update_layout(title=self.config["FIG_INTENSIVE_CARE_VENTILATED"]["title"],
-                          barmode=self.config["SUBFIG_INTENSIVE_CARE_VENTILATED_PERCENTAGE"]["barmode"],
-                          xaxis_title=self.config["FIG_INTENSIVE_CARE_VENTILATED"]["xaxis_title"],
-                          yaxis_title=self.config["FIG_INTENSIVE_CARE_VENTILATED"]["yaxis_title"],
-                          legend=json.loads(self.config["ALL_FIGS"]["legend"]),
-                          font_family=self.config["ALL_FIGS"]["font_family"],
-                          font_color=self.config["ALL_FIGS"]["font_color"],
-                          plot_bgcolor=self.config["ALL_FIGS"]["plot_bgcolor"],
-                          paper_bgcolor=self.config["ALL_FIGS"]["paper_bgcolor"],
-                          yaxis1=dict(tickformat=self.config["FIG_INTENSIVE_CARE_VENTILATED"]["yaxis_tickformat"]),
+        fig.update_layout(title=self.specs["FIG_INTENSIVE_CARE_VENTILATED"].title,
+                          barmode=self.specs["SUBFIG_INTENSIVE_CARE_VENTILATED_PERCENTAGE"].barmode,
+                          xaxis_title=self.specs["FIG_INTENSIVE_CARE_VENTILATED"].xaxis_title,
+                          yaxis_title=self.specs["FIG_INTENSIVE_CARE_VENTILATED"].yaxis_title,
+                          legend=dict(self.specs.legend),
+                          template=self.specs.template,
+                          yaxis1=dict(tickformat=self.specs["FIG_INTENSIVE_CARE_VENTILATED"].yaxis_tickformat),
                           yaxis2=dict(tickformat=
-                                      self.config["SUBFIG_INTENSIVE_CARE_VENTILATED_PERCENTAGE"]["yaxis_tickformat"]))
+                                      self.specs["SUBFIG_INTENSIVE_CARE_VENTILATED_PERCENTAGE"].yaxis_tickformat))
 
         return fig
 
+    @figure_of_datasets
     def _figure_intensive_beds(self, intensive_register: IntensiveRegisterDataFrame) -> Figure:
 
         intensive_register = intensive_register.reset_index()
 
-        fig = make_subplots(specs=[[{"secondary_y": True}]])
+        main_traces = TraceBuilder.bar_traces(intensive_register,
+                                              x=self.specs["FIG_INTENSIVE_BEDS"].x,
+                                              y=self.specs["FIG_INTENSIVE_BEDS"].y,
+                                              color_discrete_map=self.specs["FIG_INTENSIVE_BEDS"].color_discrete_map)
+
+        sub_traces = \
+            TraceBuilder.line_traces(intensive_register,
+                                     x=self.specs["FIG_INTENSIVE_BEDS"].x,
+                                     y=self.specs["FIG_INTENSIVE_BEDS_COUNT"].y,
+                                     color_discrete_map=self.specs["FIG_INTENSIVE_BEDS_COUNT"].color_discrete_map)
 
-        mainfig = px.bar(intensive_register,
-                         x=self.config["FIG_INTENSIVE_BEDS"]["x"],
-                         y=json.loads(self.config["FIG_INTENSIVE_BEDS"]["y"]),
-                         color_discrete_map=json.loads(self.config["FIG_INTENSIVE_BEDS"]["color_discrete_map"]))
-
-        subfig = px.line(intensive_register,
-                         x=self.config["FIG_INTENSIVE_BEDS"]["x"],
-                         y=json.loads(self.config["FIG_INTENSIVE_BEDS_COUNT"]["y"]),
-                         color_discrete_map=json.loads(self.config["FIG_INTENSIVE_BEDS_COUNT"]["color_discrete_map"]),
-                         render_mode=self.config["ALL_FIGS"]["render_mode"])
-
-        # fig_intensive_beds_count.update_traces(yaxis="y1")
-
-        fig.add_traces(mainfig.data + subfig.data)
-        fig.update_yaxes(secondary_y=False)
-
-        fig.update_layout(title=self.config["FIG_INTENSIVE_BEDS"]["title"],
-                          barmode=self.config["FIG_INTENSIVE_BEDS_COUNT"]["barmode"],
-                          xaxis_title=self.config["FIG_INTENSIVE_BEDS"]["xaxis_title"],
-                          yaxis_title=self.config["FIG_INTENSIVE_BEDS"]["yaxis_title"],
-                          legend=json.loads(self.config["ALL_FIGS"]["legend"]),
-                          font_family=self.config["ALL_FIGS"]["font_family"],
-                          font_color=self.config["ALL_FIGS"]["font_color"],
-                          plot_bgcolor=self.config["ALL_FIGS"]["plot_bgcolor"],
-                          paper_bgcolor=self.config["ALL_FIGS"]["paper_bgcolor"],
-                          yaxis_tickformat=self.config["FIG_INTENSIVE_BEDS"]["yaxis_tickformat"],
-                          yaxis1=dict(tickformat=self.config["FIG_INTENSIVE_BEDS"]["yaxis_tickformat"]),
-                          yaxis2=dict(tickformat=self.config["FIG_INTENSIVE_BEDS_COUNT"]["yaxis_tickformat"]))
+        fig = make_subplots(specs=[[{"secondary_y": True}]])
+        fig.add_traces(main_traces + sub_traces)
+
+        fig.update_layout(title=self.specs["FIG_INTENSIVE_BEDS"].title,
+                          barmode=self.specs["FIG_INTENSIVE_BEDS_COUNT"].barmode,
+                          xaxis_title=self.specs["FIG_INTENSIVE_BEDS"].xaxis_title,
+                          yaxis_title=self.specs["FIG_INTENSIVE_BEDS"].yaxis_title,
+                          legend=dict(self.specs.legend),
+                          template=self.specs.template,
+                          yaxis_tickformat=self.specs["FIG_INTENSIVE_BEDS"].yaxis_tickformat,
+                          yaxis1=dict(tickformat=self.specs["FIG_INTENSIVE_BEDS"].yaxis_tickformat),
+                          yaxis2=dict(tickformat=self.specs["FIG_INTENSIVE_BEDS_COUNT"].yaxis_tickformat))
 
         return fig
 
+    @figure_of_datasets
     def _figure_intensive_beds_prop(self, intensive_register: IntensiveRegisterDataFrame) -> Figure:
 
         intensive_register = intensive_register.reset_index()
 
-        fig = px.line(intensive_register,
-                      x=self.config["FIG_INTENSIVE_BEDS_PROP"]["x"],
-                      y=json.loads(self.config["FIG_INTENSIVE_BEDS_PROP"]["y"]),
-                      color_discrete_map=json.loads(self.config["FIG_INTENSIVE_BEDS_PROP"]["color_discrete_map"]),
-                      render_mode=self.config["ALL_FIGS"]["render_mode"])
-
-        fig.update_layout(title=self.config["FIG_INTENSIVE_BEDS_PROP"]["title"],
-                          xaxis_title=self.config["FIG_INTENSIVE_BEDS_PROP"]["xaxis_title"],
-                          yaxis_title=self.config["FIG_INTENSIVE_BEDS_PROP"]["yaxis_title"],
-                          yaxis=json.loads(self.config["FIG_INTENSIVE_BEDS_PROP"]["yaxis"]),
-                          legend=json.loads(self.config["ALL_FIGS"]["legend"]),
-                          font_family=self.config["ALL_FIGS"]["font_family"],
-                          font_color=self.config["ALL_FIGS"]["font_color"],
-                          plot_bgcolor=self.config["ALL_FIGS"]["plot_bgcolor"],
-                          paper_bgcolor=self.config["ALL_FIGS"]["paper_bgcolor"],
-                          yaxis1=dict(tickformat=self.config["FIG_INTENSIVE_BEDS"]["yaxis_tickformat"]),
-                          yaxis2=dict(tickformat=self.config["FIG_INTENSIVE_BEDS_COUNT"]["yaxis_tickformat"]))
+        fig = TraceBuilder.line(intensive_register,
+                                x=self.specs["FIG_INTENSIVE_BEDS_PROP"].x,
+                                y=self.specs["FIG_INTENSIVE_BEDS_PROP"].y,
+                                color_discrete_map=self.specs["FIG_INTENSIVE_BEDS_PROP"].color_discrete_map)
+
+        fig.update_layout(title=self.specs["FIG_INTENSIVE_BEDS_PROP"].title,
+                          xaxis_title=self.specs["FIG_INTENSIVE_BEDS_PROP"].xaxis_title,
+                          yaxis_title=self.specs["FIG_INTENSIVE_BEDS_PROP"].yaxis_title,
+                          yaxis=dict(self.specs["FIG_INTENSIVE_BEDS_PROP"].yaxis),
+                          legend=dict(self.specs.legend),
+                          template=self.specs.template,
+                          yaxis1=dict(tickformat=self.specs["FIG_INTENSIVE_BEDS"].yaxis_tickformat),
+                          yaxis2=dict(tickformat=self.specs["FIG_INTENSIVE_BEDS_COUNT"].yaxis_tickformat))
 
         return fig
 
+    @figure_of_datasets
     def _figure_clinical_aspects(self, clinical_aspects: ClinicalAspectsDataFrame) -> Figure:
 
         df = clinical_aspects.reset_index()
 
-        fig = px.line(df,
-                      x=self.config["FIG_CLINICAL_ASPECTS"]["x"],
-                      y=json.loads(self.config["FIG_CLINICAL_ASPECTS"]["y"]),
-                      color_discrete_map=json.loads(self.config["FIG_CLINICAL_ASPECTS"]["color_discrete_map"]),
-                      render_mode=self.config["ALL_FIGS"]["render_mode"])
+        fig = TraceBuilder.line(df,
+                                x=self.specs["FIG_CLINICAL_ASPECTS"].x,
+                                y=self.specs["FIG_CLINICAL_ASPECTS"].y,
+                                color_discrete_map=self.specs["FIG_CLINICAL_ASPECTS"].color_discrete_map)
 
-        fig.update_layout(title=self.config["FIG_CLINICAL_ASPECTS"]["title"],
-                          xaxis_title=self.config["FIG_CLINICAL_ASPECTS"]["xaxis_title"],
-                          yaxis_title=self.config["FIG_CLINICAL_ASPECTS"]["yaxis_title"],
+        fig.update_layout(title=self.specs["FIG_CLINICAL_ASPECTS"].title,
+                          xaxis_title=self.specs["FIG_CLINICAL_ASPECTS"].xaxis_title,
+                          yaxis_title=self.specs["FIG_CLINICAL_ASPECTS"].yaxis_title,
                           # yaxis=yaxis,
-                          legend=json.loads(self.config["ALL_FIGS"]["legend"]),
-                          font_family=self.config["ALL_FIGS"]["font_family"],
-                          font_color=self.config["ALL_FIGS"]["font_color"],
-                          plot_bgcolor=self.config["ALL_FIGS"]["plot_bgcolor"],
-                          paper_bgcolor=self.config["ALL_FIGS"]["paper_bgcolor"],
-                          yaxis_tickformat=self.config["FIG_CLINICAL_ASPECTS"]["yaxis_tickformat"])
+                          legend=dict(self.specs.legend),
+                          template=self.specs.template,
+                          yaxis_tickformat=self.specs["FIG_CLINICAL_ASPECTS"].yaxis_tickformat)
 
         return fig
 
@@ -1056,64 +1308,58 @@ class Layout:
             ],
             value='cases-per-outbreak-stacked-bar')
 
+    @figure_of_datasets
     def _figure_cases_per_outbreak(self, cases_per_outbreak: CasesPerOutbreakDataFrame, type: str) -> Figure:
 
         cases_per_outbreak = cases_per_outbreak.reset_index()
 
-        fig = px.line(cases_per_outbreak,
-                      x=self.config["FIG_CASES_PER_OUTBREAK"]["x"],
-                      y=json.loads(self.config["FIG_CASES_PER_OUTBREAK"]["y"]),
-                      color_discrete_map=json.loads(self.config["FIG_CASES_PER_OUTBREAK"]["color_discrete_map"]))
+        fig = TraceBuilder.line(cases_per_outbreak,
+                                x=self.specs["FIG_CASES_PER_OUTBREAK"].x,
+                                y=self.specs["FIG_CASES_PER_OUTBREAK"].y,
+                                color_discrete_map=self.specs["FIG_CASES_PER_OUTBREAK"].color_discrete_map)
 
         if type == 'bar':
-            fig = px.bar(cases_per_outbreak,
-                         x=self.config["FIG_CASES_PER_OUTBREAK"]["x"],
-                         y=json.loads(self.config["FIG_CASES_PER_OUTBREAK"]["y"]),
-                         color_discrete_map=json.loads(self.config["FIG_CASES_PER_OUTBREAK"]["color_discrete_map"]))
-
-        fig.update_layout(title=self.config["FIG_CASES_PER_OUTBREAK"]["title"],
-                          xaxis_title=self.config["FIG_CASES_PER_OUTBREAK"]["xaxis_title"],
-                          yaxis_title=self.config["FIG_CASES_PER_OUTBREAK"]["yaxis_title"],
-                          font_family=self.config["ALL_FIGS"]["font_family"],
-                          font_color=self.config["ALL_FIGS"]["font_color"],
-                          plot_bgcolor=self.config["ALL_FIGS"]["plot_bgcolor"],
-                          paper_bgcolor=self.config["ALL_FIGS"]["paper_bgcolor"],
-                          yaxis_tickformat=self.config["FIG_CASES_PER_OUTBREAK"]["yaxis_tickformat"])
+            fig = TraceBuilder.bar(cases_per_outbreak,
+                                   x=self.specs["FIG_CASES_PER_OUTBREAK"].x,
+                                   y=self.specs["FIG_CASES_PER_OUTBREAK"].y,
+                                   color_discrete_map=self.specs["FIG_CASES_PER_OUTBREAK"].color_discrete_map)
+
+        fig.update_layout(title=self.specs["FIG_CASES_PER_OUTBREAK"].title,
+                          xaxis_title=self.specs["FIG_CASES_PER_OUTBREAK"].xaxis_title,
+                          yaxis_title=self.specs["FIG_CASES_PER_OUTBREAK"].yaxis_title,
+                          template=self.specs.template,
+                          yaxis_tickformat=self.specs["FIG_CASES_PER_OUTBREAK"].yaxis_tickformat)
 
         if type == 'bar':
-            fig.update_layout(barmode=self.config["FIG_CASES_PER_OUTBREAK"]["barmode"])
+            fig.update_layout(barmode=self.specs["FIG_CASES_PER_OUTBREAK"].barmode)
 
         return fig
 
+    @figure_of_datasets
     def _figure_cases_per_outbreak_in_percent(self, cases_per_outbreak: CasesPerOutbreakDataFrame, type: str) \
             -> Figure:
 
         cases_per_outbreak = cases_per_outbreak.reset_index()
 
-        fig = px.line(cases_per_outbreak,
-                      x=self.config["FIG_CASES_PER_OUTBREAK_IN_PERCENT"]["x"],
-                      y=json.loads(self.config["FIG_CASES_PER_OUTBREAK_IN_PERCENT"]["y"]),
-                      color_discrete_map=json.loads(
-                          self.config["FIG_CASES_PER_OUTBREAK_IN_PERCENT"]["color_discrete_map"]))
+        fig = TraceBuilder.line(cases_per_outbreak,
+                                x=self.specs["FIG_CASES_PER_OUTBREAK_IN_PERCENT"].x,
+                                y=self.specs["FIG_CASES_PER_OUTBREAK_IN_PERCENT"].y,
+                                color_discrete_map=self.specs["FIG_CASES_PER_OUTBREAK_IN_PERCENT"].color_discrete_map)
 
         if type == 'bar':
-            fig = px.bar(cases_per_outbreak,
-                         x=self.config["FIG_CASES_PER_OUTBREAK_IN_PERCENT"]["x"],
-                         y=json.loads(self.config["FIG_CASES_PER_OUTBREAK_IN_PERCENT"]["y"]),
-                         color_discrete_map=json.loads(
-                             self.config["FIG_CASES_PER_OUTBREAK_IN_PERCENT"]["color_discrete_map"]))
-
-        fig.update_layout(title=self.config["FIG_CASES_PER_OUTBREAK_IN_PERCENT"]["title"],
-                          xaxis_title=self.config["FIG_CASES_PER_OUTBREAK_IN_PERCENT"]["xaxis_title"],
-                          yaxis_title=self.config["FIG_CASES_PER_OUTBREAK_IN_PERCENT"]["yaxis_title"],
-                          font_family=self.config["ALL_FIGS"]["font_family"],
-                          font_color=self.config["ALL_FIGS"]["font_color"],
-                          plot_bgcolor=self.config["ALL_FIGS"]["plot_bgcolor"],
-                          paper_bgcolor=self.config["ALL_FIGS"]["paper_bgcolor"],
-                          yaxis_tickformat=self.config["FIG_CASES_PER_OUTBREAK_IN_PERCENT"]["yaxis_tickformat"])
+            fig = TraceBuilder.bar(cases_per_outbreak,
+                                   x=self.specs["FIG_CASES_PER_OUTBREAK_IN_PERCENT"].x,
+                                   y=self.specs["FIG_CASES_PER_OUTBREAK_IN_PERCENT"].y,
+                                   color_discrete_map=self.specs["FIG_CASES_PER_OUTBREAK_IN_PERCENT"].color_discrete_map)
+
+        fig.update_layout(title=self.specs["FIG_CASES_PER_OUTBREAK_IN_PERCENT"].title,
+                          xaxis_title=self.specs["FIG_CASES_PER_OUTBREAK_IN_PERCENT"].xaxis_title,
+                          yaxis_title=self.specs["FIG_CASES_PER_OUTBREAK_IN_PERCENT"].yaxis_title,
+                          template=self.specs.template,
+                          yaxis_tickformat=self.specs["FIG_CASES_PER_OUTBREAK_IN_PERCENT"].yaxis_tickformat)
 
         if type == 'bar':
-            fig.update_layout(barmode=self.config["FIG_CASES_PER_OUTBREAK_IN_PERCENT"]["barmode"])
+            fig.update_layout(barmode=self.specs["FIG_CASES_PER_OUTBREAK_IN_PERCENT"].barmode)
 
         return fig
 
@@ -1129,6 +1375,7 @@ class Layout:
             ],
             value='median-ages')
 
+    @figure_of_datasets
     def _figure_median_or_mean_ages(self, median_and_mean_ages: MedianAndMeanAgesDataFrame, median:bool = True) -> Figure:
 
         if median:
@@ -1138,22 +1385,18 @@ class Layout:
 
         df = median_and_mean_ages.reset_index()
 
-        fig = px.line(df,
-                      x=self.config[config_part]["x"],
-                      y=json.loads(self.config[config_part]["y"]),
-                      color_discrete_map=json.loads(self.config[config_part]["color_discrete_map"]),
-                      render_mode=self.config["ALL_FIGS"]["render_mode"])
+        fig = TraceBuilder.line(df,
+                                x=self.specs[config_part].x,
+                                y=self.specs[config_part].y,
+                                color_discrete_map=self.specs[config_part].color_discrete_map)
 
-        fig.update_layout(title=self.config[config_part]["title"],
-                          xaxis_title=self.config[config_part]["xaxis_title"],
-                          yaxis_title=self.config[config_part]["yaxis_title"],
+        fig.update_layout(title=self.specs[config_part].title,
+                          xaxis_title=self.specs[config_part].xaxis_title,
+                          yaxis_title=self.specs[config_part].yaxis_title,
                           # yaxis=yaxis,
-                          legend=json.loads(self.config["ALL_FIGS"]["legend"]),
-                          font_family=self.config["ALL_FIGS"]["font_family"],
-                          font_color=self.config["ALL_FIGS"]["font_color"],
-                          plot_bgcolor=self.config["ALL_FIGS"]["plot_bgcolor"],
-                          paper_bgcolor=self.config["ALL_FIGS"]["paper_bgcolor"],
-                          yaxis_tickformat=self.config[config_part]["yaxis_tickformat"])
+                          legend=dict(self.specs.legend),
+                          template=self.specs.template,
+                          yaxis_tickformat=self.specs[config_part].yaxis_tickformat)
 
         return fig
 
@@ -1169,32 +1412,30 @@ class Layout:
             ],
             value='hospitalizations-per-age-group-stacked-bar')
 
+    @figure_of_datasets
     def _figure_hospitalizations_per_age_group(self, clinical_aspects: ClinicalAspectsDataFrame, type: str) -> Figure:
 
         clinical_aspects = clinical_aspects.reset_index()
 
-        fig = px.line(clinical_aspects,
-                      x=self.config["FIG_HOSPITALIZATIONS"]["x"],
-                      y=json.loads(self.config["FIG_HOSPITALIZATIONS"]["y"]),
-                      color_discrete_map=json.loads(self.config["FIG_HOSPITALIZATIONS"]["color_discrete_map"]))
+        fig = TraceBuilder.line(clinical_aspects,
+                                x=self.specs["FIG_HOSPITALIZATIONS"].x,
+                                y=self.specs["FIG_HOSPITALIZATIONS"].y,
+                                color_discrete_map=self.specs["FIG_HOSPITALIZATIONS"].color_discrete_map)
 
         if type == 'bar':
-            fig = px.bar(clinical_aspects,
-                         x=self.config["FIG_HOSPITALIZATIONS"]["x"],
-                         y=json.loads(self.config["FIG_HOSPITALIZATIONS"]["y"]),
-                         color_discrete_map=json.loads(self.config["FIG_HOSPITALIZATIONS"]["color_discrete_map"]))
-
-        fig.update_layout(title=self.config["FIG_HOSPITALIZATIONS"]["title"],
-                          xaxis_title=self.config["FIG_HOSPITALIZATIONS"]["xaxis_title"],
-                          yaxis_title=self.config["FIG_HOSPITALIZATIONS"]["yaxis_title"],
-                          font_family=self.config["ALL_FIGS"]["font_family"],
-                          font_color=self.config["ALL_FIGS"]["font_color"],
-                          plot_bgcolor=self.config["ALL_FIGS"]["plot_bgcolor"],
-                          paper_bgcolor=self.config["ALL_FIGS"]["paper_bgcolor"],
-                          yaxis_tickformat=self.config["FIG_HOSPITALIZATIONS"]["yaxis_tickformat"])
+            fig = TraceBuilder.bar(clinical_aspects,
+                                   x=self.specs["FIG_HOSPITALIZATIONS"].x,
+                                   y=self.specs["FIG_HOSPITALIZATIONS"].y,
+                                   color_discrete_map=self.specs["FIG_HOSPITALIZATIONS"].color_discrete_map)
+
+        fig.update_layout(title=self.specs["FIG_HOSPITALIZATIONS"].title,
+                          xaxis_title=self.specs["FIG_HOSPITALIZATIONS"].xaxis_title,
+                          yaxis_title=self.specs["FIG_HOSPITALIZATIONS"].yaxis_title,
+                          template=self.specs.template,
+                          yaxis_tickformat=self.specs["FIG_HOSPITALIZATIONS"].yaxis_tickformat)
 
         if type == 'bar':
-            fig.update_layout(barmode=self.config["FIG_HOSPITALIZATIONS"]["barmode"])
+            fig.update_layout(barmode=self.specs["FIG_HOSPITALIZATIONS"].barmode)
 
         return fig
 
@@ -1214,6 +1455,7 @@ class Layout:
             ],
             value='deaths-by-week-of-death-and-age-group-stacked-bar')
 
+    @figure_of_datasets
     def _figure_deaths_by_week_of_death_and_age_group(self,
                                                       deaths_by_week_of_death_and_age_group:
                                                       DeathsByWeekOfDeathAndAgeGroupDataFrame,
@@ -1221,33 +1463,29 @@ class Layout:
 
         deaths_by_week_of_death_and_age_group = deaths_by_week_of_death_and_age_group.reset_index()
 
-        fig = px.line(deaths_by_week_of_death_and_age_group,
-                      x=self.config["FIG_DEATHS_BY_WEEK_OF_DEATH_AND_AGE_GROUP"]["x"],
-                      y=json.loads(self.config["FIG_DEATHS_BY_WEEK_OF_DEATH_AND_AGE_GROUP"]["y"]),
-                      color_discrete_map=json.loads(
-                          self.config["FIG_DEATHS_BY_WEEK_OF_DEATH_AND_AGE_GROUP"]["color_discrete_map"]))
+        fig = TraceBuilder.line(deaths_by_week_of_death_and_age_group,
+                                x=self.specs["FIG_DEATHS_BY_WEEK_OF_DEATH_AND_AGE_GROUP"].x,
+                                y=self.specs["FIG_DEATHS_BY_WEEK_OF_DEATH_AND_AGE_GROUP"].y,
+                                color_discrete_map=self.specs["FIG_DEATHS_BY_WEEK_OF_DEATH_AND_AGE_GROUP"].color_discrete_map)
 
         if type == 'bar':
-            fig = px.bar(deaths_by_week_of_death_and_age_group,
-                         x=self.config["FIG_DEATHS_BY_WEEK_OF_DEATH_AND_AGE_GROUP"]["x"],
-                         y=json.loads(self.config["FIG_DEATHS_BY_WEEK_OF_DEATH_AND_AGE_GROUP"]["y"]),
-                         color_discrete_map=json.loads(
-                             self.config["FIG_DEATHS_BY_WEEK_OF_DEATH_AND_AGE_GROUP"]["color_discrete_map"]))
-
-        fig.update_layout(title=self.config["FIG_DEATHS_BY_WEEK_OF_DEATH_AND_AGE_GROUP"]["title"],
-                          xaxis_title=self.config["FIG_DEATHS_BY_WEEK_OF_DEATH_AND_AGE_GROUP"]["xaxis_title"],
-                          yaxis_title=self.config["FIG_DEATHS_BY_WEEK_OF_DEATH_AND_AGE_GROUP"]["yaxis_title"],
-                          font_family=self.config["ALL_FIGS"]["font_family"],
-                          font_color=self.config["ALL_FIGS"]["font_color"],
-                          plot_bgcolor=self.config["ALL_FIGS"]["plot_bgcolor"],
-                          paper_bgcolor=self.config["ALL_FIGS"]["paper_bgcolor"],
-                          yaxis_tickformat=self.config["FIG_DEATHS_BY_WEEK_OF_DEATH_AND_AGE_GROUP"]["yaxis_tickformat"])
+            fig = TraceBuilder.bar(deaths_by_week_of_death_and_age_group,
+                                   x=self.specs["FIG_DEATHS_BY_WEEK_OF_DEATH_AND_AGE_GROUP"].x,
+                                   y=self.specs["FIG_DEATHS_BY_WEEK_OF_DEATH_AND_AGE_GROUP"].y,
+                                   color_discrete_map=self.specs["FIG_DEATHS_BY_WEEK_OF_DEATH_AND_AGE_GROUP"].color_discrete_map)
+
+        fig.update_layout(title=self.specs["FIG_DEATHS_BY_WEEK_OF_DEATH_AND_AGE_GROUP"].title,
+                          xaxis_title=self.specs["FIG_DEATHS_BY_WEEK_OF_DEATH_AND_AGE_GROUP"].xaxis_title,
+                          yaxis_title=self.specs["FIG_DEATHS_BY_WEEK_OF_DEATH_AND_AGE_GROUP"].yaxis_title,
+                          template=self.specs.template,
+                          yaxis_tickformat=self.specs["FIG_DEATHS_BY_WEEK_OF_DEATH_AND_AGE_GROUP"].yaxis_tickformat)
 
         if type == 'bar':
-            fig.update_layout(barmode=self.config["FIG_DEATHS_BY_WEEK_OF_DEATH_AND_AGE_GROUP"]["barmode"])
+            fig.update_layout(barmode=self.specs["FIG_DEATHS_BY_WEEK_OF_DEATH_AND_AGE_GROUP"].barmode)
 
         return fig
 
+    @figure_of_datasets
     def _figure_deaths_by_week_of_death_and_age_group_in_percent(self,
                                                                  deaths_by_week_of_death_and_age_group:
                                                                  DeathsByWeekOfDeathAndAgeGroupDataFrame,
@@ -1255,144 +1493,127 @@ class Layout:
 
         deaths_by_week_of_death_and_age_group = deaths_by_week_of_death_and_age_group.reset_index()
 
-        fig = px.line(deaths_by_week_of_death_and_age_group,
-                      x=self.config["FIG_DEATHS_BY_WEEK_OF_DEATH_AND_AGE_GROUP_IN_PERCENT"]["x"],
-                      y=json.loads(self.config["FIG_DEATHS_BY_WEEK_OF_DEATH_AND_AGE_GROUP_IN_PERCENT"]["y"]),
-                      color_discrete_map=json.loads(
-                          self.config["FIG_DEATHS_BY_WEEK_OF_DEATH_AND_AGE_GROUP_IN_PERCENT"]["color_discrete_map"]))
+        fig = TraceBuilder.line(deaths_by_week_of_death_and_age_group,
+                                x=self.specs["FIG_DEATHS_BY_WEEK_OF_DEATH_AND_AGE_GROUP_IN_PERCENT"].x,
+                                y=self.specs["FIG_DEATHS_BY_WEEK_OF_DEATH_AND_AGE_GROUP_IN_PERCENT"].y,
+                                color_discrete_map=self.specs["FIG_DEATHS_BY_WEEK_OF_DEATH_AND_AGE_GROUP_IN_PERCENT"].color_discrete_map)
 
         if type == 'bar':
-            fig = px.bar(deaths_by_week_of_death_and_age_group,
-                         x=self.config["FIG_DEATHS_BY_WEEK_OF_DEATH_AND_AGE_GROUP_IN_PERCENT"]["x"],
-                         y=json.loads(self.config["FIG_DEATHS_BY_WEEK_OF_DEATH_AND_AGE_GROUP_IN_PERCENT"]["y"]),
-                         color_discrete_map=json.loads(
-                             self.config["FIG_DEATHS_BY_WEEK_OF_DEATH_AND_AGE_GROUP_IN_PERCENT"]["color_discrete_map"]))
-
-        fig.update_layout(title=self.config["FIG_DEATHS_BY_WEEK_OF_DEATH_AND_AGE_GROUP_IN_PERCENT"]["title"],
-                          xaxis_title=self.config["FIG_DEATHS_BY_WEEK_OF_DEATH_AND_AGE_GROUP_IN_PERCENT"]["xaxis_title"],
-                          yaxis_title=self.config["FIG_DEATHS_BY_WEEK_OF_DEATH_AND_AGE_GROUP_IN_PERCENT"]["yaxis_title"],
-                          font_family=self.config["ALL_FIGS"]["font_family"],
-                          font_color=self.config["ALL_FIGS"]["font_color"],
-                          plot_bgcolor=self.config["ALL_FIGS"]["plot_bgcolor"],
-                          paper_bgcolor=self.config["ALL_FIGS"]["paper_bgcolor"],
-                          yaxis_tickformat=self.config["FIG_DEATHS_BY_WEEK_OF_DEATH_AND_AGE_GROUP_IN_PERCENT"]["yaxis_tickformat"])
+            fig = TraceBuilder.bar(deaths_by_week_of_death_and_age_group,
+                                   x=self.specs["FIG_DEATHS_BY_WEEK_OF_DEATH_AND_AGE_GROUP_IN_PERCENT"].x,
+                                   y=self.specs["FIG_DEATHS_BY_WEEK_OF_DEATH_AND_AGE_GROUP_IN_PERCENT"].y,
+                                   color_discrete_map=self.specs["FIG_DEATHS_BY_WEEK_OF_DEATH_AND_AGE_GROUP_IN_PERCENT"].color_discrete_map)
+
+        fig.update_layout(title=self.specs["FIG_DEATHS_BY_WEEK_OF_DEATH_AND_AGE_GROUP_IN_PERCENT"].title,
+                          xaxis_title=self.specs["FIG_DEATHS_BY_WEEK_OF_DEATH_AND_AGE_GROUP_IN_PERCENT"].xaxis_title,
+                          yaxis_title=self.specs["FIG_DEATHS_BY_WEEK_OF_DEATH_AND_AGE_GROUP_IN_PERCENT"].yaxis_title,
+                          template=self.specs.template,
+                          yaxis_tickformat=self.specs["FIG_DEATHS_BY_WEEK_OF_DEATH_AND_AGE_GROUP_IN_PERCENT"].yaxis_tickformat)
 
         if type == 'bar':
-            fig.update_layout(barmode=self.config["FIG_DEATHS_BY_WEEK_OF_DEATH_AND_AGE_GROUP_IN_PERCENT"]["barmode"])
+            fig.update_layout(barmode=self.specs["FIG_DEATHS_BY_WEEK_OF_DEATH_AND_AGE_GROUP_IN_PERCENT"].barmode)
 
         return fig
 
+    @figure_of_datasets
     def _figure_new_deaths_by_refdate(self,
                                       corona_cases_and_deaths: CoronaCasesAndDeathsDataFrame,
                                       nowcast_rki: NowcastRKIDataFrame) -> Figure:
 
-        y = json.loads(self.config["FIG_NEW_DEATHS_PER_REFDATE"]["y"])
+        y = list(self.specs["FIG_NEW_DEATHS_PER_REFDATE"].y)
         corona_cases_and_deaths_with_nowcast = self._concat_corona_cases_and_deaths_with_nowcast_only_rows_with_data(
             corona_cases_and_deaths, nowcast_rki, y)
 
-        fig = px.bar(corona_cases_and_deaths_with_nowcast,
-                     x=self.config["FIG_NEW_DEATHS_PER_REFDATE"]["x"],
-                     y=y,
-                     color_discrete_map=json.loads(self.config["FIG_NEW_DEATHS_PER_REFDATE"]["color_discrete_map"]))
-
-        fig.update_layout(title=self.config["FIG_NEW_DEATHS_PER_REFDATE"]["title"],
-                          barmode=self.config["FIG_NEW_DEATHS_PER_REFDATE"]["barmode"],
-                          xaxis_title=self.config["FIG_NEW_DEATHS_PER_REFDATE"]["xaxis_title"],
-                          yaxis_title=self.config["FIG_NEW_DEATHS_PER_REFDATE"]["yaxis_title"],
-                          legend=json.loads(self.config["ALL_FIGS"]["legend"]),
-                          font_family=self.config["ALL_FIGS"]["font_family"],
-                          font_color=self.config["ALL_FIGS"]["font_color"],
-                          plot_bgcolor=self.config["ALL_FIGS"]["plot_bgcolor"],
-                          paper_bgcolor=self.config["ALL_FIGS"]["paper_bgcolor"],
-                          yaxis_tickformat=self.config["FIG_NEW_DEATHS_PER_REFDATE"]["yaxis_tickformat"])
+        fig = TraceBuilder.bar(corona_cases_and_deaths_with_nowcast,
+                               x=self.specs["FIG_NEW_DEATHS_PER_REFDATE"].x,
+                               y=y,
+                               color_discrete_map=self.specs["FIG_NEW_DEATHS_PER_REFDATE"].color_discrete_map)
+
+        fig.update_layout(title=self.specs["FIG_NEW_DEATHS_PER_REFDATE"].title,
+                          barmode=self.specs["FIG_NEW_DEATHS_PER_REFDATE"].barmode,
+                          xaxis_title=self.specs["FIG_NEW_DEATHS_PER_REFDATE"].xaxis_title,
+                          yaxis_title=self.specs["FIG_NEW_DEATHS_PER_REFDATE"].yaxis_title,
+                          legend=dict(self.specs.legend),
+                          template=self.specs.template,
+                          yaxis_tickformat=self.specs["FIG_NEW_DEATHS_PER_REFDATE"].yaxis_tickformat)
 
         return fig
 
     def _concat_corona_cases_and_deaths_with_nowcast_only_rows_with_data(self, corona_cases_and_deaths, nowcast_rki, y):
-        corona_cases_and_deaths_with_nowcast = pd.concat([corona_cases_and_deaths, nowcast_rki], axis=1)
-
-        if len(self._delete_rows_without_data_of(corona_cases_and_deaths_with_nowcast, y)) > 0:
-            corona_cases_and_deaths_with_nowcast = self._delete_rows_without_data_of(
-                corona_cases_and_deaths_with_nowcast, y)
-        return corona_cases_and_deaths_with_nowcast.reset_index()
+        corona_cases_and_deaths_with_nowcast = self._cases_and_deaths_with_nowcast(corona_cases_and_deaths, nowcast_rki)
 
-    def _delete_rows_without_data_of(self, df: pd.DataFrame, column_name: str) -> pd.DataFrame:
-        if len(df.loc[:, column_name].dropna(how='all', axis=0)) > 0:
-            return df.loc[:, column_name].dropna(how='all', axis=0)
-        return df
+        rows_with_data = corona_cases_and_deaths_with_nowcast.loc[:, y].notna().any(axis=1)
+        if rows_with_data.any():
+            index_column = corona_cases_and_deaths_with_nowcast.columns[0]
+            return corona_cases_and_deaths_with_nowcast.loc[rows_with_data, [index_column] + y].reset_index(drop=True)
+        return corona_cases_and_deaths_with_nowcast
 
+    @figure_of_datasets
     def _figure_total_cases_by_refdate(self,
                                        corona_cases_and_deaths: CoronaCasesAndDeathsDataFrame,
                                        nowcast_rki: NowcastRKIDataFrame) -> Figure:
 
-        corona_cases_and_deaths_with_nowcast = pd.concat([corona_cases_and_deaths, nowcast_rki], axis=1).reset_index()
+        corona_cases_and_deaths_with_nowcast = self._cases_and_deaths_with_nowcast(corona_cases_and_deaths, nowcast_rki)
 
-        fig = px.bar(corona_cases_and_deaths_with_nowcast,
-                     x=self.config["FIG_TOTAL_CASES_PER_REFDATE"]["x"],
-                     y=json.loads(self.config["FIG_TOTAL_CASES_PER_REFDATE"]["y"]),
-                     color_discrete_map=json.loads(self.config["FIG_TOTAL_CASES_PER_REFDATE"]["color_discrete_map"]))
+        fig = TraceBuilder.bar(corona_cases_and_deaths_with_nowcast,
+                               x=self.specs["FIG_TOTAL_CASES_PER_REFDATE"].x,
+                               y=self.specs["FIG_TOTAL_CASES_PER_REFDATE"].y,
+                               color_discrete_map=self.specs["FIG_TOTAL_CASES_PER_REFDATE"].color_discrete_map)
 
-        fig.update_layout(title=self.config["FIG_TOTAL_CASES_PER_REFDATE"]["title"],
-                          barmode=self.config["FIG_TOTAL_CASES_PER_REFDATE"]["barmode"],
-                          xaxis_title=self.config["FIG_TOTAL_CASES_PER_REFDATE"]["xaxis_title"],
-                          yaxis_title=self.config["FIG_TOTAL_CASES_PER_REFDATE"]["yaxis_title"],
-                          legend=json.loads(self.config["ALL_FIGS"]["legend"]),
-                          font_family=self.config["ALL_FIGS"]["font_family"],
-                          font_color=self.config["ALL_FIGS"]["font_color"],
-                          plot_bgcolor=self.config["ALL_FIGS"]["plot_bgcolor"],
-                          paper_bgcolor=self.config["ALL_FIGS"]["paper_bgcolor"],
-                          yaxis_tickformat=self.config["FIG_TOTAL_CASES_PER_REFDATE"]["yaxis_tickformat"])
+        fig.update_layout(title=self.specs["FIG_TOTAL_CASES_PER_REFDATE"].title,
+                          barmode=self.specs["FIG_TOTAL_CASES_PER_REFDATE"].barmode,
+                          xaxis_title=self.specs["FIG_TOTAL_CASES_PER_REFDATE"].xaxis_title,
+                          yaxis_title=self.specs["FIG_TOTAL_CASES_PER_REFDATE"].yaxis_title,
+                          legend=dict(self.specs.legend),
+                          template=self.specs.template,
+                          yaxis_tickformat=self.specs["FIG_TOTAL_CASES_PER_REFDATE"].yaxis_tickformat)
 
         return fig
 
+    @figure_of_datasets
     def _figure_new_cases_by_reporting_date(self,
                                             corona_cases_and_deaths: CoronaCasesAndDeathsDataFrame,
                                             nowcast_rki: NowcastRKIDataFrame) -> Figure:
 
-        y = json.loads(self.config["FIG_NEW_CASES_BY_REPORTING_DATE"]["y"])
+        y = list(self.specs["FIG_NEW_CASES_BY_REPORTING_DATE"].y)
 
         corona_cases_and_deaths_with_nowcast = self._concat_corona_cases_and_deaths_with_nowcast_only_rows_with_data(
             corona_cases_and_deaths, nowcast_rki, y)
 
-        fig = px.bar(corona_cases_and_deaths_with_nowcast,
-                     x=self.config["FIG_NEW_CASES_BY_REPORTING_DATE"]["x"],
-                     y=y,
-                     color_discrete_map=json.loads(self.config["FIG_NEW_CASES_BY_REPORTING_DATE"]["color_discrete_map"])
-                     )
-
-        fig.update_layout(title=self.config["FIG_NEW_CASES_BY_REPORTING_DATE"]["title"],
-                          barmode=self.config["FIG_NEW_CASES_BY_REPORTING_DATE"]["barmode"],
-                          xaxis_title=self.config["FIG_NEW_CASES_BY_REPORTING_DATE"]["xaxis_title"],
-                          yaxis_title=self.config["FIG_NEW_CASES_BY_REPORTING_DATE"]["yaxis_title"],
-                          legend=json.loads(self.config["ALL_FIGS"]["legend"]),
-                          font_family=self.config["ALL_FIGS"]["font_family"],
-                          font_color=self.config["ALL_FIGS"]["font_color"],
-                          plot_bgcolor=self.config["ALL_FIGS"]["plot_bgcolor"],
-                          paper_bgcolor=self.config["ALL_FIGS"]["paper_bgcolor"],
-                          yaxis_tickformat=self.config["FIG_NEW_CASES_BY_REPORTING_DATE"]["yaxis_tickformat"])
+        fig = TraceBuilder.bar(corona_cases_and_deaths_with_nowcast,
+                               x=self.specs["FIG_NEW_CASES_BY_REPORTING_DATE"].x,
+                               y=y,
+                               color_discrete_map=self.specs["FIG_NEW_CASES_BY_REPORTING_DATE"].color_discrete_map
+                               )
+
+        fig.update_layout(title=self.specs["FIG_NEW_CASES_BY_REPORTING_DATE"].title,
+                          barmode=self.specs["FIG_NEW_CASES_BY_REPORTING_DATE"].barmode,
+                          xaxis_title=self.specs["FIG_NEW_CASES_BY_REPORTING_DATE"].xaxis_title,
+                          yaxis_title=self.specs["FIG_NEW_CASES_BY_REPORTING_DATE"].yaxis_title,
+                          legend=dict(self.specs.legend),
+                          template=self.specs.template,
+                          yaxis_tickformat=self.specs["FIG_NEW_CASES_BY_REPORTING_DATE"].yaxis_tickformat)
 
         return fig
 
+    @figure_of_datasets
     def _figure_total_deaths_by_refdate(self,
                                         corona_cases_and_deaths: CoronaCasesAndDeathsDataFrame,
                                         nowcast_rki: NowcastRKIDataFrame) -> Figure:
 
-        corona_cases_and_deaths_with_nowcast = pd.concat([corona_cases_and_deaths, nowcast_rki], axis=1).reset_index()
-
-        fig = px.bar(corona_cases_and_deaths_with_nowcast,
-                     x=self.config["FIG_TOTAL_DEATHS_PER_REFDATE"]["x"],
-                     y=json.loads(self.config["FIG_TOTAL_DEATHS_PER_REFDATE"]["y"]),
-                     color_discrete_map=json.loads(self.config["FIG_TOTAL_DEATHS_PER_REFDATE"]["color_discrete_map"]))
-
-        fig.update_layout(title=self.config["FIG_TOTAL_DEATHS_PER_REFDATE"]["title"],
-                          barmode=self.config["FIG_TOTAL_DEATHS_PER_REFDATE"]["barmode"],
-                          xaxis_title=self.config["FIG_TOTAL_DEATHS_PER_REFDATE"]["xaxis_title"],
-                          yaxis_title=self.config["FIG_TOTAL_DEATHS_PER_REFDATE"]["yaxis_title"],
-                          legend=json.loads(self.config["ALL_FIGS"]["legend"]),
-                          font_family=self.config["ALL_FIGS"]["font_family"],
-                          font_color=self.config["ALL_FIGS"]["font_color"],
-                          plot_bgcolor=self.config["ALL_FIGS"]["plot_bgcolor"],
-                          paper_bgcolor=self.config["ALL_FIGS"]["paper_bgcolor"],
-                          yaxis_tickformat=self.config["FIG_TOTAL_DEATHS_PER_REFDATE"]["yaxis_tickformat"])
+        corona_cases_and_deaths_with_nowcast = self._cases_and_deaths_with_nowcast(corona_cases_and_deaths, nowcast_rki)
+
+        fig = TraceBuilder.bar(corona_cases_and_deaths_with_nowcast,
+                               x=self.specs["FIG_TOTAL_DEATHS_PER_REFDATE"].x,
+                               y=self.specs["FIG_TOTAL_DEATHS_PER_REFDATE"].y,
+                               color_discrete_map=self.specs["FIG_TOTAL_DEATHS_PER_REFDATE"].color_discrete_map)
+
+        fig.update_layout(title=self.specs["FIG_TOTAL_DEATHS_PER_REFDATE"].title,
+                          barmode=self.specs["FIG_TOTAL_DEATHS_PER_REFDATE"].barmode,
+                          xaxis_title=self.specs["FIG_TOTAL_DEATHS_PER_REFDATE"].xaxis_title,
+                          yaxis_title=self.specs["FIG_TOTAL_DEATHS_PER_REFDATE"].yaxis_title,
+                          legend=dict(self.specs.legend),
+                          template=self.specs.template,
+                          yaxis_tickformat=self.specs["FIG_TOTAL_DEATHS_PER_REFDATE"].yaxis_tickformat)
 
         return fig
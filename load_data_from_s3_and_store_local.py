@@ -1,64 +1,84 @@
 import time
 
-from data_pandas_subclasses.date_index_classes.CoronaCasesAndDeaths import *
-from data_pandas_subclasses.date_index_classes.NowcastRKI import *
-from data_pandas_subclasses.date_index_classes.IntensiveRegister import *
-from data_pandas_subclasses.week_index_classes.NumberPCRTests import *
-from data_pandas_subclasses.week_index_classes.ClinicalAspects import *
-from data_pandas_subclasses.week_index_classes.CasesPerOutbreak import *
-from data_pandas_subclasses.AgeDistribution import *
+import hashlib
+import json
+import logging
+import os
+import re
 
+from concurrent.futures import ThreadPoolExecutor
+from dotenv import load_dotenv
+from io import BytesIO
 
-def process_corona_cases_and_deaths():
-    corona_cases_and_deaths = CoronaCasesAndDeathsDataFrame.from_csv()
-    corona_cases_and_deaths.to_csv("data/corona_cases_and_deaths.csv")
+from data_pandas_subclasses.storage.ContentEncoding import ContentEncoding
+from data_pandas_subclasses.storage.StorageBackend import LocalStorageBackend, S3StorageBackend
 
+load_dotenv()
+logging.basicConfig(level=logging.INFO)
 
-def process_nowcast():
-    nowcast = NowcastRKIDataFrame.from_csv()
-    nowcast.to_csv("data/nowcast_rki.csv")
+# ETags of the objects mirrored before, so unchanged objects are not downloaded again
+ETAGS_FILENAME = ".s3_mirror_etags.json"
 
 
-def process_intensive_register():
-    intensive_register = IntensiveRegisterDataFrame.from_csv()
-    intensive_register.to_csv("data/intensive_register_total.csv")
+def load_mirrored_etags(target: LocalStorageBackend) -> dict:
+    if not target.exists(ETAGS_FILENAME):
+        return {}
+    return json.loads(target.read(ETAGS_FILENAME))
 
 
-def process_number_pcr_tests():
-    pcr_tests = NumberPCRTestsDataFrame.from_csv()
-    pcr_tests.to_csv("data/number_of_tests_germany.csv")
+def verify_checksums(key: str, stored_data: bytes, etag: str, data: bytes):
+    # the ETag of an object uploaded in one part is the MD5 of its stored content
+    if "-" not in etag:
+        if hashlib.md5(stored_data).hexdigest() != etag.strip('"'):
+            raise ValueError(f"MD5 of {key} does not match its ETag {etag}")
 
+    # content addressed objects are named by the SHA256 of their content
+    content_hash = re.search(r"([0-9a-f]{64})(\.[^/]*)?$", key)
+    if content_hash is not None:
+        if hashlib.sha256(data).hexdigest() != content_hash.group(1):
+            raise ValueError(f"SHA256 of {key} does not match its name")
 
-def process_clinical_aspects():
-    clinical_aspects = ClinicalAspectsDataFrame.from_csv()
-    clinical_aspects.to_csv("data/clinical_aspects.csv")
 
+def mirror_object(source: S3StorageBackend, target: LocalStorageBackend, key: str) -> str:
+    stored_data, etag, content_encoding = source.read_stored_object(key)
+    data = ContentEncoding.decode_stream(BytesIO(stored_data), content_encoding)
+    verify_checksums(key, stored_data, etag, data)
+    target.write(key, data)
+    logging.info(f"{source.location(key)} mirrored to {target.location(key)}")
+    return etag
 
-def process_cases_per_outbreak():
-    cases_per_outbreak = CasesPerOutbreakDataFrame.from_csv()
-    cases_per_outbreak.to_csv("data/cases_attributed_to_an_outbreak.csv")
 
+def mirror_s3_bucket_to_local_folder(s3_bucket: str, folder_path: str, prefix: str = "", workers: int = 16):
+    source = S3StorageBackend(s3_bucket)
+    target = LocalStorageBackend(folder_path)
 
-def process_age_distribution():
-    age_distribution = AgeDistributionDataFrame.from_csv()
-    age_distribution.to_csv("data/distribution_of_inhabitants_and_cases_and_deaths.csv")
+    etags = source.list_etags(prefix)
+    mirrored_etags = load_mirrored_etags(target)
+    changed_keys = [key for key, etag in etags.items()
+                    if (mirrored_etags.get(key) != etag) or not target.exists(key)]
+    removed_keys = [key for key in mirrored_etags if key.startswith(prefix) and key not in etags]
+    logging.info(f"{len(changed_keys)} of {len(etags)} objects changed, {len(removed_keys)} objects removed")
 
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for key, etag in zip(changed_keys,
+                             executor.map(lambda key: mirror_object(source, target, key), changed_keys)):
+            mirrored_etags[key] = etag
 
-def load_dataframes_from_s3_and_store_local():
-    process_corona_cases_and_deaths()
-    process_nowcast()
-    process_intensive_register()
-    process_number_pcr_tests()
-    process_clinical_aspects()
-    process_cases_per_outbreak()
-    process_age_distribution()
+    for key in removed_keys:
+        if target.exists(key):
+            target.delete(key)
+        del mirrored_etags[key]
+
+    target.write(ETAGS_FILENAME, json.dumps(mirrored_etags, indent=2, sort_keys=True).encode('utf-8'))
 
 
 if __name__ == '__main__':
 
-    logging.info("START LOADING DATAFRAMES AND STORE LOCAL")
+    logging.info("START MIRRORING S3 BUCKET TO LOCAL FOLDER")
     start_time = time.time()
-    load_dataframes_from_s3_and_store_local()
+    mirror_s3_bucket_to_local_folder(s3_bucket=os.environ['S3_BUCKET'],
+                                     folder_path=os.environ.get('FOLDER_PATH', LocalStorageBackend.default_folder_path),
+                                     prefix=os.environ.get('MIRROR_PREFIX', ""),
+                                     workers=int(os.environ.get('TRANSFER_WORKERS', 16)))
     end_time = time.time()
-    logging.info(f"FINISHED LOADING DATAFRAMES AND STORE LOCAL IN {end_time - start_time} SECONDS")
-
+    logging.info(f"FINISHED MIRRORING S3 BUCKET TO LOCAL FOLDER IN {end_time - start_time} SECONDS")
@@ -2,6 +2,7 @@ import time
 
 import logging
 import traceback
+from typing import Optional
 
 from data_pandas_subclasses.date_index_classes.CoronaCasesAndDeaths import CoronaCasesAndDeathsDataFrame
 from data_pandas_subclasses.date_index_classes.NowcastRKI import NowcastRKIDataFrame
@@ -12,6 +13,13 @@ from data_pandas_subclasses.week_index_classes.NumberPCRTests import NumberPCRTe
 from data_pandas_subclasses.week_index_classes.ClinicalAspects import ClinicalAspectsDataFrame
 from data_pandas_subclasses.week_index_classes.MedianAndMeanAges import MedianAndMeanAgesDataFrame
 from data_pandas_subclasses.AgeDistribution import AgeDistributionDataFrame
+from data_pandas_subclasses.storage.DatasetManifest import DatasetManifest
+from data_pandas_subclasses.storage.StorageBackend import StorageBackend
+from layout.app_layout import Layout
+from layout.DailyFigures import DailyFigures
+from layout.DashboardData import DashboardData
+from layout.DatasetRegistry import DatasetRegistry
+from layout.FigureArtifacts import FigureArtifacts
 
 logging.basicConfig(level=logging.INFO)
 
@@ -78,6 +86,43 @@ def update_MedianAndMeanAgesDataFrame():
         traceback.print_exc()
 
 
+def load_dashboard_data() -> Optional[DashboardData]:
+    try:
+        return DashboardData.from_files()
+    except Exception:
+        traceback.print_exc()
+        return None
+
+
+def publish_dashboard_bundle(dashboard_data: DashboardData):
+    try:
+        dashboard_data.publish_bundle()
+    except Exception:
+        traceback.print_exc()
+
+
+def publish_daily_figures(dashboard_data: DashboardData):
+    if dashboard_data.daily_figures is None:
+        logging.info("daily figures could not be calculated, keep the published daily figures")
+        return
+    try:
+        storage = StorageBackend.from_environment()
+        DailyFigures.write(storage,
+                           dashboard_data.daily_figures,
+                           DailyFigures.source_versions(DatasetRegistry.file_versions(storage)))
+    except Exception:
+        traceback.print_exc()
+
+
+def publish_figure_artifacts(dashboard_data: DashboardData):
+    try:
+        FigureArtifacts(StorageBackend.from_environment()).write(Layout().figures(dashboard_data),
+                                                                 dashboard_data.daily_figures,
+                                                                 dashboard_data.version)
+    except Exception:
+        traceback.print_exc()
+
+
 def update_dataframes():
     update_CoronaCasesAndDeathsDataFrame()
     update_NowcastRKIDataFrame()
@@ -95,7 +140,14 @@ if __name__ == '__main__':
     logging.info("START COMPLETE UPDATE PROCESS")
     start_time = time.time()
 
-    update_dataframes()
+    with DatasetManifest.publication():
+        update_dataframes()
+
+    dashboard_data = load_dashboard_data()
+    if dashboard_data is not None:
+        publish_daily_figures(dashboard_data)
+        publish_dashboard_bundle(dashboard_data)
+        publish_figure_artifacts(dashboard_data)
 
     end_time = time.time()
     logging.info(f"FINISHED COMPLETE UPDATE PROCESS IN {end_time - start_time} SECONDS")